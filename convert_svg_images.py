@@ -1,107 +1,228 @@
 #!/usr/bin/env python3
 """
 Convert SVG images to required formats for SEO
-Requires: wand (pip install wand) or cairosvg (pip install cairosvg)
+Requires: Inkscape, cairosvg (pip install cairosvg) or wand (pip install wand)
+
+Every conversion is a job: SVG -> PNG, JPG or WebP at a given size. All the
+jobs of a run go through one converter session: a single `inkscape --shell`
+process, or a pool of cairosvg workers that render in memory and write the
+target directly (no temporary PNG). A job is skipped when its source SVG
+and target spec haven't changed since the last run (hashes kept in
+assets/images/.svg-conversions.json). A job that fails is reported and
+keeps its previous hash, so the rest of the batch still converts and the
+failed one is retried on the next run.
+
+Without arguments it converts the Open Graph image, the logo, the favicon
+and every PWA icon listed in manifest.json in one invocation.
+
+Usage:
+  python convert_svg_images.py                 # default jobs (only changed ones)
+  python convert_svg_images.py --force         # convert everything again
+  python convert_svg_images.py --job assets/images/logo.svg assets/images/logo.webp 256x256
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import hashlib
+import io
+import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+import time
+
+CONVERSIONS_FILE = 'assets/images/.svg-conversions.json'
+FORMATS = {'.png': 'png', '.jpg': 'jpg', '.jpeg': 'jpg', '.webp': 'webp'}
+ICON_RE = re.compile(r'/assets/images/icons/(icon-(?:maskable-)?(\d+)x(\d+)\.png)$')
+
+def parse_job(source, target, size):
+    """('logo.svg', 'logo.png', '600x600') -> job dict"""
+    extension = os.path.splitext(target)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"unsupported output format: {target} (use {', '.join(FORMATS)})")
+    width, height = (int(value) for value in size.lower().split('x'))
+    return {'source': source, 'target': target, 'format': FORMATS[extension],
+            'width': width, 'height': height}
 
-def convert_with_inkscape():
-    """Try to convert using Inkscape if available"""
+def default_jobs():
+    """Open Graph image, logo, favicons and every PWA icon in manifest.json"""
+    jobs = [
+        parse_job('assets/images/default-og.svg', 'assets/images/default-og.jpg', '1200x630'),
+        parse_job('assets/images/logo.svg', 'assets/images/logo.png', '600x600'),
+        parse_job('assets/favicon.svg', 'assets/images/icons/favicon-32x32.png', '32x32'),
+        parse_job('assets/favicon.svg', 'assets/images/icons/apple-touch-icon.png', '180x180'),
+    ]
     try:
-        # Convert SVG to JPG for Open Graph
-        subprocess.run([
-            'inkscape',
-            '--export-type=jpg',
-            '--export-filename=assets/images/default-og.jpg',
-            '--export-width=1200',
-            '--export-height=630',
-            'assets/images/default-og.svg'
-        ], check=True)
-
-        # Convert SVG to PNG for logo
-        subprocess.run([
-            'inkscape',
-            '--export-type=png',
-            '--export-filename=assets/images/logo.png',
-            '--export-width=600',
-            '--export-height=600',
-            'assets/images/logo.svg'
-        ], check=True)
-
-        print("✅ Images converted successfully using Inkscape!")
-        return True
-
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+        with open('manifest.json', 'r', encoding='utf-8') as f:
+            icons = json.load(f).get('icons', [])
+    except (OSError, ValueError):
+        icons = []
+    for icon in icons:
+        match = ICON_RE.search(icon.get('src', ''))
+        if match:
+            jobs.append(parse_job('assets/images/logo.svg', f"assets/images/icons/{match.group(1)}",
+                                  f"{match.group(2)}x{match.group(3)}"))
+    return jobs
+
+def job_hash(job, source_hashes):
+    """Hash of the source SVG plus the target spec"""
+    spec = f"{source_hashes[job['source']]}:{job['format']}:{job['width']}x{job['height']}"
+    return hashlib.sha256(spec.encode('utf-8')).hexdigest()[:16]
 
-def convert_with_wand():
-    """Try to convert using wand Python library"""
+def load_conversions():
     try:
-        from wand.image import Image
-        from wand.color import Color
-
-        # Convert SVG to JPG
-        with Image() as img:
-            img.format = 'svg'
-            img.read(filename='assets/images/default-og.svg')
-            img.format = 'jpeg'
-            img.resize(1200, 630)
-            img.save(filename='assets/images/default-og.jpg')
-
-        # Convert SVG to PNG
-        with Image() as img:
-            img.format = 'svg'
-            img.read(filename='assets/images/logo.svg')
-            img.format = 'png'
-            img.resize(600, 600)
-            img.save(filename='assets/images/logo.png')
-
-        print("✅ Images converted successfully using wand!")
-        return True
+        with open(CONVERSIONS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-    except ImportError:
+def save_conversions(conversions):
+    tmp_path = f"{CONVERSIONS_FILE}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(conversions, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, CONVERSIONS_FILE)
+
+def convert_with_inkscape(jobs):
+    """Convert every job in a single `inkscape --shell` session (Inkscape 1.x)"""
+    if not shutil.which('inkscape'):
         return False
 
-def convert_with_cairosvg():
-    """Try to convert using cairosvg Python library"""
+    # JPG needs an opaque background; those jobs go last so the setting
+    # doesn't leak into the transparent PNG/WebP exports of the session
+    commands = []
+    for job in sorted(jobs, key=lambda job: job['format'] == 'jpg'):
+        os.makedirs(os.path.dirname(job['target']) or '.', exist_ok=True)
+        commands += [
+            f"file-open:{job['source']}",
+            f"export-filename:{job['target']}",
+            f"export-width:{job['width']}",
+            f"export-height:{job['height']}",
+        ]
+        if job['format'] == 'jpg':
+            commands += ["export-background:white", "export-background-opacity:1"]
+        commands += ["export-do", "file-close"]
+    commands.append("quit")
+
     try:
-        import cairosvg
-
-        # Convert SVG to JPG (via PNG)
-        cairosvg.svg2png(
-            url='assets/images/default-og.svg',
-            write_to='temp_default_og.png',
-            output_width=1200,
-            output_height=630
-        )
-
-        # Convert PNG to JPG
-        from PIL import Image
-        with Image.open('temp_default_og.png') as img:
-            rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-            rgb_img.paste(img, mask=img.split()[3] if img.mode == 'RGBA' else None)
-            rgb_img.save('assets/images/default-og.jpg', 'JPEG', quality=90)
-
-        # Convert SVG to PNG for logo
-        cairosvg.svg2png(
-            url='assets/images/logo.svg',
-            write_to='assets/images/logo.png',
-            output_width=600,
-            output_height=600
-        )
-
-        # Clean up temp file
-        os.remove('temp_default_og.png')
-
-        print("✅ Images converted successfully using cairosvg!")
-        return True
+        subprocess.run(['inkscape', '--shell'], input='\n'.join(commands) + '\n',
+                       capture_output=True, text=True, check=True, timeout=60 + 5 * len(jobs))
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+    print(f"✅ {len(jobs)} image(s) converted in one Inkscape session!")
+    return True
+
+def render_with_cairosvg(job, svg_bytes):
+    """Worker: rasterize one job in memory and write the target file"""
+    import cairosvg
+    from PIL import Image
+
+    png_bytes = cairosvg.svg2png(bytestring=svg_bytes, output_width=job['width'],
+                                 output_height=job['height'])
+    # Written to a temporary file so a failed job never leaves a half-written target
+    tmp_path = f"{job['target']}.tmp"
+    if job['format'] == 'png':
+        with open(tmp_path, 'wb') as f:
+            f.write(png_bytes)
+    else:
+        with Image.open(io.BytesIO(png_bytes)) as img:
+            if job['format'] == 'jpg':
+                img = img.convert('RGBA')
+                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+                rgb_img.paste(img, mask=img.split()[3])
+                rgb_img.save(tmp_path, 'JPEG', quality=90)
+            else:
+                img.save(tmp_path, 'WEBP', quality=90)
+    os.replace(tmp_path, job['target'])
+    return job['target']
+
+def convert_with_cairosvg(jobs, sources, failed):
+    """Convert the jobs with a pool of cairosvg workers; failed targets are added to `failed`"""
+    try:
+        import cairosvg  # noqa: F401
+    except (ImportError, OSError):
+        # OSError: cairosvg installed but the cairo library is missing
+        return False
 
+    for job in jobs:
+        os.makedirs(os.path.dirname(job['target']) or '.', exist_ok=True)
+    with ProcessPoolExecutor() as executor:
+        futures = {executor.submit(render_with_cairosvg, job, sources[job['source']]): job
+                   for job in jobs}
+        for future in futures:
+            job = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"⚠️  {job['source']} -> {job['target']} failed: {e}")
+                failed.add(job['target'])
+
+    print(f"✅ {len(jobs) - len(failed)} image(s) converted successfully using cairosvg!")
+    return True
+
+def convert_with_wand(jobs, failed):
+    """Try to convert using wand Python library; failed targets are added to `failed`"""
+    try:
+        from wand.image import Image
     except ImportError:
         return False
 
+    for job in jobs:
+        os.makedirs(os.path.dirname(job['target']) or '.', exist_ok=True)
+        try:
+            with Image() as img:
+                img.format = 'svg'
+                img.read(filename=job['source'])
+                img.format = 'jpeg' if job['format'] == 'jpg' else job['format']
+                img.resize(job['width'], job['height'])
+                img.save(filename=job['target'])
+        except Exception as e:
+            print(f"⚠️  {job['source']} -> {job['target']} failed: {e}")
+            failed.add(job['target'])
+
+    print(f"✅ {len(jobs) - len(failed)} image(s) converted successfully using wand!")
+    return True
+
+def convert_batch(jobs, force=False):
+    """Convert the jobs whose source or spec changed; returns (converted, skipped, failed) or None"""
+    sources = {}
+    for job in jobs:
+        if job['source'] not in sources:
+            with open(job['source'], 'rb') as f:
+                sources[job['source']] = f.read()
+    source_hashes = {path: hashlib.sha256(data).hexdigest() for path, data in sources.items()}
+
+    conversions = load_conversions()
+    pending = [job for job in jobs
+               if force or conversions.get(job['target']) != job_hash(job, source_hashes)
+               or not os.path.exists(job['target'])]
+    skipped = len(jobs) - len(pending)
+    if skipped:
+        print(f"⏭️  {skipped} image(s) unchanged")
+    if not pending:
+        return 0, skipped, 0
+
+    started = time.time()
+    failed = set()
+    if not (convert_with_inkscape(pending) or convert_with_cairosvg(pending, sources, failed)
+            or convert_with_wand(pending, failed)):
+        return None
+
+    # Only targets written by this run count as converted; a failed one keeps
+    # its old hash (if any) so the next run tries it again
+    for job in pending:
+        if job['target'] in failed:
+            continue
+        if os.path.exists(job['target']) and os.path.getmtime(job['target']) >= started - 1:
+            conversions[job['target']] = job_hash(job, source_hashes)
+        else:
+            print(f"⚠️  {job['target']} was not written")
+            failed.add(job['target'])
+    save_conversions(conversions)
+    return len(pending) - len(failed), skipped, len(failed)
+
 def create_placeholders():
     """Create placeholder images when conversion tools aren't available"""
     print("⚠️  Creating placeholder files...")
@@ -123,34 +244,42 @@ and assets/images/logo.svg to logo.png (600x600) using:
     print("📝 Placeholder files created with conversion instructions")
 
 def main():
+    parser = argparse.ArgumentParser(description="Convert SVG images to SEO and PWA formats")
+    parser.add_argument('--job', nargs=3, action='append', metavar=('SVG', 'OUTPUT', 'WxH'),
+                        help="Conversion job (repeatable); output format from its extension")
+    parser.add_argument('--force', action='store_true', help="Convert even if nothing changed")
+    args = parser.parse_args()
+
     print("🔄 Converting SVG images to SEO formats...")
 
-    # Check if SVG files exist
-    if not os.path.exists('assets/images/default-og.svg'):
-        print("❌ default-og.svg not found")
+    try:
+        jobs = [parse_job(*job) for job in args.job] if args.job else default_jobs()
+    except ValueError as e:
+        print(f"❌ {e}")
         return False
 
-    if not os.path.exists('assets/images/logo.svg'):
-        print("❌ logo.svg not found")
-        return False
+    # Check if SVG files exist
+    for source in sorted({job['source'] for job in jobs}):
+        if not os.path.exists(source):
+            print(f"❌ {source} not found")
+            return False
 
-    # Try different conversion methods
-    if convert_with_inkscape():
-        return True
-    elif convert_with_wand():
-        return True
-    elif convert_with_cairosvg():
-        return True
-    else:
-        print("❌ No conversion tools available")
-        print("\n💡 Install one of the following:")
-        print("   - Inkscape: sudo apt install inkscape")
-        print("   - Wand: pip install wand")
-        print("   - CairoSVG: pip install cairosvg")
-        print("   - Or use an online SVG converter")
+    result = convert_batch(jobs, args.force)
+    if result is not None:
+        converted, skipped, failed = result
+        print(f"🎉 {converted} converted, {skipped} unchanged" + (f", {failed} failed" if failed else ""))
+        return not failed
 
+    print("❌ No conversion tools available")
+    print("\n💡 Install one of the following:")
+    print("   - Inkscape: sudo apt install inkscape")
+    print("   - Wand: pip install wand")
+    print("   - CairoSVG: pip install cairosvg")
+    print("   - Or use an online SVG converter")
+
+    if not args.job:
         create_placeholders()
-        return False
+    return False
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(0 if main() else 1)
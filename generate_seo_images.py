@@ -2,13 +2,90 @@
 """
 Script to generate SEO images for NachoWeb3 blog
 Creates default-og.jpg and logo.png with Matrix purple theme
+
+With --posts it also renders a 1200x630 Open Graph card for every post
+(title, category and tags from the post index) into assets/images/og/ and
+writes _data/og_cards.json, which head.html uses as og:image. Cards whose
+title, category and tags haven't changed are skipped; the rest are rendered
+in parallel on every core.
+
+Usage:
+  python generate_seo_images.py                  # default-og.jpg and logo.png
+  python generate_seo_images.py --posts          # per-post cards (only new/changed)
+  python generate_seo_images.py --posts --force  # rebuild every card
+  python generate_seo_images.py --bench          # old vs NumPy backgrounds
+
+Backgrounds and the logo glow are built with NumPy in one array operation
+and cached per (size, palette), so rendering thousands of cards reuses the
+same buffer instead of drawing 630 lines per image. Fonts are loaded once
+per (path, size) and text is wrapped and centered from measured (and
+memoized) word widths instead of hard-coded offsets.
 """
 
 from PIL import Image, ImageDraw, ImageFont
-import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import argparse
+import hashlib
+import json
+import os
+import timeit
+
+import numpy as np
+
+CARDS_DIR = "assets/images/og"
+CARDS_MANIFEST = "_data/og_cards.json"
+# Bump when the card design changes so every card is rendered again
+CARD_STYLE_VERSION = 2
+FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+CATEGORY_LABELS = {
+    'ia': "Inteligencia Artificial",
+    'blockchain': "Blockchain",
+    'tutoriales': "Tutoriales"
+}
+
+@lru_cache(maxsize=32)
+def _gradient_layer(width, height, color1, color2):
+    """Vertical gradient built as one array; cached per (size, palette)
+
+    Every row is a single color, so the array is one pixel wide and Pillow
+    stretches it (nearest neighbour, exact) to the full width.
+    """
+    ratio = (np.arange(height) / height)[:, None]
+    rows = (np.array(color1) * (1 - ratio) + np.array(color2) * ratio).astype(np.uint8)
+    column = Image.fromarray(np.ascontiguousarray(rows[:, None, :]), 'RGB')
+    return column.resize((width, height), Image.NEAREST)
 
 def create_gradient_background(width, height, color1, color2):
-    """Create a gradient background"""
+    """Create a gradient background (a copy of the cached layer, safe to draw on)"""
+    return _gradient_layer(width, height, tuple(color1), tuple(color2)).copy()
+
+@lru_cache(maxsize=8)
+def _radial_glow_layer(size, inner_radius, outer_radius, color, steps):
+    """Transparent layer with a glow ring that fades out from inner_radius to outer_radius.
+
+    Same banding as drawing `steps` nested ellipses from the outside in, but
+    computed for every pixel at once from its distance to the center.
+    """
+    coords = np.arange(size, dtype=np.float32) - size // 2
+    distance = np.sqrt(coords[None, :] ** 2 + coords[:, None] ** 2)
+    step = (outer_radius - inner_radius) / steps
+    index = np.clip(np.ceil((distance - inner_radius) / step), 1, steps)
+    alpha = (255 * (1 - index / steps)).astype(np.uint8)
+    alpha[distance > outer_radius] = 0
+
+    # RGBA packed as uint32 so filling the color is one 4-byte copy per pixel
+    fill = np.array([*color, 0], np.uint8).view(np.uint32)
+    pixels = np.broadcast_to(fill, (size, size)).copy().view(np.uint8).reshape(size, size, 4)
+    pixels[..., 3] = alpha
+    return Image.fromarray(pixels, 'RGBA')
+
+def create_radial_glow(size, inner_radius, outer_radius, color, steps=20):
+    return _radial_glow_layer(size, inner_radius, outer_radius, tuple(color), steps).copy()
+
+def create_gradient_background_lines(width, height, color1, color2):
+    """Original line-by-line gradient, kept as the --bench baseline"""
     image = Image.new('RGB', (width, height))
     draw = ImageDraw.Draw(image)
 
@@ -21,6 +98,60 @@ def create_gradient_background(width, height, color1, color2):
 
     return image
 
+@lru_cache(maxsize=None)
+def get_font(path, size):
+    """Load a font once per process (fallback: Pillow's default font at that size)"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+@lru_cache(maxsize=16384)
+def text_width(path, size, text):
+    """Advance width of a word or line, memoized: titles share most of their words"""
+    return get_font(path, size).getlength(text)
+
+def wrap_text(text, path, size, max_width):
+    """Greedy word wrap by measured width; a word wider than max_width gets its own line"""
+    space = text_width(path, size, " ")
+    lines, current, current_width = [], [], 0
+    for word in text.split():
+        word_width = text_width(path, size, word)
+        if current and current_width + space + word_width > max_width:
+            lines.append(" ".join(current))
+            current, current_width = [], 0
+        current_width += (space if current else 0) + word_width
+        current.append(word)
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+def fit_text(text, path, sizes, max_width, max_lines):
+    """Largest size (of `sizes`, biggest first) whose wrap fits in max_lines.
+
+    Returns (size, lines). If not even the smallest size fits, its lines are
+    cut to max_lines and the last one ends with an ellipsis.
+    """
+    for size in sizes:
+        lines = wrap_text(text, path, size, max_width)
+        if len(lines) <= max_lines:
+            return size, lines
+
+    lines = lines[:max_lines]
+    last = lines[-1]
+    while last and text_width(path, size, last + "…") > max_width:
+        last = last.rsplit(" ", 1)[0] if " " in last else last[:-1]
+    lines[-1] = last + "…"
+    return size, lines
+
+def draw_centered_lines(draw, lines, path, size, center_x, top, fill, line_spacing=1.2):
+    """Draw lines centered on center_x from top; returns the y below the last line"""
+    font = get_font(path, size)
+    line_height = int(size * line_spacing)
+    for index, line in enumerate(lines):
+        draw.text((center_x, top + index * line_height), line, fill=fill, font=font, anchor="ma")
+    return top + len(lines) * line_height
+
 def create_og_image():
     """Create Open Graph default image (1200x630)"""
     width, height = 1200, 630
@@ -32,16 +163,8 @@ def create_og_image():
     image = create_gradient_background(width, height, color1, color2)
     draw = ImageDraw.Draw(image)
 
-    try:
-        # Try to use a nice font
-        font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60)
-        font_medium = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 40)
-        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 30)
-    except:
-        # Fallback to default font
-        font_large = ImageFont.load_default()
-        font_medium = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    font_large = get_font(FONT_BOLD, 60)
+    font_small = get_font(FONT_REGULAR, 30)
 
     # Add logo placeholder (circle with "N")
     logo_size = 120
@@ -51,34 +174,139 @@ def create_og_image():
                  fill=(255, 255, 255), outline=(200, 200, 200), width=3)
 
     # Add "N" in the circle
-    draw.text((logo_x - 25, logo_y - 45), "N", fill=color1, font=font_large)
+    draw.text((logo_x, logo_y), "N", fill=color1, font=font_large, anchor="mm")
 
     # Add main title
     title = "NachoWeb3"
-    draw.text((width//2 - 150, logo_y + 80), title, fill=(255, 255, 255), font=font_large)
+    draw.text((width // 2, logo_y + 80), title, fill=(255, 255, 255), font=font_large, anchor="ma")
 
     # Add subtitle
     subtitle = "Noticias de IA, Blockchain y las mejores guías"
-    draw.text((width//2 - 280, logo_y + 160), subtitle, fill=(255, 255, 255), font=font_medium)
+    draw_centered_lines(draw, [subtitle], FONT_REGULAR, 40, width // 2, logo_y + 160, (255, 255, 255))
 
     # Add categories
     categories = ["🤖 Inteligencia Artificial", "⛓️ Blockchain", "📚 Tutoriales"]
-    y_offset = logo_y + 220
-    for category in categories:
-        draw.text((width//2 - 200, y_offset), category, fill=(220, 220, 255), font=font_small)
-        y_offset += 40
+    draw_centered_lines(draw, categories, FONT_REGULAR, 30, width // 2, logo_y + 220, (220, 220, 255),
+                        line_spacing=40 / 30)
 
     # Add URL at bottom
     url = "nachoweb3.github.io"
-    draw.text((width//2 - 100, height - 60), url, fill=(255, 255, 255), font=font_small)
+    draw.text((width // 2, height - 60), url, fill=(255, 255, 255), font=font_small, anchor="ma")
+
+    return image
+
+def card_hash(title, category, tags):
+    """Hash of everything drawn on a post card"""
+    payload = json.dumps([CARD_STYLE_VERSION, title, category, tags], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def create_post_og_image(title, category, tags):
+    """Create the Open Graph card of one post (1200x630), in the create_og_image style"""
+    width, height = 1200, 630
+
+    color1 = (75, 0, 130)     # Purple
+    color2 = (138, 43, 226)   # Medium purple
+
+    image = create_gradient_background(width, height, color1, color2)
+    draw = ImageDraw.Draw(image)
+
+    font_logo = get_font(FONT_BOLD, 44)
+    font_medium = get_font(FONT_REGULAR, 34)
+    font_small = get_font(FONT_REGULAR, 28)
+
+    # Small logo and category in the top-left corner
+    logo_size = 80
+    logo_x, logo_y = 60 + logo_size // 2, 60 + logo_size // 2
+    draw.ellipse([logo_x - logo_size//2, logo_y - logo_size//2,
+                  logo_x + logo_size//2, logo_y + logo_size//2],
+                 fill=(255, 255, 255), outline=(200, 200, 200), width=3)
+    draw.text((logo_x, logo_y), "N", fill=color1, font=font_logo, anchor="mm")
+    draw.text((logo_x + logo_size, logo_y), CATEGORY_LABELS.get(category, category.capitalize()),
+              fill=(220, 220, 255), font=font_medium, anchor="lm")
+
+    # Post title: the largest size that fits in 4 lines, centered in the space left
+    size, lines = fit_text(title, FONT_BOLD, (64, 56, 48, 42), width - 2 * 60, 4)
+    block_height = int(size * 1.2) * len(lines)
+    top = logo_y + logo_size // 2 + (height - 100 - logo_y - logo_size // 2 - block_height) // 2
+    draw_centered_lines(draw, lines, FONT_BOLD, size, width // 2, top, (255, 255, 255))
+
+    # Tags and URL at the bottom, as many tags as fit next to the URL
+    url = "nachoweb3.github.io"
+    room = width - 2 * 60 - text_width(FONT_REGULAR, 28, url) - 40
+    tag_line = ""
+    for tag in tags:
+        candidate = f"{tag_line}  #{tag}" if tag_line else f"#{tag}"
+        if text_width(FONT_REGULAR, 28, candidate) > room:
+            break
+        tag_line = candidate
+    draw.text((60, height - 60), tag_line, fill=(220, 220, 255), font=font_small, anchor="ls")
+    draw.text((width - 60, height - 60), url, fill=(255, 255, 255), font=font_small, anchor="rs")
 
     return image
 
+def render_post_card(job):
+    """Worker: render one card and return (post, card path)"""
+    post, title, category, tags, path = job
+    image = create_post_og_image(title, category, tags)
+    tmp_path = f"{path}.tmp"
+    image.save(tmp_path, "JPEG", quality=85, optimize=True)
+    os.replace(tmp_path, path)
+    return post, path
+
+def load_card_manifest():
+    try:
+        with open(CARDS_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_card_manifest(manifest):
+    os.makedirs(os.path.dirname(CARDS_MANIFEST), exist_ok=True)
+    tmp_path = f"{CARDS_MANIFEST}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, CARDS_MANIFEST)
+
+def render_post_cards(force=False, workers=None):
+    """Render the cards of new or changed posts; returns how many were rendered"""
+    from scripts.postgen import post_index
+
+    manifest = load_card_manifest()
+    jobs = []
+    current = {}
+    for post in post_index.all_posts():
+        key = f"_posts/{post['path']}"
+        title = post['title'] or post['slug'].replace('-', ' ')
+        category = post['categories'][0] if post['categories'] else 'blog'
+        digest = card_hash(title, category, post['tags'])
+        path = f"{CARDS_DIR}/{post['path'].rsplit('.', 1)[0]}.jpg"
+        current[key] = {'card': f"/{path}", 'hash': digest}
+
+        known = manifest.get(key)
+        if force or not known or known['hash'] != digest or not os.path.exists(path):
+            jobs.append((key, title, category, post['tags'], path))
+
+    # Cards of deleted posts
+    for key, known in manifest.items():
+        if key not in current and os.path.exists(known['card'].lstrip('/')):
+            os.remove(known['card'].lstrip('/'))
+
+    print(f"🖼️  {len(current)} posts, {len(jobs)} card(s) to render")
+    if jobs:
+        os.makedirs(CARDS_DIR, exist_ok=True)
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for done, _ in enumerate(executor.map(render_post_card, jobs, chunksize=chunksize), 1):
+                if done % 100 == 0 or done == len(jobs):
+                    print(f"   {done}/{len(jobs)}")
+
+    save_card_manifest(current)
+    return len(jobs)
+
 def create_logo():
     """Create logo image (600x600)"""
     size = 600
-    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))  # Transparent background
-    draw = ImageDraw.Draw(image)
 
     # Matrix purple colors
     purple = (75, 0, 130)
@@ -88,36 +316,72 @@ def create_logo():
     circle_size = 500
     circle_x, circle_y = size // 2, size // 2
 
-    # Draw gradient circle effect
-    for i in range(20, 0, -1):
-        radius = circle_size // 2 + i * 5
-        alpha = int(255 * (1 - i / 20))
-        color = (*light_purple, alpha)
-        draw.ellipse([circle_x - radius, circle_y - radius,
-                      circle_x + radius, circle_y + radius],
-                     fill=color)
+    # Gradient circle effect on a transparent background
+    image = create_radial_glow(size, circle_size // 2, circle_size // 2 + 100, light_purple)
+    draw = ImageDraw.Draw(image)
 
     # Main white circle
     draw.ellipse([circle_x - circle_size//2, circle_y - circle_size//2,
                   circle_x + circle_size//2, circle_y + circle_size//2],
                  fill=(255, 255, 255), outline=purple, width=8)
 
-    try:
-        font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 120)
-        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 40)
-    except:
-        font_large = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    font_large = get_font(FONT_BOLD, 120)
+    font_small = get_font(FONT_REGULAR, 40)
 
     # Add "N" letter
-    draw.text((circle_x - 45, circle_y - 50), "N", fill=purple, font=font_large)
+    draw.text((circle_x, circle_y), "N", fill=purple, font=font_large, anchor="mm")
 
     # Add "WEB3" below
-    draw.text((circle_x - 80, circle_y + 80), "WEB3", fill=light_purple, font=font_small)
+    draw.text((circle_x, circle_y + 80), "WEB3", fill=light_purple, font=font_small, anchor="ma")
+
+    return image
 
+def create_logo_glow_ellipses(size=600, circle_size=500, color=(138, 43, 226)):
+    """Original 20-ellipse glow, kept as the --bench baseline"""
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    center = size // 2
+    for i in range(20, 0, -1):
+        radius = circle_size // 2 + i * 5
+        alpha = int(255 * (1 - i / 20))
+        draw.ellipse([center - radius, center - radius, center + radius, center + radius],
+                     fill=(*color, alpha))
     return image
 
+def run_benchmark(number=200):
+    """Microbenchmark: ms per image of the old drawing code vs the NumPy layers"""
+    purple, light_purple = (75, 0, 130), (138, 43, 226)
+    cases = [
+        ("gradient 1200x630, draw.line", lambda: create_gradient_background_lines(1200, 630, purple, light_purple)),
+        # __wrapped__ skips lru_cache to time the array work itself
+        ("gradient 1200x630, numpy", lambda: _gradient_layer.__wrapped__(1200, 630, purple, light_purple)),
+        ("gradient 1200x630, numpy + cache", lambda: create_gradient_background(1200, 630, purple, light_purple)),
+        ("glow 600x600, 20 ellipses", lambda: create_logo_glow_ellipses()),
+        ("glow 600x600, numpy", lambda: _radial_glow_layer.__wrapped__(600, 250, 350, light_purple, 20)),
+        ("glow 600x600, numpy + cache", lambda: create_radial_glow(600, 250, 350, light_purple)),
+    ]
+    print(f"⏱️  {number} runs per case")
+    for name, call in cases:
+        seconds = timeit.timeit(call, number=number)
+        print(f"   {name:<36} {seconds / number * 1000:8.2f} ms")
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate SEO images for NachoWeb3 blog")
+    parser.add_argument('--posts', action='store_true', help="Render the Open Graph card of every post")
+    parser.add_argument('--force', action='store_true', help="Render every card even if unchanged")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: all cores)")
+    parser.add_argument('--bench', action='store_true', help="Time the old and NumPy background code")
+    args = parser.parse_args()
+
+    if args.bench:
+        run_benchmark()
+        return
+
+    if args.posts:
+        rendered = render_post_cards(args.force, args.workers)
+        print(f"✅ {rendered} card(s) rendered, manifest in {CARDS_MANIFEST}")
+        return
+
     print("🎨 Generating SEO images for NachoWeb3 blog...")
 
     try:
@@ -138,7 +402,7 @@ def main():
 
     except Exception as e:
         print(f"❌ Error generating images: {e}")
-        print("💡 Make sure you have Pillow installed: pip install Pillow")
+        print("💡 Make sure you have Pillow installed: pip install Pillow numpy")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
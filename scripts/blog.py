@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Front end único de los generadores de posts del blog.
+
+Uso:
+  python scripts/blog.py generate --topic "GPT-4 vs Claude" --category ia
+  python scripts/blog.py super --topic "Qué es un rollup" --category blockchain
+  python scripts/blog.py --help
+"""
+
+from postgen.cli import main
+
+if __name__ == '__main__':
+    exit(main())
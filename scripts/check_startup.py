@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque en frío del front end de generación (blog.py).
+
+Ejecuta varias veces cada escenario con `python -X importtime`, suma el
+tiempo propio de todos los imports y se queda con la mejor ejecución. Falla
+(código de salida 1) si algún escenario supera el presupuesto o si importa
+un SDK pesado que solo debería cargarse en la ruta que lo usa.
+
+Uso:
+  python scripts/check_startup.py
+  python scripts/check_startup.py --budget-ms 100 --runs 10
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+BLOG_CLI = SCRIPTS_DIR / 'blog.py'
+
+# Escenarios que no deberían pagar más que el propio front end
+SCENARIOS = [
+    ['--help'],
+    ['generate', '--help'],
+    ['super'],
+    ['simple'],
+    ['gratis'],
+    ['auto']
+]
+
+# Módulos que nunca deberían cargarse solo para mostrar ayuda o uso
+HEAVY_MODULES = ('groq', 'httpx', 'requests', 'dotenv', 'PIL', 'numpy')
+
+def measure(args):
+    """Ejecuta blog.py con -X importtime y devuelve (ms_totales, módulos_importados)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(BLOG_CLI)] + args,
+        capture_output=True,
+        text=True
+    )
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        total_us += int(parts[0])
+        modules.add(parts[2].strip())
+
+    return total_us / 1000, modules
+
+def main():
+    parser = argparse.ArgumentParser(description='Comprueba el tiempo de arranque de blog.py')
+    parser.add_argument('--budget-ms', type=float, default=200,
+                        help='Tiempo máximo de imports por escenario en ms (por defecto: 200)')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='Ejecuciones por escenario; se usa la mejor (por defecto: 5)')
+    args = parser.parse_args()
+
+    print(f"⏱️  Arranque de blog.py (presupuesto: {args.budget_ms:.0f} ms, mejor de {args.runs})\n")
+
+    failures = []
+    for scenario in SCENARIOS:
+        best = None
+        heavy = set()
+        for _ in range(args.runs):
+            elapsed, modules = measure(scenario)
+            best = elapsed if best is None else min(best, elapsed)
+            heavy |= {m for m in modules if m.split('.')[0] in HEAVY_MODULES}
+
+        label = ' '.join(scenario)
+        status = '✅' if best <= args.budget_ms and not heavy else '❌'
+        print(f"{status} blog.py {label:<18} {best:7.1f} ms")
+
+        if best > args.budget_ms:
+            failures.append(f"'{label}' tarda {best:.1f} ms (> {args.budget_ms:.0f} ms)")
+        if heavy:
+            failures.append(f"'{label}' importa módulos pesados: {', '.join(sorted(heavy))}")
+
+    if failures:
+        print("\n❌ Regresión en el arranque:")
+        for failure in failures:
+            print(f"   - {failure}")
+        return 1
+
+    print("\n🎉 Arranque dentro del presupuesto")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
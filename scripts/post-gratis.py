@@ -1,330 +1,9 @@
 #!/usr/bin/env python3
-"""
-Script 100% GRATIS para crear posts de blog.
-- NO requiere API keys
-- Usa IA gratuita (Hugging Face)
-- Genera imágenes automáticamente (gratis)
-- Sube todo a GitHub
-"""
+"""Compatibilidad: equivale a `python scripts/blog.py gratis ...`."""
 
-import os
-import json
-import urllib.request
-import urllib.parse
-from datetime import datetime
-import subprocess
 import sys
-import re
 
-def call_huggingface_api(prompt):
-    """Usa Hugging Face Inference API (gratis)."""
-    # Usamos un modelo gratuito de Hugging Face
-    API_URL = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.1"
-
-    data = {
-        "inputs": f"<s>[INST] {prompt} [/INST]",
-        "parameters": {
-            "max_new_tokens": 2000,
-            "temperature": 0.7,
-            "do_sample": True
-        }
-    }
-
-    try:
-        req = urllib.request.Request(
-            API_URL,
-            data=json.dumps(data).encode('utf-8'),
-            headers={
-                'Content-Type': 'application/json'
-            }
-        )
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            if isinstance(result, list) and len(result) > 0:
-                return result[0]['generated_text'].strip()
-            else:
-                return None
-    except Exception as e:
-        print(f"Error con Hugging Face API: {e}")
-        return None
-
-def generate_content_locally(topic, category):
-    """Genera contenido localmente sin APIs."""
-
-    # Plantillas base por categoría
-    content_templates = {
-        'ia': {
-            'intro': f"La inteligencia artificial ha revolucionado el mundo tecnológico, y {topic} representa uno de los avances más significativos en este campo.",
-            'desarrollo': f"## ¿Qué es {topic}?\n\n{topic} es una tecnología emergente que está transformando la forma en que interactuamos con los sistemas inteligentes.\n\n## Aplicaciones Prácticas\n\nLas aplicaciones de {topic} son numerosas y variadas:\n\n### 1. Automatización de Procesos\n\nPermite optimizar flujos de trabajo y reducir tiempos de respuesta.\n\n### 2. Análisis Predictivo\n\nCapacidad de anticipar tendencias y patrones basados en datos históricos.\n\n### 3. Mejora de Experiencias\n\nPersonalización de servicios y adaptación a necesidades específicas.\n\n## Impacto en la Industria\n\nEl impacto de {topic} se refleja en múltiples sectores:\n\n- **Salud:** Mejora en diagnósticos y tratamientos\n- **Finanzas:** Optimización de riesgos y decisiones\n- **Educación:** Personalización del aprendizaje\n- **Retail:** Experiencias de compra mejoradas",
-            'conclusion': "El futuro de {topic} es prometedor, con un potencial ilimitado para transformar nuestra sociedad."
-        },
-        'blockchain': {
-            'intro': f"La tecnología blockchain continúa evolucionando, y {topic} emerge como una de las innovaciones más relevantes en el ecosistema cripto.",
-            'desarrollo': f"## ¿Qué es {topic}?\n\n{topic} es una solución blockchain que ofrece características únicas para el mundo digital descentralizado.\n\n## Características Principales\n\n### Seguridad y Transparencia\n\nUtiliza criptografía avanzada para garantizar la integridad de las transacciones.\n\n### Descentralización\n\nElimina intermediarios y permite transacciones peer-to-peer directas.\n\n### Inmutabilidad\n\nUna vez registrados, los datos no pueden ser modificados, garantizando confianza.\n\n## Casos de Uso\n\nLas aplicaciones prácticas de {topic} incluyen:\n\n- **Finanzas Descentralizadas (DeFi)**\n- **Tokens No Fungibles (NFTs)**\n- **Gestión de Cadena de Suministro**\n- **Identidad Digital**\n\n## Ventajas Competitivas\n\nComparado con soluciones tradicionales, {topic} ofrece:\n- Menores costos operativos\n- Mayor velocidad de transacción\n- Accesibilidad global\n- Resistencia a la censura",
-            'conclusion': "{topic} representa el futuro de las transacciones digitales y está posicionado para revolucionar múltiples industrias."
-        },
-        'tutoriales': {
-            'intro': f"En este tutorial completo, exploraremos paso a paso cómo implementar {topic}, una habilidad fundamental en el desarrollo tecnológico actual.",
-            'desarrollo': f"## ¿Qué aprenderás?\n\nAl finalizar este tutorial, podrás:\n- Comprender los conceptos básicos de {topic}\n- Implementar soluciones prácticas\n- Resolver problemas comunes\n- Aplicar mejores prácticas\n\n## Requisitos Previos\n\nAntes de comenzar, asegúrate de tener:\n- Conocimientos básicos de programación\n- Un entorno de desarrollo configurado\n- Motivación para aprender\n\n## Paso 1: Conceptos Fundamentales\n\n{topic} se basa en principios que debemos entender:\n\n### Nociones Básicas\n\nLos conceptos clave incluyen:\n- Estructuras de datos\n- Algoritmos eficientes\n- Patrones de diseño\n- Buenas prácticas\n\n## Paso 2: Implementación Práctica\n\n### Configuración Inicial\n\nComencemos con la configuración básica:\n\n1. Prepara tu entorno de desarrollo\n2. Instala las herramientas necesarias\n3. Configura tu espacio de trabajo\n\n### Desarrollo\n\nAhora implementemos {topic} paso a paso:\n\n#### Primera Parte: Fundamentos\n\nEstablezcamos las bases:\n- Definir objetivos claros\n- Planificar la arquitectura\n- Seleccionar las herramientas adecuadas\n\n#### Segunda Parte: Desarrollo\n\nImplementemos la solución:\n- Codificar la funcionalidad principal\n- Agregar validaciones\n- Optimizar el rendimiento\n\n## Paso 3: Buenas Prácticas\n\nPara garantizar calidad:\n\n### Testing y Validación\n\n- Realizar pruebas unitarias\n- Verificar el funcionamiento\n- Documentar el código\n\n### Optimización\n\n- Mejorar el rendimiento\n- Reducir la complejidad\n- Facilitar el mantenimiento",
-            'conclusion': "Has aprendido los fundamentos de {topic} y estás listo para aplicar estos conocimientos en proyectos reales."
-        }
-    }
-
-    template = content_templates.get(category, content_templates['ia'])
-
-    # Reemplazar marcadores
-    content = template['desarrollo'].replace('{topic}', topic)
-    intro = template['intro'].replace('{topic}', topic)
-    conclusion = template['conclusion'].replace('{topic}', topic)
-
-    full_content = f"## Introducción\n\n{intro}\n\n{content}\n\n## Conclusión\n\n{conclusion}\n\n## Recursos Adicionales\n\nPara continuar aprendiendo sobre {topic}, te recomendamos:\n\n- Documentación oficial\n- Comunidades en línea\n- Proyectos open source\n- Cursos especializados"
-
-    return full_content
-
-def generate_metadata(topic, category):
-    """Genera metadata básica sin IA."""
-
-    title = topic[:60]  # Limitar a 60 caracteres
-
-    # Generar tags según categoría
-    tags_by_category = {
-        'ia': ['ia', 'inteligencia-artificial', 'machine-learning', 'tecnologia'],
-        'blockchain': ['blockchain', 'cripto', 'criptomonedas', 'web3'],
-        'tutoriales': ['tutorial', 'guia', 'aprendizaje', 'desarrollo']
-    }
-
-    tags = tags_by_category.get(category, ['tecnologia', 'actualidad'])
-
-    # Agregar tags específicos del tema
-    topic_slug = topic.lower().replace(' ', '-').replace(',', '').replace('á', 'a').replace('é', 'e').replace('í', 'i').replace('ó', 'o').replace('ú', 'u')
-    if topic_slug not in tags:
-        tags.insert(0, topic_slug)
-
-    metadata = {
-        "title": title,
-        "excerpt": f"Descubre todo sobre {topic} en este artículo completo. Aprende conceptos clave, aplicaciones y las últimas tendencias.",
-        "tags": tags[:6]  # Máximo 6 tags
-    }
-
-    return metadata
-
-def generate_image_url(topic, category):
-    """Genera imagen usando Pollinations (100% gratis)."""
-
-    # Palabras clave por categoría
-    category_keywords = {
-        'ia': ['artificial intelligence', 'AI technology', 'neural network', 'machine learning'],
-        'blockchain': ['blockchain technology', 'cryptocurrency', 'bitcoin', 'ethereum', 'digital finance'],
-        'tutoriales': ['programming code', 'technology tutorial', 'computer education', 'software development']
-    }
-
-    main_keyword = category_keywords.get(category, ['technology'])[0]
-
-    # Crear prompt para imagen
-    image_prompt = f"{main_keyword}, {topic}, professional, modern, digital, educational, high quality"
-
-    # Usar Pollinations - totalmente gratis
-    encoded_prompt = urllib.parse.quote(image_prompt)
-    image_url = f"https://image.pollinations.ai/prompt/{encoded_prompt}?width=800&height=600&seed={hash(topic + category)}"
-
-    return image_url
-
-def slugify(text):
-    """Convierte texto a formato slug."""
-    text = text.lower()
-    text = re.sub(r'[áàäâ]', 'a', text)
-    text = re.sub(r'[éèëê]', 'e', text)
-    text = re.sub(r'[íìïî]', 'i', text)
-    text = re.sub(r'[óòöô]', 'o', text)
-    text = re.sub(r'[úùüû]', 'u', text)
-    text = re.sub(r'[ñ]', 'n', text)
-    text = re.sub(r'[^a-z0-9\s-]', '', text)
-    text = re.sub(r'[\s-]+', '-', text)
-    return text.strip('-')
-
-def create_post_file(title, content, excerpt, tags, category, date_str, filename, image_url):
-    """Crea el archivo markdown del post."""
-
-    front_matter = f"""---
-layout: post
-title: "{title}"
-date: {date_str}
-categories: [{category}]
-tags: [{', '.join(tags)}]
-excerpt: "{excerpt}"
-image: "{image_url}"
----
-
-"""
-
-    full_content = front_matter + content
-    full_content += f"""
-
----
-
-*¿Te gustó este artículo? Síguenos en [@nachoweb3__x](https://twitter.com/nachoweb3__x) para más contenido sobre {category}*
-
-*Imagen generada automáticamente con IA gratuita*
-"""
-
-    posts_dir = "_posts"
-    filepath = os.path.join(posts_dir, filename)
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(full_content)
-
-    return filepath
-
-def git_commit_and_push(filename, title):
-    """Realiza commit y push automático."""
-    try:
-        print("\n📤 Subiendo a GitHub...")
-
-        # Git add
-        result = subprocess.run(
-            ["git", "add", f"_posts/{filename}"],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            print(f"⚠️  Error en git add: {result.stderr}")
-            return False
-
-        # Git commit
-        commit_message = f"Add: Nuevo artículo '{title}'\n\n🤖 Generado automáticamente 100% GRATIS\n\nCo-Authored-By: Claude <noreply@anthropic.com>"
-
-        result = subprocess.run(
-            ["git", "commit", "-m", commit_message],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            if "nothing to commit" in result.stderr:
-                return True
-            print(f"⚠️  Error en git commit: {result.stderr}")
-            return False
-
-        # Git push
-        result = subprocess.run(
-            ["git", "push", "origin", "main"],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            print(f"⚠️  Error en git push: {result.stderr}")
-            return False
-
-        print("✅ Cambios subidos exitosamente a GitHub")
-        return True
-
-    except Exception as e:
-        print(f"⚠️  Error en git operations: {e}")
-        return False
-
-def main():
-    # Obtener argumentos
-    if len(sys.argv) < 3:
-        print("🚀 POST GRATIS - Generador 100% gratuito de artículos")
-        print("=" * 60)
-        print("Uso: python3 scripts/post-gratis.py --topic 'Tema del artículo' --category ia")
-        print("\n📋 Categorías disponibles:")
-        print("  • ia        - Inteligencia Artificial")
-        print("  • blockchain - Blockchain y Criptomonedas")
-        print("  • tutoriales - Tutoriales y Guías")
-        print("\n✨ Características:")
-        print("  • 100% GRATIS - NO requiere API keys")
-        print("  • Genera contenido automáticamente")
-        print("  • Crea imágenes automáticamente (gratis)")
-        print("  • Sube todo a GitHub automáticamente")
-        print("  • Funciona sin dependencias")
-        return 1
-
-    topic = None
-    category = None
-
-    for i in range(len(sys.argv)):
-        if sys.argv[i] == '--topic' and i + 1 < len(sys.argv):
-            topic = sys.argv[i + 1]
-        elif sys.argv[i] == '--category' and i + 1 < len(sys.argv):
-            category = sys.argv[i + 1]
-
-    if not topic or not category:
-        print("❌ Error: Debes especificar --topic y --category")
-        return 1
-
-    # Validar categoría
-    valid_categories = ['ia', 'blockchain', 'tutoriales']
-    if category not in valid_categories:
-        print(f"❌ Error: Categoría '{category}' no válida")
-        print(f"   Categorías válidas: {', '.join(valid_categories)}")
-        return 1
-
-    print(f"\n🚀 POST GRATIS - Generando artículo...")
-    print(f"📋 Tema: {topic}")
-    print(f"📁 Categoría: {category}")
-    print(f"💰 Costo: $0 (100% GRATIS)")
-    print(f"🎨 Imagen: Automática (gratis)")
-    print(f"📤 GitHub: Automático\n")
-
-    # Generar metadata
-    print("📝 Generando metadata...")
-    metadata = generate_metadata(topic, category)
-    print(f"✅ Título: {metadata['title']}")
-
-    # Generar contenido
-    print("📄 Generando contenido del artículo...")
-    content = generate_content_locally(topic, category)
-    print("✅ Contenido generado")
-
-    # Generar imagen
-    print("🎨 Generando imagen con IA gratuita...")
-    image_url = generate_image_url(topic, category)
-    print("✅ Imagen generada")
-
-    # Crear filename
-    now = datetime.now()
-    date_str = now.strftime('%Y-%m-%d %H:%M:%S -0500')
-    filename_date = now.strftime('%Y-%m-%d')
-    title_slug = slugify(metadata['title'])
-    filename = f"{filename_date}-{title_slug}.md"
-
-    # Crear archivo
-    print("📝 Creando archivo markdown...")
-    filepath = create_post_file(
-        metadata['title'],
-        content,
-        metadata['excerpt'],
-        metadata['tags'],
-        category,
-        date_str,
-        filename,
-        image_url
-    )
-
-    print(f"✅ Artículo creado: {filepath}")
-
-    # Subir a GitHub
-    success = git_commit_and_push(filename, metadata['title'])
-
-    if success:
-        print(f"\n🎉 ¡ARTÍCULO PUBLICADO 100% GRATIS!")
-        print("=" * 60)
-        print(f"📋 Título: {metadata['title']}")
-        print(f"🏷️  Tags: {', '.join(metadata['tags'])}")
-        print(f"📁 Archivo: {filename}")
-        print(f"🎨 Imagen: Generada con IA gratuita")
-        print(f"💰 Costo: $0.00")
-        print(f"📤 GitHub: ✓ Subido")
-        print(f"\n🌐 ¡Tu artículo ya está disponible en el blog!")
-    else:
-        print(f"\n⚠️  Artículo creado pero no subido a GitHub")
-        print(f"📁 Archivo local: {filepath}")
-
-    return 0
+from postgen.cli import main
 
 if __name__ == '__main__':
-    exit(main())
\ No newline at end of file
+    exit(main(['gratis'] + sys.argv[1:]))
@@ -0,0 +1,9 @@
+"""
+Generador de posts del blog NachoWeb3.
+
+Punto de entrada único: python scripts/blog.py <comando> [opciones]
+
+Los módulos de cada comando se importan solo cuando se ejecutan, y los SDK
+pesados (groq) solo dentro de la ruta de código que los necesita, para que
+--help o un rechazo por límite diario respondan al instante.
+"""
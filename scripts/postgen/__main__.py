@@ -0,0 +1,6 @@
+"""Permite ejecutar el paquete con: python -m postgen (desde scripts/)."""
+
+from .cli import main
+
+if __name__ == '__main__':
+    exit(main())
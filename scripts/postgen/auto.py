@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Script AUTOMÁTICO para crear posts de blog y subirlos a GitHub.
+- 100% GRATIS - NO requiere API keys
+- Subida automática a GitHub
+- Flujo robusto con manejo de errores
+- Imágenes IA automáticas
+"""
+
+import os
+from datetime import datetime
+import subprocess
+import sys
+import time
+
+from . import git_probe
+from . import job_journal
+from . import local_metadata
+from . import publish_queue
+from .common import (CATEGORIES, ENV_FILE, POSTS_DIR, PROJECT_ROOT, create_post_file,
+                     generate_image_url, load_env_file, parse_topic_args, post_filename)
+
+IMAGE_STYLE = 'professional, modern, digital, educational, high quality'
+
+def load_env_vars():
+    """Carga variables de entorno desde archivo .env."""
+    try:
+        if not ENV_FILE.exists():
+            print("⚠️  Archivo .env no encontrado")
+            return False
+
+        print(f"📁 Cargando variables de entorno desde: {ENV_FILE}")
+        load_env_file(override=True)
+
+        print("✅ Variables de entorno cargadas")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error cargando variables de entorno: {e}")
+        return False
+
+def setup_github_authentication():
+    """Configura autenticación con GitHub usando PAT."""
+    try:
+        print("🔐 Configurando autenticación con GitHub...")
+
+        # Cargar variables de entorno
+        if not load_env_vars():
+            print("⚠️  No se pudieron cargar variables de entorno")
+
+        # Obtener GitHub PAT
+        github_token = os.environ.get('GITHUB_TOKEN')
+
+        if github_token and github_token != 'YOUR_GITHUB_PAT_HERE':
+            print("✅ GitHub PAT encontrado en variables de entorno")
+
+            # Configurar el remote con PAT
+            repo_url = "https://github.com/nachoweb3/blog.git"
+            pat_url = f"https://{github_token}@github.com/nachoweb3/blog.git"
+
+            # Actualizar el remote con el PAT
+            result = subprocess.run(
+                ["git", "remote", "set-url", "origin", pat_url],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True
+            )
+
+            if result.returncode == 0:
+                print("✅ Remote configurado con GitHub PAT")
+                return True
+            else:
+                print(f"❌ Error configurando remote con PAT: {result.stderr}")
+                return False
+        else:
+            print("❌ GitHub PAT no configurado")
+            print("📋 **Pasos para configurar GitHub PAT:**")
+            print("   1. Ve a https://github.com/settings/tokens")
+            print("   2. Click en 'Generate new token' -> 'Generate new token (classic)'")
+            print("   3. Selecciona scopes: repo, workflow")
+            print("   4. Genera el token y agrégalo a scripts/.env")
+            print("   5. Reemplaza 'YOUR_GITHUB_PAT_HERE' con tu token")
+            return False
+
+    except Exception as e:
+        print(f"❌ Error configurando autenticación: {e}")
+        return False
+
+def test_git_connection_with_auth():
+    """Prueba conexión con GitHub usando la autenticación configurada."""
+    try:
+        print("🔍 Probando conexión con GitHub...")
+
+        # Una sola conexión al remote; el resultado bueno queda cacheado en .git/
+        ok, error = git_probe.probe()
+
+        if ok:
+            print("✅ Conexión con GitHub exitosa")
+            return True
+        else:
+            print(f"❌ Error de conexión: {error}")
+
+            # Si falla, intentar configurar autenticación
+            if git_probe.is_auth_error(error):
+                print("🔧 Intentando configurar autenticación con PAT...")
+                if setup_github_authentication():
+                    # Reintentar la conexión
+                    ok, error = git_probe.probe()
+                    if ok:
+                        print("✅ Conexión restaurada con GitHub PAT")
+                        return True
+                    else:
+                        print(f"❌ Aún falla la conexión: {error}")
+
+            return False
+
+    except Exception as e:
+        print(f"❌ Error probando conexión: {e}")
+        return False
+
+def run_git_command(command, description, critical=True):
+    """Ejecuta un comando git con manejo de errores."""
+    try:
+        print(f"⏳ {description}...")
+        result = subprocess.run(
+            command,
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        print(f"✅ {description} completado")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Error en {description}: {e.stderr}")
+        if critical:
+            print(f"   Comando: {' '.join(command)}")
+        return False
+    except Exception as e:
+        print(f"❌ Error inesperado en {description}: {e}")
+        return False
+
+def check_git_status():
+    """Verifica el estado del repositorio git."""
+    try:
+        # Verificar si estamos en un repositorio git
+        result = subprocess.run(
+            ["git", "rev-parse", "--git-dir"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode != 0:
+            print("❌ Error: No estás en un repositorio git")
+            return False
+
+        print("✅ Repositorio git verificado")
+
+        # Verificar si hay cambios pendientes
+        result = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+
+        if result.stdout.strip():
+            print("⚠️  Hay cambios pendientes en el repositorio:")
+            print(result.stdout)
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error verificando git: {e}")
+        return False
+
+def check_git_remotes():
+    """Verifica la configuración de remotes."""
+    try:
+        result = subprocess.run(
+            ["git", "remote", "-v"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode != 0:
+            print("❌ Error: No hay remotes configurados")
+            return False
+
+        print("✅ Remotes configurados:")
+        for line in result.stdout.strip().split('\n'):
+            if line.strip():
+                print(f"   {line}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error verificando remotes: {e}")
+        return False
+
+def setup_git_config():
+    """Configura git si es necesario."""
+    try:
+        # Verificar configuración de usuario
+        email_result = subprocess.run(
+            ["git", "config", "user.email"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+
+        name_result = subprocess.run(
+            ["git", "config", "user.name"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+
+        if email_result.returncode != 0 or not email_result.stdout.strip():
+            print("⚙️  Configurando email de git...")
+            email = "blog@nachoweb3.com"
+            subprocess.run(["git", "config", "user.email", email], cwd=PROJECT_ROOT, check=True)
+            print(f"✅ Email configurado: {email}")
+
+        if name_result.returncode != 0 or not name_result.stdout.strip():
+            print("⚙️  Configurando nombre de git...")
+            name = "Blog Auto-Generator"
+            subprocess.run(["git", "config", "user.name", name], cwd=PROJECT_ROOT, check=True)
+            print(f"✅ Nombre configurado: {name}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error configurando git: {e}")
+        return False
+
+def test_git_connection():
+    """Prueba la conexión con el remote."""
+    try:
+        print("🔍 Probando conexión con GitHub...")
+        result = subprocess.run(
+            ["git", "ls-remote", "origin"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode == 0:
+            print("✅ Conexión con GitHub exitosa")
+            return True
+        else:
+            print("❌ Error de conexión con GitHub:")
+            print(f"   {result.stderr}")
+            return False
+
+    except Exception as e:
+        print(f"❌ Error probando conexión: {e}")
+        return False
+
+def generate_metadata(topic, category, content=None):
+    """Genera título, excerpt y tags sin IA, con el vocabulario del propio blog."""
+    return local_metadata.infer_metadata(topic, category, content)
+
+def generate_content(topic, category):
+    """Genera contenido automáticamente."""
+
+    content_templates = {
+        'ia': {
+            'intro': f"La inteligencia artificial ha revolucionado el mundo tecnológico, y {topic} representa uno de los avances más significativos en este campo.",
+            'desarrollo': f"## ¿Qué es {topic}?\n\n{topic} es una tecnología emergente que está transformando la forma en que interactuamos con los sistemas inteligentes.\n\n## Aplicaciones Prácticas\n\nLas aplicaciones de {topic} son numerosas y variadas:\n\n### 1. Automatización de Procesos\n\nPermite optimizar flujos de trabajo y reducir tiempos de respuesta.\n\n### 2. Análisis Predictivo\n\nCapacidad de anticipar tendencias y patrones basados en datos históricos.\n\n### 3. Mejora de Experiencias\n\nPersonalización de servicios y adaptación a necesidades específicas.\n\n## Impacto en la Industria\n\nEl impacto de {topic} se refleja en múltiples sectores:\n\n- **Salud:** Mejora en diagnósticos y tratamientos\n- **Finanzas:** Optimización de riesgos y decisiones\n- **Educación:** Personalización del aprendizaje\n- **Retail:** Experiencias de compra mejoradas\n\n## Tendencias Futuras\n\nEl futuro de {topic} promete avances emocionantes:\n- Integración con otras tecnologías emergentes\n- Mejora en la capacidad de procesamiento\n- Nuevas aplicaciones en diversos campos\n- Mayor accesibilidad para desarrolladores",
+            'conclusion': "{topic} representa el futuro de la inteligencia artificial y está posicionado para transformar nuestra sociedad en los próximos años."
+        },
+        'blockchain': {
+            'intro': f"La tecnología blockchain continúa evolucionando, y {topic} emerge como una de las innovaciones más relevantes en el ecosistema cripto.",
+            'desarrollo': f"## ¿Qué es {topic}?\n\n{topic} es una solución blockchain que ofrece características únicas para el mundo digital descentralizado.\n\n## Características Principales\n\n### Seguridad y Transparencia\n\nUtiliza criptografía avanzada para garantizar la integridad de las transacciones.\n\n### Descentralización\n\nElimina intermediarios y permite transacciones peer-to-peer directas.\n\n### Inmutabilidad\n\nUna vez registrados, los datos no pueden ser modificados, garantizando confianza.\n\n## Casos de Uso\n\nLas aplicaciones prácticas de {topic} incluyen:\n\n- **Finanzas Descentralizadas (DeFi)**\n- **Tokens No Fungibles (NFTs)**\n- **Gestión de Cadena de Suministro**\n- **Identidad Digital**\n- **Contratos Inteligentes**\n\n## Ventajas Competitivas\n\nComparado con soluciones tradicionales, {topic} ofrece:\n- Menores costos operativos\n- Mayor velocidad de transacción\n- Accesibilidad global\n- Resistencia a la censura\n- Transparencia total\n\n## Desafíos y Soluciones\n\nAunque {topic} presenta desafíos, existen soluciones innovadoras:\n- Escalabilidad mediante Layer 2\n- Reducción de costos con optimizaciones\n- Mejora de la experiencia de usuario\n- Integración con sistemas tradicionales",
+            'conclusion': "{topic} representa el futuro de las transacciones digitales y está posicionado para revolucionar múltiples industrias en la próxima década."
+        },
+        'tutoriales': {
+            'intro': f"En este tutorial completo, exploraremos paso a paso cómo implementar {topic}, una habilidad fundamental en el desarrollo tecnológico actual.",
+            'desarrollo': f"## ¿Qué aprenderás?\n\nAl finalizar este tutorial, podrás:\n- Comprender los conceptos básicos de {topic}\n- Implementar soluciones prácticas\n- Resolver problemas comunes\n- Aplicar mejores prácticas\n\n## Requisitos Previos\n\nAntes de comenzar, asegúrate de tener:\n- Conocimientos básicos de programación\n- Un entorno de desarrollo configurado\n- Motivación para aprender\n\n## Paso 1: Conceptos Fundamentales\n\n{topic} se basa en principios que debemos entender:\n\n### Nociones Básicas\n\nLos conceptos clave incluyen:\n- Estructuras de datos eficientes\n- Algoritmos optimizados\n- Patrones de diseño correctos\n- Buenas prácticas de desarrollo\n\n## Paso 2: Configuración del Entorno\n\n### Instalación y Configuración\n\nComencemos con la configuración básica:\n\n1. **Prepara tu entorno de desarrollo**\n   - Instala las herramientas necesarias\n   - Configura tu editor de código\n   - Prepara tu espacio de trabajo\n\n2. **Configuración inicial**\n   - Establece variables de entorno\n   - Configura bases de datos\n   - Prepara archivos de configuración\n\n## Paso 3: Implementación Práctica\n\n### Desarrollo Paso a Paso\n\n#### Primera Fase: Fundamentos\n\nEstablezcamos las bases:\n- Definir objetivos claros\n- Planificar la arquitectura\n- Seleccionar herramientas adecuadas\n- Crear estructura de archivos\n\n#### Segunda Fase: Desarrollo\n\nImplementemos la solución:\n- Codificar funcionalidad principal\n- Agregar validaciones necesarias\n- Optimizar el rendimiento\n- Implementar manejo de errores\n\n#### Tercera Fase: Testing\n\nAseguremos la calidad:\n- Realizar pruebas unitarias\n- Verificar funcionamiento completo\n- Testing de integración\n- Validación de casos extremos\n\n## Paso 4: Mejores Prácticas\n\n### Optimización y Mantenimiento\n\nPara garantizar calidad y sostenibilidad:\n- **Optimización de rendimiento**\n- **Documentación clara**\n- **Testing continuo**\n- **Refactorización periódica**\n\n### Seguridad\n\nConsideraciones de seguridad importantes:\n- Validación de entradas\n- Manejo de autenticación\n- Protección contra vulnerabilidades\n- Cifrado de datos sensibles\n\n## Paso 5: Despliegue\n\n### Preparación para Producción\n\nPasos finales para llevar tu proyecto a producción:\n- Configuración del entorno de producción\n- Optimización de recursos\n- Monitoreo y logging\n- Estrategias de respaldo",
+            'conclusion': "Has aprendido los fundamentos de {topic} y estás listo para aplicar estos conocimientos en proyectos reales. ¡Sigue practicando y explorando nuevas posibilidades!"
+        }
+    }
+
+    template = content_templates.get(category, content_templates['ia'])
+
+    # Reemplazar marcadores
+    content = template['desarrollo'].replace('{topic}', topic)
+    intro = template['intro'].replace('{topic}', topic)
+    conclusion = template['conclusion'].replace('{topic}', topic)
+
+    full_content = f"## Introducción\n\n{intro}\n\n{content}\n\n## Conclusión\n\n{conclusion}\n\n## Recursos Adicionales\n\nPara continuar aprendiendo sobre {topic}, te recomendamos:\n\n- **Documentación oficial** - La fuente más actualizada\n- **Comunidades en línea** - Stack Overflow, Reddit, Discord\n- **Proyectos open source** - GitHub con ejemplos prácticos\n- **Cursos especializados** - Plataformas educativas online\n\n- - -\n\n*¿Te gustó este artículo? Comparte tus experiencias y deja tus comentarios abajo*"
+
+    return full_content
+
+def upload_to_github(filename, title):
+    """Encola el artículo y, si toca, sube la cola a GitHub con flujo robusto."""
+
+    # 1. Encolar: el commit y el push se hacen por lotes
+    signature = f"🤖 Generado automáticamente con POST-AUTO\n📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n🎨 Imagen IA incluida"
+    pending = publish_queue.enqueue(filename, title, signature)
+
+    reason = publish_queue.submit_reason()
+    if not reason:
+        publish_queue.print_queued(pending)
+        return 'queued', "En cola de publicación"
+
+    print(f"\n📤 **INICIANDO SUBIDA A GITHUB** ({reason})")
+    print("=" * 50)
+
+    # 2-4. Repo, usuario y conexión: se omiten si hay una comprobación reciente en .git/
+    cached = git_probe.cached_result()
+    if cached:
+        minutes = (time.time() - cached['checked_at']) / 60
+        print(f"✅ Repo y conexión verificados hace {minutes:.0f} min (caché)")
+    else:
+        # 2. Verificar estado del repositorio
+        if not check_git_status():
+            return False, "Error verificando repositorio git"
+
+        # 3. Configurar git si es necesario
+        if not setup_git_config():
+            return False, "Error configurando git"
+
+        # 4. Verificar conexión con GitHub y configurar autenticación si es necesario
+        if not test_git_connection_with_auth():
+            print("\n❌ **PROBLEMA DE AUTENTICACIÓN**")
+            print("   No se puede conectar a GitHub. Soluciones automáticas fallaron.")
+            print("\n📋 **Solución manual - PASO 1:**")
+            print("   1. Ve a https://github.com/settings/tokens")
+            print("   2. Click en 'Generate new token' -> 'Generate new token (classic)'")
+            print("   3. Selecciona scopes: repo, workflow")
+            print("   4. Genera el token")
+            print("   5. Edita scripts/.env y reemplaza 'YOUR_GITHUB_PAT_HERE'")
+            print("   6. Vuelve a ejecutar el script")
+            return False, "Error de autenticación con GitHub"
+
+    # 5. Un commit y un push para todo el lote
+    if not publish_queue.flush():
+        return False, "Error subiendo la cola a GitHub"
+
+    return 'pushed', "Subida exitosa"
+
+def run_job(entry):
+    """Pasos 1-5 de un trabajo del diario, saltando los que ya terminaron.
+
+    Devuelve (ruta, archivo, metadata, estado, mensaje); estado es 'pushed',
+    'queued' o False si la subida falló.
+    """
+    topic = entry['topic']
+    category = entry['category']
+    stages = entry['stages']
+
+    # 1. Generar contenido
+    print(f"\n📄 **PASO 1: Generando contenido...**")
+    if 'content' not in stages:
+        job_journal.complete(entry, 'content', generate_content(topic, category))
+    content = stages['content']
+    print(f"✅ Contenido generado ({len(content)} caracteres)")
+
+    # 2. Generar metadata (el excerpt sale del propio contenido)
+    print(f"\n📝 **PASO 2: Generando metadata...**")
+    if 'metadata' not in stages:
+        job_journal.complete(entry, 'metadata', generate_metadata(topic, category, content))
+    metadata = stages['metadata']
+    print(f"✅ Título: {metadata['title']}")
+    print(f"✅ Tags: {', '.join(metadata['tags'])}")
+
+    # 3. Generar imagen
+    print(f"\n🎨 **PASO 3: Generando imagen...**")
+    if 'image_url' not in stages:
+        image_url, image_prompt = generate_image_url(topic, category, IMAGE_STYLE)
+        job_journal.complete(entry, 'image_url', image_url)
+        print(f"✅ Imagen generada: {image_prompt[:50]}...")
+    else:
+        print("✅ Imagen recuperada del diario")
+    image_url = stages['image_url']
+
+    # 4. Crear archivo (una sola vez: retomar no escribe un segundo post)
+    print(f"\n📝 **PASO 4: Creando archivo markdown...**")
+    filename = stages.get('written') or post_filename(entry['file_date'], metadata['title'])
+    if 'written' not in stages:
+        filepath = create_post_file(
+            metadata['title'],
+            content,
+            metadata['excerpt'],
+            metadata['tags'],
+            category,
+            entry['date'],
+            filename,
+            image_url,
+            author="Blog Auto-Generator",
+            footer_notes=[
+                "*Imagen generada automáticamente con IA gratuita*",
+                "*Artículo creado y publicado automáticamente*",
+                "",
+                "**🤖 Generado con POST-AUTO - 100% GRATIS**"
+            ]
+        )
+        job_journal.complete(entry, 'written', filename)
+        print(f"✅ Archivo creado: {filepath}")
+    else:
+        filepath = str(POSTS_DIR / filename)
+        print(f"✅ Archivo ya escrito: {filepath}")
+    print(f"📊 Tamaño del archivo: {os.path.getsize(filepath)} bytes")
+
+    # 5. Subir a GitHub
+    print(f"\n📤 **PASO 5: Subiendo a GitHub...**")
+    if 'committed' in stages:
+        # Ya está en un commit local: solo falta el push pendiente de la cola
+        print(f"✅ Ya comiteado ({stages['committed'][:7]})")
+        success = 'pushed' if not publish_queue.load_queue()['unpushed'] or publish_queue.flush() else False
+        message = "Subida exitosa" if success else "Error subiendo la cola a GitHub"
+    else:
+        success, message = upload_to_github(filename, metadata['title'])
+        if 'queued' not in stages:
+            job_journal.complete(entry, 'queued', True)
+
+    if not success:
+        job_journal.fail(entry, message)
+    return filepath, filename, metadata, success, message
+
+def main(argv=None):
+    """Función principal del script."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    print("🚀 **POST-AUTO - Generador Automático de Artículos**")
+    print("=" * 60)
+
+    # Obtener argumentos
+    if len(argv) < 2:
+        print("📋 **Uso:**")
+        print("   python3 scripts/blog.py auto --topic 'Tema del artículo' --category ia")
+        print("\n📁 **Categorías disponibles:**")
+        print("   • ia        - Inteligencia Artificial")
+        print("   • blockchain - Blockchain y Criptomonedas")
+        print("   • tutoriales - Tutoriales y Guías")
+        print("\n✨ **Características:**")
+        print("   • 100% GRATIS - NO requiere API keys")
+        print("   • Generación automática de contenido")
+        print("   • Imágenes IA gratuitas")
+        print("   • Subida automática a GitHub")
+        print("   • Flujo robusto con manejo de errores")
+        return 1
+
+    topic, category = parse_topic_args(argv)
+
+    if not topic or not category:
+        print("❌ Error: Debes especificar --topic y --category")
+        return 1
+
+    # Validar categoría
+    valid_categories = list(CATEGORIES)
+    if category not in valid_categories:
+        print(f"❌ Error: Categoría '{category}' no válida")
+        print(f"   Categorías válidas: {', '.join(valid_categories)}")
+        return 1
+
+    print(f"\n📋 **Detalles del artículo:**")
+    print(f"   🎯 Tema: {topic}")
+    print(f"   📁 Categoría: {category}")
+    print(f"   💰 Costo: $0.00 (100% GRATIS)")
+    print(f"   🎨 Imagen: Automática con IA")
+    print(f"   📤 GitHub: Subida automática")
+
+    # Cada paso queda en el diario: si algo falla, relanzar (o `blog.py resume`) sigue desde ahí
+    now = datetime.now()
+    entry = job_journal.start('auto', topic, category, now.strftime('%Y-%m-%d'),
+                              now.strftime('%Y-%m-%d %H:%M:%S -0500'))
+    filepath, filename, metadata, success, message = run_job(entry)
+
+    if success == 'queued':
+        print(f"\n📥 **ARTÍCULO CREADO Y EN COLA DE PUBLICACIÓN**")
+        print("=" * 60)
+        print(f"📋 Título: {metadata['title']}")
+        print(f"📁 Archivo: {filename}")
+        print(f"🏷️  Tags: {', '.join(metadata['tags'])}")
+        print(f"📤 GitHub: ⏳ Pendiente (python scripts/blog.py publish)")
+    elif success:
+        print(f"\n🎉 **¡ARTÍCULO PUBLICADO EXITOSAMENTE!**")
+        print("=" * 60)
+        print(f"📋 Título: {metadata['title']}")
+        print(f"📁 Archivo: {filename}")
+        print(f"🏷️  Tags: {', '.join(metadata['tags'])}")
+        print(f"🎨 Imagen: Generada con IA gratuita")
+        print(f"💰 Costo: $0.00")
+        print(f"📤 GitHub: ✅ Subido exitosamente")
+        print(f"⏰ Tiempo: {datetime.now().strftime('%H:%M:%S')}")
+        print(f"\n🌐 ¡Tu artículo ya está disponible en el blog!")
+        print(f"🔗 Revisa tu sitio web para verlo publicado")
+    else:
+        print(f"\n⚠️  **ARTÍCULO CREADO PERO NO SUBIDO**")
+        print("=" * 50)
+        print(f"❌ Error: {message}")
+        print(f"📁 Archivo local: {filepath}")
+        print(f"\n📋 **Para subirlo manualmente:**")
+        print(f"   git add _posts/{filename}")
+        print(f"   git commit -m 'Add: Nuevo artículo'")
+        print(f"   git push origin main")
+
+    return 0 if success else 1
+
+if __name__ == '__main__':
+    exit(main())
\ No newline at end of file
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Front end único de los generadores de posts.
+
+Cada subcomando vive en su propio módulo y se importa solo al ejecutarlo;
+el resto de argumentos se le pasan tal cual a su main().
+"""
+
+import argparse
+import importlib
+import sys
+
+# comando -> (módulo, descripción)
+COMMANDS = {
+    'generate': ('postgen.generate', 'Genera posts con el SDK de Groq (batch, streaming, caché)'),
+    'super': ('postgen.super_post', 'Groq sin dependencias + imagen IA + push a GitHub'),
+    'simple': ('postgen.simple', 'Groq sin dependencias + push a GitHub'),
+    'gratis': ('postgen.gratis', 'Plantillas locales o Hugging Face, sin API keys'),
+    'auto': ('postgen.auto', 'Plantillas locales con subida robusta a GitHub'),
+    'publish': ('postgen.publish', 'Sube los posts en cola con un solo commit y push'),
+    'index': ('postgen.index', 'Actualiza el índice SQLite del front matter de _posts/'),
+    'resume': ('postgen.resume', 'Retoma los trabajos interrumpidos desde su última etapa'),
+    'schedule': ('postgen.scheduler', 'Cola de temas y publicación programada a lo largo del día'),
+    'images': ('postgen.hero_images', 'Descarga las portadas remotas y genera variantes locales')
+}
+
+def build_parser():
+    """Parser del front end: solo conoce los nombres de los comandos."""
+    parser = argparse.ArgumentParser(
+        prog='blog.py',
+        description='Generador de artículos del blog NachoWeb3',
+        epilog='Usa "blog.py <comando> --help" para ver las opciones de cada comando.'
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMANDO')
+
+    for name, (_, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text, add_help=False)
+
+    return parser
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+
+    # Solo se valida el nombre del comando; sus opciones las procesa su módulo
+    if not argv or argv[0] in ('-h', '--help'):
+        parser.print_help()
+        return 0 if argv else 1
+
+    command, command_args = argv[0], argv[1:]
+    if command not in COMMANDS:
+        parser.error(f"comando desconocido '{command}' (elige entre: {', '.join(COMMANDS)})")
+
+    module = importlib.import_module(COMMANDS[command][0])
+    return module.main(command_args)
+
+if __name__ == '__main__':
+    exit(main())
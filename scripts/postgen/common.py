@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Utilidades compartidas por todos los generadores de posts.
+
+Rutas del proyecto, categorías, lectura de scripts/.env, slugify, escritura
+del archivo markdown, URL de imagen de Pollinations y publicación en GitHub.
+Solo usa la librería estándar para que importarlo sea inmediato.
+"""
+
+import os
+import re
+import zlib
+import subprocess
+import urllib.parse
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+POSTS_DIR = PROJECT_ROOT / '_posts'
+ENV_FILE = SCRIPTS_DIR / '.env'
+
+# Configuración de categorías
+CATEGORIES = {
+    'ia': {
+        'name': 'IA',
+        'slug': 'ia',
+        'description': 'Inteligencia Artificial',
+        'tags_comunes': ['ia', 'machine-learning', 'deep-learning', 'ia-generativa', 'llm']
+    },
+    'blockchain': {
+        'name': 'Blockchain',
+        'slug': 'blockchain',
+        'description': 'Blockchain y Criptomonedas',
+        'tags_comunes': ['blockchain', 'crypto', 'web3', 'defi', 'nft']
+    },
+    'tutoriales': {
+        'name': 'Tutoriales',
+        'slug': 'tutoriales',
+        'description': 'Guías y Tutoriales',
+        'tags_comunes': ['tutorial', 'guia', 'paso-a-paso', 'como-hacer']
+    }
+}
+
+# Palabras clave de imagen por categoría
+IMAGE_KEYWORDS = {
+    'ia': ['artificial intelligence', 'AI technology', 'neural network', 'machine learning'],
+    'blockchain': ['blockchain technology', 'cryptocurrency', 'bitcoin', 'ethereum', 'digital finance'],
+    'tutoriales': ['programming code', 'technology tutorial', 'computer science', 'software development']
+}
+
+API_KEY_PLACEHOLDERS = ('YOUR_API_KEY_HERE', 'TU_API_KEY_ANTIGUO_AQUI')
+
+def load_env_file(override=False):
+    """Carga scripts/.env en os.environ (sin python-dotenv).
+
+    Por defecto no pisa variables que ya estén definidas en el entorno.
+    Devuelve True si el archivo existía.
+    """
+    if not ENV_FILE.exists():
+        return False
+
+    with open(ENV_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            key = key.strip()
+            if key.startswith('export '):
+                key = key[len('export '):].strip()
+            value = value.strip().strip('"').strip("'")
+            if override or key not in os.environ:
+                os.environ[key] = value
+
+    return True
+
+def get_groq_api_key():
+    """Devuelve la API key de Groq del entorno o de scripts/.env, o None si no es válida."""
+    load_env_file()
+    api_key = os.environ.get('GROQ_API_KEY')
+    if not api_key or api_key in API_KEY_PLACEHOLDERS:
+        return None
+    return api_key
+
+def parse_topic_args(argv):
+    """Lee --topic y --category de una lista de argumentos sin argparse."""
+    topic = None
+    category = None
+
+    for i in range(len(argv)):
+        if argv[i] == '--topic' and i + 1 < len(argv):
+            topic = argv[i + 1]
+        elif argv[i] == '--category' and i + 1 < len(argv):
+            category = argv[i + 1]
+
+    return topic, category
+
+def slugify(text):
+    """Convierte texto a formato slug para URLs."""
+    text = text.lower()
+    text = re.sub(r'[áàäâ]', 'a', text)
+    text = re.sub(r'[éèëê]', 'e', text)
+    text = re.sub(r'[íìïî]', 'i', text)
+    text = re.sub(r'[óòöô]', 'o', text)
+    text = re.sub(r'[úùüû]', 'u', text)
+    text = re.sub(r'[ñ]', 'n', text)
+    text = re.sub(r'[^a-z0-9\s-]', '', text)
+    text = re.sub(r'[\s-]+', '-', text)
+    return text.strip('-')
+
+def post_filename(file_date, title, directories=()):
+    """Nombre libre para el post: {fecha}-{slug}.md, o -2, -3... si ya existe.
+
+    Dos títulos distintos pueden dar el mismo slug el mismo día y el segundo
+    sobrescribiría al primero. Se mira en _posts/ y en `directories`.
+    """
+    slug = slugify(title) or 'post'
+    folders = [POSTS_DIR, *(Path(directory) for directory in directories)]
+    number = 1
+    while True:
+        filename = f"{file_date}-{slug}.md" if number == 1 else f"{file_date}-{slug}-{number}.md"
+        if not any((folder / filename).exists() for folder in folders):
+            return filename
+        number += 1
+
+def generate_image_url(topic, category, style='professional, modern, high quality, digital art'):
+    """Genera una URL de imagen usando Pollinations AI (gratis, sin API key).
+
+    Devuelve (url, prompt). La semilla es estable para que el mismo tema
+    dé siempre la misma imagen.
+    """
+    main_keyword = IMAGE_KEYWORDS.get(category, ['technology'])[0]
+    image_prompt = f"{main_keyword}, {topic}, {style}"
+
+    encoded_prompt = urllib.parse.quote(image_prompt)
+    seed = zlib.crc32(f"{topic}{category}".encode('utf-8'))
+    image_url = f"https://image.pollinations.ai/prompt/{encoded_prompt}?width=800&height=600&seed={seed}"
+
+    return image_url, image_prompt
+
+def create_post_file(title, content, excerpt, tags, category, date_str, filename,
+                     image_url=None, author=None, footer_notes=(), directory=None):
+    """Crea el archivo markdown del post con front matter.
+
+    Se escribe en un temporal y se renombra, así nunca queda un post a medias.
+    Por defecto va a _posts/; con directory se puede dejar como borrador.
+    """
+    front_matter_lines = [
+        '---',
+        'layout: post',
+        f'title: "{title}"',
+        f'date: {date_str}',
+        f'categories: [{category}]',
+        f"tags: [{', '.join(tags)}]",
+        f'excerpt: "{excerpt}"'
+    ]
+    if image_url:
+        front_matter_lines.append(f'image: "{image_url}"')
+    if author:
+        front_matter_lines.append(f'author: "{author}"')
+    front_matter_lines.append('---')
+
+    category_name = CATEGORIES.get(category, {}).get('name', category)
+    full_content = '\n'.join(front_matter_lines) + '\n\n' + content
+    full_content += f"""
+
+---
+
+*¿Te gustó este artículo? Síguenos en [@nachoweb3__x](https://twitter.com/nachoweb3__x) para más contenido sobre {category_name}*
+"""
+    if footer_notes:
+        full_content += '\n' + '\n'.join(footer_notes) + '\n'
+
+    directory = Path(directory) if directory else POSTS_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    filepath = directory / filename
+    tmp_path = directory / f".{filename}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(full_content)
+    os.replace(tmp_path, filepath)
+
+    return str(filepath)
+
+def check_git_config():
+    """Verifica y configura el usuario de git si es necesario."""
+    try:
+        result = subprocess.run(
+            ["git", "config", "user.name"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode != 0 or not result.stdout.strip():
+            print("⚙️  Configurando git por primera vez...")
+            subprocess.run(["git", "config", "user.email", "blog@nachoweb3.com"], cwd=PROJECT_ROOT, check=True)
+            subprocess.run(["git", "config", "user.name", "Blog Auto-Generator"], cwd=PROJECT_ROOT, check=True)
+            print("✅ Git configurado")
+    except Exception as e:
+        print(f"⚠️  Error configurando git: {e}")
+
+def git_commit_and_push(filename, title, signature='🤖 Generado automáticamente con IA'):
+    """Publica el post en GitHub (o lo encola con PUBLISH_BATCH=1, ver publish_queue).
+
+    Devuelve 'pushed', 'queued' o False si falló.
+    """
+    from . import publish_queue
+
+    try:
+        return publish_queue.submit(filename, title, signature)
+    except Exception as e:
+        print(f"⚠️  Error en git operations: {e}")
+        print("   Puedes hacer commit/push manualmente")
+        return False
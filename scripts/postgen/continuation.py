@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Continuación automática de respuestas cortadas por max_tokens.
+
+Cuando una completion termina con finish_reason=length, en lugar de
+quedarse con el texto cortado (o regenerarlo entero) se pide que continúe
+desde donde se quedó, pasándole como mensaje del asistente solo la cola
+del texto ya escrito. Las continuaciones se detienen al llegar a
+MAX_CONTINUATIONS o al presupuesto total de tokens de salida
+(LLM_CONTINUATION_BUDGET, 12000 por defecto, contando la primera respuesta).
+"""
+
+import os
+
+CONTINUE_PROMPT = """Continúa el artículo exactamente donde se quedó, sin repetir nada de lo ya escrito ni añadir comentarios. Sigue en formato markdown:"""
+
+TOKEN_BUDGET = int(os.environ.get('LLM_CONTINUATION_BUDGET', 12000))
+MAX_CONTINUATIONS = 3
+
+# Caracteres del final del texto que se reenvían como contexto
+TAIL_CHARS = 4000
+
+# Solapamiento máximo que se busca al unir (el modelo a veces repite el final)
+MAX_OVERLAP = 300
+
+def continuation_messages(prompt, text):
+    """Mensajes para pedir que siga: prompt original, cola del texto y la orden de continuar."""
+    tail = text[-TAIL_CHARS:]
+    return [
+        {"role": "user", "content": prompt},
+        {"role": "assistant", "content": tail},
+        {"role": "user", "content": CONTINUE_PROMPT}
+    ]
+
+def join_continuation(text, addition):
+    """Une la continuación al texto quitando lo que repita del final."""
+    max_overlap = min(MAX_OVERLAP, len(text), len(addition))
+    for size in range(max_overlap, 20, -1):
+        if text.endswith(addition[:size]):
+            addition = addition[size:]
+            break
+    return text + addition
+
+def complete(send, prompt, max_tokens):
+    """Pide la respuesta y la continúa mientras venga cortada y quede presupuesto.
+
+    send(messages, max_tokens) debe devolver (texto, finish_reason, tokens_de_salida);
+    tokens_de_salida puede ser None si la API no lo informa.
+    """
+    text, finish_reason, used = send([{"role": "user", "content": prompt}], max_tokens)
+    text = text or ''
+    spent = used if used is not None else len(text) // 4
+
+    continuations = 0
+    while finish_reason == 'length' and continuations < MAX_CONTINUATIONS:
+        remaining = TOKEN_BUDGET - spent
+        if remaining <= 0:
+            print(f"⚠️  Respuesta cortada y presupuesto de {TOKEN_BUDGET} tokens agotado; se usa tal cual")
+            break
+
+        continuations += 1
+        print(f"✂️  Respuesta cortada por max_tokens; pidiendo continuación ({continuations}/{MAX_CONTINUATIONS})...")
+        addition, finish_reason, used = send(continuation_messages(prompt, text), min(max_tokens, remaining))
+        addition = addition or ''
+        spent += used if used is not None else len(addition) // 4
+        if not addition.strip():
+            break
+        text = join_continuation(text, addition)
+
+    if finish_reason == 'length' and continuations == MAX_CONTINUATIONS:
+        print(f"⚠️  Sigue cortada tras {MAX_CONTINUATIONS} continuaciones; se usa tal cual")
+    return text.strip()
@@ -0,0 +1,1246 @@
+#!/usr/bin/env python3
+"""
+Script para generar artículos de blog automáticamente usando APIs de IA gratuitas.
+Utiliza Groq API (gratuita) para generación de texto y Unsplash API para imágenes.
+Incluye límite diario de 5 posts, modo batch y streaming.
+"""
+
+import os
+import argparse
+import asyncio
+import csv
+import json
+import time
+from datetime import datetime, date
+import re
+
+from . import continuation
+from . import http_pool
+from . import job_journal
+from . import llm_cache
+from . import local_metadata
+from . import model_router
+from . import post_index
+from . import provider_router
+from . import publish_queue
+from . import rate_limit
+from . import topic_dedup
+from .common import CATEGORIES, POSTS_DIR, create_post_file, load_env_file, post_filename, slugify
+
+# Templates de prompts por categoría
+PROMPT_TEMPLATES = {
+    'ia': """Escribe un artículo de blog completo y detallado sobre: {topic}
+
+El artículo debe:
+- Tener entre 800-1200 palabras
+- Estar escrito en español
+- Ser informativo y técnico pero accesible
+- Incluir secciones con headers en markdown (##, ###)
+- Incluir ejemplos concretos cuando sea relevante
+- Tener un tono profesional pero cercano
+- Incluir una conclusión al final
+- Ser optimizado para SEO
+- NO incluir el título principal (solo secciones)
+
+Estructura sugerida:
+1. Introducción breve y enganchadora
+2. Contexto o explicación del tema
+3. Puntos principales con subsecciones
+4. Casos de uso o aplicaciones
+5. Conclusión
+
+Escribe el artículo completo en formato markdown:""",
+
+    'blockchain': """Escribe un artículo de blog completo y detallado sobre: {topic}
+
+El artículo debe:
+- Tener entre 800-1200 palabras
+- Estar escrito en español
+- Explicar conceptos técnicos de forma accesible
+- Incluir secciones con headers en markdown (##, ###)
+- Incluir ejemplos prácticos o datos reales cuando sea posible
+- Tener un tono informativo y educativo
+- Incluir una conclusión al final
+- Ser optimizado para SEO
+- NO incluir el título principal (solo secciones)
+
+Estructura sugerida:
+1. Introducción al tema
+2. Explicación técnica
+3. Casos de uso o aplicaciones prácticas
+4. Impacto en el ecosistema
+5. Conclusión y perspectivas futuras
+
+Escribe el artículo completo en formato markdown:""",
+
+    'tutoriales': """Escribe un tutorial completo y detallado sobre: {topic}
+
+El tutorial debe:
+- Tener entre 800-1200 palabras
+- Estar escrito en español
+- Ser una guía paso a paso muy clara
+- Incluir secciones con headers en markdown (##, ###)
+- Incluir pasos numerados o listas cuando sea apropiado
+- Incluir ejemplos de código o comandos cuando sea relevante (en bloques de código)
+- Tener un tono instructivo y amigable
+- Incluir consejos o advertencias importantes
+- NO incluir el título principal (solo secciones)
+
+Estructura sugerida:
+1. Introducción: qué aprenderás
+2. Requisitos previos
+3. Pasos del tutorial (numerados)
+4. Consejos y mejores prácticas
+5. Conclusión
+
+Escribe el tutorial completo en formato markdown:"""
+}
+
+def groq_completion(client, **kwargs):
+    """Llama a chat.completions.create pasando por el limitador compartido de Groq.
+
+    Lee las cabeceras x-ratelimit-* de cada respuesta y, ante un 429, pausa y
+    reintenta en lugar de devolver el error.
+    """
+    prompt = ''.join(message['content'] for message in kwargs['messages'])
+    estimated = rate_limit.estimate_tokens(prompt, kwargs['max_tokens'])
+
+    def send():
+        raw = client.chat.completions.with_raw_response.create(**kwargs)
+        rate_limit.update_from_headers(raw.headers)
+        return raw.parse()
+
+    return rate_limit.limited_call(send, estimated)
+
+def groq_sender(client, model, temperature):
+    """send(messages, max_tokens) para continuation.complete usando el SDK."""
+    def send(messages, max_tokens):
+        completion = groq_completion(
+            client,
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        choice = completion.choices[0]
+        usage = getattr(completion, 'usage', None)
+        return choice.message.content, choice.finish_reason, getattr(usage, 'completion_tokens', None)
+    return send
+
+def generate_title_and_tags(client, topic, category):
+    """Genera título SEO y tags usando IA."""
+    prompt = f"""Para un artículo de blog sobre "{topic}" en la categoría {CATEGORIES[category]['name']}, genera:
+
+1. Un título SEO-friendly (máximo 60 caracteres, atractivo y claro)
+2. Un excerpt de 1-2 líneas (máximo 160 caracteres)
+3. 4-6 tags relevantes en español (palabras simples, separadas por comas, en formato slug como: bitcoin, defi, tutorial-python)
+
+Responde SOLO en este formato JSON:
+{{
+    "title": "título aquí",
+    "excerpt": "excerpt aquí",
+    "tags": ["tag1", "tag2", "tag3", "tag4"]
+}}"""
+
+    # Tarea corta y estructurada: modelo pequeño y max_tokens según los límites pedidos
+    model, max_tokens = model_router.plan('metadata', prompt, 300)
+
+    def request_metadata():
+        completion = groq_completion(
+            client,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            max_tokens=max_tokens
+        )
+        return completion.choices[0].message.content.strip()
+
+    try:
+        response_text = llm_cache.cached_call(
+            'groq', model, prompt, 0.7, max_tokens,
+            lambda: model_router.timed('metadata', model, request_metadata, model_router.has_json),
+            model_router.has_json
+        )
+
+        # Extraer JSON de la respuesta
+        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        if json_match:
+            metadata = json.loads(json_match.group())
+            return metadata
+        else:
+            raise ValueError("No se pudo extraer JSON de la respuesta")
+
+    except Exception as e:
+        print(f"Error generando metadata: {e}")
+        return fallback_metadata(topic, category)
+
+def fallback_metadata(topic, category):
+    """Metadata mínima cuando la IA no devuelve nada utilizable."""
+    return {
+        "title": topic[:60],
+        "excerpt": f"Descubre todo sobre {topic} en este artículo detallado.",
+        "tags": CATEGORIES[category]['tags_comunes'][:4]
+    }
+
+# Temas por petición de metadata en lote y reintentos de los que fallen
+METADATA_BATCH_SIZE = int(os.environ.get('METADATA_BATCH_SIZE', 15))
+METADATA_BATCH_RETRIES = 2
+
+METADATA_BATCH_PROMPT = """Para cada uno de estos artículos de blog genera:
+- "title": título SEO-friendly (máximo 60 caracteres, atractivo y claro)
+- "excerpt": 1-2 líneas (máximo 160 caracteres)
+- "tags": 4-6 tags relevantes en español en formato slug (como: bitcoin, defi, tutorial-python)
+
+Artículos:
+{items}
+
+Responde SOLO con un array JSON con un objeto por artículo, en el mismo orden y con su "id":
+[
+    {{"id": 1, "title": "título aquí", "excerpt": "excerpt aquí", "tags": ["tag1", "tag2", "tag3", "tag4"]}}
+]"""
+
+def parse_metadata_item(raw):
+    """Valida un objeto de la respuesta; devuelve (id, metadata) o None si no sirve."""
+    try:
+        item = json.loads(raw)
+        item_id = int(item['id'])
+        title = str(item['title']).strip()
+        excerpt = str(item.get('excerpt', '')).strip()
+        tags = [str(tag).strip() for tag in item['tags'] if str(tag).strip()]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    if not title or not tags:
+        return None
+    return item_id, {'title': title, 'excerpt': excerpt, 'tags': tags}
+
+def request_metadata_chunk(client, items, retry=False):
+    """Una petición para varios temas. Devuelve {posición: metadata} con los que se pudieron leer.
+
+    Solo se cachea la respuesta en la que se leyeron todos los temas; un
+    reintento (retry=True) no lee la caché para que sea una petición nueva.
+    """
+    prompt = METADATA_BATCH_PROMPT.format(items='\n'.join(
+        f"{i}. [{CATEGORIES[category]['name']}] {topic}" for i, (topic, category) in enumerate(items, 1)
+    ))
+    model, max_tokens = model_router.plan('metadata', prompt, 60 + 120 * len(items), items=len(items))
+
+    def request_metadata():
+        completion = groq_completion(
+            client,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            max_tokens=max_tokens
+        )
+        return completion.choices[0].message.content.strip()
+
+    # La respuesta vale (para el router y la caché) si trae metadata legible de todos los temas
+    def is_complete(text):
+        return len(parse_metadata_response(text, len(items))) == len(items)
+
+    try:
+        response_text = llm_cache.cached_call(
+            'groq', model, prompt, 0.7, max_tokens,
+            lambda: model_router.timed('metadata', model, request_metadata, is_complete),
+            is_complete, refresh=retry
+        )
+    except model_router.InvalidResponse as e:
+        # Respuesta incompleta: no se cachea, pero los temas legibles se aprovechan
+        response_text = e.response or ''
+    return parse_metadata_response(response_text, len(items))
+
+def parse_metadata_response(response_text, count):
+    """{posición: metadata} con los objetos de la respuesta que se pudieron leer."""
+    # Cada objeto se parsea por separado: uno roto (o el array cortado) no tira los demás
+    parsed = {}
+    for raw in re.findall(r'\{[^{}]*\}', response_text, re.DOTALL):
+        result = parse_metadata_item(raw)
+        if result and 1 <= result[0] <= count:
+            parsed[result[0] - 1] = result[1]
+    return parsed
+
+def generate_metadata_batch(client, items):
+    """Metadata de muchos temas con pocas peticiones.
+
+    items es una lista de (topic, category). Se envían en grupos de
+    METADATA_BATCH_SIZE; los que no se puedan leer se reintentan juntos en
+    otra petición y, si siguen fallando, reciben la metadata de respaldo.
+    Devuelve una lista de metadata en el mismo orden que items.
+    """
+    results = [None] * len(items)
+    pending = list(range(len(items)))
+    requests_made = 0
+
+    for attempt in range(METADATA_BATCH_RETRIES + 1):
+        if not pending:
+            break
+        failed = []
+        for start in range(0, len(pending), METADATA_BATCH_SIZE):
+            chunk = pending[start:start + METADATA_BATCH_SIZE]
+            try:
+                parsed = request_metadata_chunk(client, [items[i] for i in chunk], retry=attempt > 0)
+            except Exception as e:
+                print(f"⚠️  Error en metadata por lotes: {e}")
+                parsed = {}
+            requests_made += 1
+            for position, index in enumerate(chunk):
+                if position in parsed:
+                    results[index] = parsed[position]
+                else:
+                    failed.append(index)
+        if failed and attempt < METADATA_BATCH_RETRIES:
+            print(f"↩️  Reintentando metadata de {len(failed)} tema(s)")
+        pending = failed
+
+    for index in pending:
+        results[index] = fallback_metadata(*items[index])
+
+    print(f"🏷️  Metadata de {len(items)} temas en {requests_made} petición(es)")
+    return results
+
+def generate_article_content(client, topic, category):
+    """Genera el contenido del artículo usando IA."""
+    prompt_template = PROMPT_TEMPLATES[category]
+    prompt = prompt_template.format(topic=topic)
+
+    model, max_tokens = model_router.plan('content', prompt, 4000)
+
+    def request_content():
+        # Si la respuesta llega cortada por max_tokens se continúa en vez de regenerar
+        send = groq_sender(client, model, 0.7)
+        return continuation.complete(send, prompt, max_tokens)
+
+    try:
+        return llm_cache.cached_call(
+            'groq', model, prompt, 0.7, max_tokens,
+            lambda: model_router.timed('content', model, request_content, provider_router.is_valid_article),
+            provider_router.is_valid_article
+        )
+
+    except Exception as e:
+        # Sin contenido de relleno: el trabajo queda como fallido en el diario
+        # y se vuelve a generar al retomarlo, en vez de publicar una plantilla
+        print(f"Error generando contenido: {e}")
+        raise
+
+# Segundos sin recibir ningún chunk antes de dar el stream por atascado
+STREAM_STALL_TIMEOUT = 30
+
+def partial_content_path(filename_date, topic):
+    """Ruta del archivo temporal donde se va escribiendo el contenido en streaming.
+
+    Empieza por punto para que Jekyll lo ignore mientras se genera.
+    """
+    return str(POSTS_DIR / f".{filename_date}-{slugify(topic)}.md.part")
+
+def stream_article_content(client, topic, category, partial_path):
+    """Genera el contenido en streaming, escribiendo cada chunk en partial_path.
+
+    Si el stream se corta, el texto recibido se queda en partial_path y la
+    siguiente ejecución con el mismo tema y fecha continúa desde ahí en vez
+    de regenerar el artículo entero.
+    """
+    prompt = PROMPT_TEMPLATES[category].format(topic=topic)
+
+    model, max_tokens = model_router.plan('content', prompt, 4000)
+    cached = llm_cache.get('groq', model, prompt, 0.7, max_tokens)
+    if cached is not None and provider_router.is_valid_article(cached):
+        print(f"♻️  Respuesta recuperada de la caché (groq/{model})")
+        return cached
+
+    previous = ''
+    if os.path.exists(partial_path):
+        with open(partial_path, 'r', encoding='utf-8') as f:
+            previous = f.read()
+    resumed = bool(previous.strip())
+    if resumed:
+        print(f"↩️  Reanudando contenido parcial ({len(previous)} caracteres) desde {os.path.basename(partial_path)}")
+
+    start = time.monotonic()
+    first_token_at = None
+    chunks = 0
+    continuations = 0
+
+    try:
+        with open(partial_path, 'a', encoding='utf-8') as f:
+            # Un pase por stream; si acaba por max_tokens se pide continuación
+            while True:
+                if previous.strip():
+                    messages = continuation.continuation_messages(prompt, previous)
+                else:
+                    messages = [{"role": "user", "content": prompt}]
+
+                stream = groq_completion(
+                    client,
+                    model=model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=min(max_tokens, continuation.TOKEN_BUDGET - chunks),
+                    stream=True,
+                    timeout=STREAM_STALL_TIMEOUT
+                )
+
+                finish_reason = None
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].finish_reason:
+                        finish_reason = chunk.choices[0].finish_reason
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                        print(f"⚡ Primer token en {first_token_at - start:.2f}s")
+                    f.write(delta)
+                    f.flush()
+                    previous += delta
+                    chunks += 1
+
+                if finish_reason != 'length':
+                    break
+                if continuations >= continuation.MAX_CONTINUATIONS or chunks >= continuation.TOKEN_BUDGET:
+                    print("⚠️  Respuesta cortada y sin presupuesto para continuar; se usa tal cual")
+                    break
+                continuations += 1
+                print(f"✂️  Respuesta cortada por max_tokens; pidiendo continuación "
+                      f"({continuations}/{continuation.MAX_CONTINUATIONS})...")
+    except Exception as e:
+        model_router.record('content', model, time.monotonic() - start, False)
+        print(f"⚠️  Stream interrumpido: {e}")
+        print(f"   Texto parcial guardado en: {partial_path}")
+        print("   Vuelve a lanzar el mismo comando para continuar desde ahí")
+        raise
+
+    elapsed = time.monotonic() - (first_token_at or start)
+    rate = chunks / elapsed if elapsed > 0 else 0
+    print(f"✅ Streaming completado: {chunks} tokens, {rate:.1f} tokens/s")
+
+    with open(partial_path, 'r', encoding='utf-8') as f:
+        content = f.read().strip()
+    valid = provider_router.is_valid_article(content)
+    model_router.record('content', model, time.monotonic() - start, valid)
+
+    # Solo se cachea la respuesta válida y generada entera en esta ejecución
+    if valid and not resumed:
+        llm_cache.put('groq', model, prompt, 0.7, max_tokens, content)
+
+    return content
+
+OUTLINE_PROMPT = """Vas a planificar un artículo de blog en español sobre: {topic}
+
+Usa como guía esta estructura sugerida:
+{structure}
+
+Devuelve entre 4 y 6 secciones (la primera es la introducción y la última la conclusión). Para cada una da el título del header ## y 2-3 ideas clave que debe cubrir.
+
+Responde SOLO con un array JSON:
+[
+    {{"heading": "título de la sección", "points": "idea 1; idea 2; idea 3"}}
+]"""
+
+SECTION_PROMPT = """Estás escribiendo, junto a otros redactores, un artículo de blog en español sobre: {topic}
+Categoría: {category}
+
+Plan completo del artículo:
+{outline}
+
+Tu parte es SOLO la sección {number}: "{heading}"
+Ideas clave: {points}
+
+Instrucciones:
+- Empieza exactamente con la línea "## {heading}"
+- Escribe unas {words} palabras en formato markdown (puedes usar ### para subsecciones)
+- No repitas lo que cubren las otras secciones del plan
+- No escribas introducción ni conclusión del artículo salvo que sea tu sección
+- {style}
+
+Escribe la sección:"""
+
+TRANSITION_PROMPT = """Estas son dos secciones consecutivas de un artículo de blog en español sobre: {topic}
+
+Final de la sección anterior:
+{previous}
+
+Comienzo de la siguiente sección:
+{following}
+
+Escribe UNA sola frase de transición natural para cerrar la sección anterior y enlazar con la siguiente. Responde solo con la frase, sin comillas ni headers:"""
+
+# Estilo que cada sección hereda de la plantilla de su categoría
+SECTION_STYLES = {
+    'ia': 'Tono profesional pero cercano, técnico pero accesible, con ejemplos concretos',
+    'blockchain': 'Tono informativo y educativo, con ejemplos prácticos o datos reales',
+    'tutoriales': 'Tono instructivo y amigable, con pasos numerados y bloques de código cuando proceda'
+}
+
+ARTICLE_WORDS = 1000
+
+def suggested_structure(category):
+    """Extrae la "Estructura sugerida" de la plantilla de la categoría."""
+    template = PROMPT_TEMPLATES[category]
+    block = template.split('Estructura sugerida:', 1)[1].strip().split('\n\n', 1)[0]
+    return [re.sub(r'^\d+\.\s*', '', line).strip() for line in block.splitlines() if line.strip()]
+
+def generate_outline(client, topic, category):
+    """Pide el índice del artículo: lista de {'heading', 'points'}.
+
+    Si la respuesta no es un JSON válido se usa la estructura sugerida tal cual.
+    """
+    structure = suggested_structure(category)
+    prompt = OUTLINE_PROMPT.format(
+        topic=topic,
+        structure='\n'.join(f"{i}. {item}" for i, item in enumerate(structure, 1))
+    )
+
+    model, max_tokens = model_router.plan('outline', prompt, 500, temperature=0.5)
+
+    def request_outline():
+        completion = groq_completion(
+            client,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.5,
+            max_tokens=max_tokens
+        )
+        return completion.choices[0].message.content.strip()
+
+    def has_list(text):
+        return model_router.has_json(text, '[')
+
+    try:
+        response_text = llm_cache.cached_call(
+            'groq', model, prompt, 0.5, max_tokens,
+            lambda: model_router.timed('outline', model, request_outline, has_list),
+            has_list
+        )
+        json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+        if not json_match:
+            raise ValueError("No se pudo extraer JSON del índice")
+        outline = [
+            {'heading': str(item['heading']).lstrip('#').strip(), 'points': str(item.get('points', ''))}
+            for item in json.loads(json_match.group())
+            if item.get('heading')
+        ]
+        if len(outline) < 2:
+            raise ValueError("Índice demasiado corto")
+        return outline
+
+    except Exception as e:
+        print(f"⚠️  Error generando el índice ({e}); se usa la estructura sugerida")
+        return [{'heading': item, 'points': ''} for item in structure]
+
+def generate_section(client, topic, category, outline, index):
+    """Escribe una sección del índice con el plan completo como contexto compartido."""
+    section = outline[index]
+    prompt = SECTION_PROMPT.format(
+        topic=topic,
+        category=CATEGORIES[category]['name'],
+        outline='\n'.join(f"{i}. {item['heading']}" for i, item in enumerate(outline, 1)),
+        number=index + 1,
+        heading=section['heading'],
+        points=section['points'] or 'las que mejor encajen con el tema',
+        words=ARTICLE_WORDS // len(outline),
+        style=SECTION_STYLES[category]
+    )
+
+    model, max_tokens = model_router.plan('section', prompt, 1200)
+
+    def request_section():
+        return continuation.complete(groq_sender(client, model, 0.7), prompt, max_tokens)
+
+    # Una sección vale si trae al menos la mitad de las palabras pedidas
+    min_words = ARTICLE_WORDS // len(outline) // 2
+
+    def is_long_enough(result):
+        return len(result.split()) >= min_words
+
+    text = llm_cache.cached_call(
+        'groq', model, prompt, 0.7, max_tokens,
+        lambda: model_router.timed('section', model, request_section, is_long_enough),
+        is_long_enough
+    )
+
+    # Garantizar el header aunque el modelo lo omita o cambie de nivel
+    lines = text.splitlines()
+    if lines and lines[0].lstrip().startswith('#'):
+        lines = lines[1:]
+    return f"## {section['heading']}\n\n" + '\n'.join(lines).strip()
+
+def generate_transition(client, topic, previous, following):
+    """Frase puente entre dos secciones; cadena vacía si falla (la transición es opcional)."""
+    prompt = TRANSITION_PROMPT.format(
+        topic=topic,
+        previous=previous.strip()[-600:],
+        following=following.strip()[:600]
+    )
+
+    model, max_tokens = model_router.plan('transition', prompt, 120)
+
+    def request_transition():
+        completion = groq_completion(
+            client,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            max_tokens=max_tokens
+        )
+        return completion.choices[0].message.content.strip()
+
+    # Una transición que ocupa varias líneas o trae headers no es una frase
+    def is_sentence(text):
+        return '\n' not in text.strip() and '#' not in text
+
+    try:
+        return llm_cache.cached_call(
+            'groq', model, prompt, 0.7, max_tokens,
+            lambda: model_router.timed('transition', model, request_transition, is_sentence),
+            is_sentence
+        )
+    except Exception as e:
+        print(f"⚠️  Transición omitida: {e}")
+        return ''
+
+async def generate_sectioned_content(client, semaphore, topic, category, transitions=False):
+    """Índice primero y después todas las secciones a la vez.
+
+    La latencia es la del índice más la de la sección más lenta (más la de
+    la transición más lenta si se pide), en lugar de crecer con la longitud
+    total del artículo. Las secciones se unen en el orden del índice.
+    """
+    start = time.monotonic()
+    outline = await run_in_thread(semaphore, generate_outline, client, topic, category)
+    print(f"🗂️  Índice con {len(outline)} secciones en {time.monotonic() - start:.1f}s")
+
+    sections = await asyncio.gather(*(
+        run_in_thread(semaphore, generate_section, client, topic, category, outline, i)
+        for i in range(len(outline))
+    ))
+    print(f"✍️  {len(sections)} secciones generadas en paralelo ({time.monotonic() - start:.1f}s)")
+
+    if transitions and len(sections) > 1:
+        bridges = await asyncio.gather(*(
+            run_in_thread(semaphore, generate_transition, client, topic, sections[i], sections[i + 1])
+            for i in range(len(sections) - 1)
+        ))
+        sections = [
+            f"{section}\n\n{bridge}" if bridge else section
+            for section, bridge in zip(sections, list(bridges) + [''])
+        ]
+        print(f"🔗 Transiciones añadidas ({time.monotonic() - start:.1f}s)")
+
+    return '\n\n'.join(sections)
+
+# Máximo de posts por día para mantener la calidad del contenido
+DAILY_LIMIT = int(os.environ.get('DAILY_POST_LIMIT', 5))
+
+def check_daily_limit(day=None):
+    """Verifica que no se hayan creado más de DAILY_LIMIT posts en el día (hoy por defecto)."""
+    today = (day or date.today()).strftime('%Y-%m-%d')
+
+    # Contar posts creados hoy
+    today_posts = post_index.posts_on(today)
+    posts_count = len(today_posts)
+
+    if posts_count >= DAILY_LIMIT:
+        print(f"⚠️  LÍMITE DIARIO ALCANZADO: Ya se crearon {posts_count} posts hoy.")
+        print(f"   El límite diario es de {DAILY_LIMIT} posts para mantener calidad del contenido.")
+        print(f"   Posts creados hoy:")
+        for post in today_posts:
+            print(f"   - {post['path']}")
+        return False, posts_count
+
+    return True, posts_count
+
+def get_unsplash_image(topic, category, api_key=None):
+    """Obtiene una imagen relevante de Unsplash basada en el tema."""
+    if not api_key or api_key == "YOUR_UNSPLASH_ACCESS_KEY_HERE":
+        print("⚠️  No hay API key de Unsplash configurada.")
+        print("   Usando imagen placeholder. Para imágenes automáticas:")
+        print("   1. Regístrate en https://unsplash.com/developers")
+        print("   2. Crea una aplicación y obtén tu Access Key")
+        print("   3. Agrega UNSPLASH_ACCESS_KEY=tu_key en scripts/.env")
+        # Retornar placeholder
+        return f"https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?w=800&h=600&fit=crop"
+
+    # Palabras clave por categoría
+    search_queries = {
+        'ia': ['artificial intelligence', 'AI', 'machine learning', 'neural network', 'robot'],
+        'blockchain': ['blockchain', 'cryptocurrency', 'bitcoin', 'ethereum', 'crypto'],
+        'tutoriales': ['programming', 'code', 'developer', 'technology', 'computer']
+    }
+
+    # Construir query de búsqueda
+    category_keywords = search_queries.get(category, ['technology'])
+    # Usar el tema y una palabra clave de la categoría
+    query = f"{category_keywords[0]} technology"
+
+    try:
+        url = "https://api.unsplash.com/search/photos"
+        headers = {"Authorization": f"Client-ID {api_key}"}
+        params = {
+            "query": query,
+            "per_page": 5,
+            "orientation": "landscape"
+        }
+
+        data = http_pool.get_json(url, params=params, headers=headers, timeout=10)
+
+        if data.get('results') and len(data['results']) > 0:
+            # Tomar la primera imagen
+            photo = data['results'][0]
+            image_url = f"{photo['urls']['regular']}?w=800&h=600&fit=crop"
+            photographer = photo['user']['name']
+            photographer_url = photo['user']['links']['html']
+
+            print(f"✅ Imagen encontrada de Unsplash")
+            print(f"   Fotógrafo: {photographer}")
+            print(f"   URL: {photographer_url}")
+
+            return image_url
+        else:
+            print("⚠️  No se encontraron imágenes en Unsplash, usando placeholder")
+            return "https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?w=800&h=600&fit=crop"
+
+    except Exception as e:
+        print(f"⚠️  Error obteniendo imagen de Unsplash: {e}")
+        print("   Usando imagen placeholder")
+        return "https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?w=800&h=600&fit=crop"
+
+def parse_post_date(date_arg):
+    """Convierte una fecha YYYY-MM-DD (o None para hoy) en datetime."""
+    if not date_arg:
+        return datetime.now()
+    return datetime.strptime(date_arg, '%Y-%m-%d')
+
+def read_batch_file(batch_path):
+    """Lee un CSV de temas para el modo batch.
+
+    Columnas: topic, category y date (opcional, YYYY-MM-DD). La fila de
+    cabecera es opcional; sin ella se asume ese mismo orden.
+    """
+    jobs = []
+    with open(batch_path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.reader(f))
+
+    # Los errores citan la línea del archivo, cabecera incluida
+    first_line = 1
+    if rows and [cell.strip().lower() for cell in rows[0][:2]] == ['topic', 'category']:
+        rows = rows[1:]
+        first_line = 2
+
+    for line_number, row in enumerate(rows, first_line):
+        if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+            continue
+
+        topic = row[0].strip()
+        category = row[1].strip() if len(row) > 1 else ''
+        date_arg = row[2].strip() if len(row) > 2 else ''
+
+        if category not in CATEGORIES:
+            raise ValueError(f"Línea {line_number}: categoría '{category}' no válida")
+
+        try:
+            post_date = parse_post_date(date_arg)
+        except ValueError:
+            raise ValueError(f"Línea {line_number}: fecha '{date_arg}' inválida, usa YYYY-MM-DD")
+
+        jobs.append({'topic': topic, 'category': category, 'date': post_date})
+
+    return jobs
+
+async def run_in_thread(semaphore, func, *args):
+    """Ejecuta una llamada bloqueante a la API respetando el límite de peticiones en vuelo."""
+    async with semaphore:
+        return await asyncio.to_thread(func, *args)
+
+async def stored(value):
+    """Resultado de una etapa ya guardada en el diario, usable como una llamada más."""
+    return value
+
+async def journaled(entry, stage, call):
+    """Espera a la llamada y guarda su resultado como etapa del trabajo."""
+    value = await call
+    job_journal.complete(entry, stage, value)
+    return value
+
+async def gather_stages(*calls):
+    """Como asyncio.gather, pero espera a todas antes de propagar un error.
+
+    Así, si falla la imagen, el contenido que sí llegó queda en el diario.
+    """
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+def stage_call(entry, stage, make_call):
+    """Si la etapa ya terminó, su resultado guardado; si no, la llamada, apuntándola al acabar."""
+    if entry and stage in entry['stages']:
+        return stored(entry['stages'][stage])
+    call = make_call()
+    return journaled(entry, stage, call) if entry else call
+
+async def generate_post_parts(client, semaphore, topic, category, partial_path=None,
+                              sections=False, transitions=False, metadata_call=None,
+                              refine_metadata=False, entry=None):
+    """Pide metadata, contenido e imagen a la vez y espera a las tres respuestas.
+
+    Ningún prompt depende de la salida del otro, así que la latencia del post
+    es la de la llamada más lenta (normalmente el contenido) y no la suma.
+    Con partial_path el contenido se genera en streaming hacia ese archivo;
+    con sections, por secciones en paralelo a partir de un índice.
+
+    La metadata se infiere localmente del contenido en milisegundos; solo con
+    refine_metadata se pide al LLM, o se usa metadata_call si viene de un
+    lote de metadata.
+
+    Con entry (trabajo del diario) cada parte se guarda en cuanto llega y las
+    que ya estaban guardadas no se vuelven a pedir.
+    """
+    unsplash_key = os.environ.get('UNSPLASH_ACCESS_KEY')
+    if sections:
+        make_content = lambda: generate_sectioned_content(client, semaphore, topic, category, transitions)
+    elif partial_path:
+        make_content = lambda: run_in_thread(semaphore, stream_article_content, client, topic, category, partial_path)
+    else:
+        make_content = lambda: run_in_thread(semaphore, generate_article_content, client, topic, category)
+
+    content_call = stage_call(entry, 'content', make_content)
+    image_call = stage_call(entry, 'image_url',
+                            lambda: asyncio.to_thread(get_unsplash_image, topic, category, unsplash_key))
+
+    if entry and 'metadata' in entry['stages']:
+        if metadata_call is not None:
+            metadata_call.close()
+        metadata_call = stored(entry['stages']['metadata'])
+    else:
+        if metadata_call is None and refine_metadata:
+            metadata_call = run_in_thread(semaphore, generate_title_and_tags, client, topic, category)
+        if metadata_call is not None and entry:
+            metadata_call = journaled(entry, 'metadata', metadata_call)
+
+    if metadata_call is None:
+        content, image_url = await gather_stages(content_call, image_call)
+        metadata = local_metadata.infer_metadata(topic, category, content)
+        if entry:
+            job_journal.complete(entry, 'metadata', metadata)
+        return metadata, content, image_url
+
+    return await gather_stages(metadata_call, content_call, image_call)
+
+def remove_partial(partial_path):
+    """Borra el archivo parcial del streaming una vez escrito el post."""
+    if partial_path and os.path.exists(partial_path):
+        os.remove(partial_path)
+
+def job_options(stream=False, sections=False, transitions=False, refine_metadata=False):
+    """Opciones de generación que se guardan con el trabajo para poder retomarlo igual."""
+    return {'stream': stream, 'sections': sections, 'transitions': transitions,
+            'refine_metadata': refine_metadata}
+
+def start_job(topic, category, post_date, options):
+    """Abre (o retoma) en el diario el trabajo del tema y la fecha."""
+    return job_journal.start(
+        'generate', topic, category, post_date.strftime('%Y-%m-%d'),
+        post_date.strftime('%Y-%m-%d %H:%M:%S -0500'), options
+    )
+
+async def generate_job(client, semaphore, entry, metadata_call=None):
+    """Genera (o retoma) el post de un trabajo del diario, lo escribe y lo deja en cola.
+
+    Las etapas ya terminadas no se repiten: un post escrito no se reescribe
+    y uno ya encolado no se vuelve a encolar.
+    """
+    topic = entry['topic']
+    category = entry['category']
+    options = entry['options']
+    stages = entry['stages']
+    partial_path = partial_content_path(entry['file_date'], topic) if options.get('stream') else None
+
+    try:
+        metadata, content, image_url = await generate_post_parts(
+            client, semaphore, topic, category, partial_path, options.get('sections', False),
+            options.get('transitions', False), metadata_call, options.get('refine_metadata', False), entry
+        )
+
+        filename = stages.get('written') or post_filename(entry['file_date'], metadata['title'])
+        filepath = str(POSTS_DIR / filename)
+        if 'written' not in stages:
+            filepath = create_post_file(
+                metadata['title'],
+                content,
+                metadata['excerpt'],
+                metadata['tags'],
+                category,
+                entry['date'],
+                filename,
+                image_url
+            )
+            job_journal.complete(entry, 'written', filename)
+        remove_partial(partial_path)
+
+        if 'queued' not in stages:
+            publish_queue.enqueue(filename, metadata['title'])
+            job_journal.complete(entry, 'queued', True)
+    except Exception as e:
+        job_journal.fail(entry, e)
+        raise
+
+    return filepath, metadata
+
+async def generate_batch(client, entries, concurrency):
+    """Genera todos los trabajos con como mucho `concurrency` llamadas en vuelo."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Con refine_metadata, la de los trabajos que aún no la tienen en pocas peticiones
+    # y en paralelo con el contenido
+    refine = [i for i, entry in enumerate(entries)
+              if entry['options'].get('refine_metadata') and 'metadata' not in entry['stages']]
+    metadata_batch = None
+    if refine:
+        metadata_batch = asyncio.ensure_future(run_in_thread(
+            semaphore, generate_metadata_batch, client,
+            [(entries[i]['topic'], entries[i]['category']) for i in refine]
+        ))
+
+    async def metadata_for(index):
+        return (await metadata_batch)[refine.index(index)]
+
+    tasks = {
+        asyncio.ensure_future(generate_job(
+            client, semaphore, entry, metadata_for(i) if i in refine else None
+        )): entry
+        for i, entry in enumerate(entries)
+    }
+
+    created = []
+    failed = []
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            entry = tasks[task]
+            try:
+                filepath, metadata = task.result()
+            except Exception as e:
+                print(f"❌ [{entry['category']}] {entry['topic']}: {e}")
+                failed.append(entry)
+                continue
+            print(f"✅ [{len(created) + 1}/{len(entries)}] {metadata['title']} -> {os.path.basename(filepath)}")
+            created.append(filepath)
+
+    return created, failed
+
+def filter_duplicate_jobs(jobs, allow_duplicate=False):
+    """Quita del batch los temas ya cubiertos por el blog o repetidos dentro del CSV."""
+    accepted = []
+    for i, job in enumerate(jobs):
+        if not topic_dedup.check_topic(job['topic'], allow_duplicate):
+            continue
+        # Los siguientes temas del CSV también se comparan con este
+        topic_dedup.add_topic(f"batch:{i}", job['topic'])
+        accepted.append(job)
+    return accepted
+
+def filter_daily_limit(jobs, ignore_limit=False):
+    """Quita del batch los temas que pasarían de DAILY_LIMIT posts en su fecha.
+
+    Cuentan los posts que ya hay en _posts/ con esa fecha. Un tema cuyo post
+    ya se escribió en un intento anterior del batch sigue adelante (ya está
+    contado). Con ignore_limit solo se avisa.
+    """
+    accepted = []
+    used = {}
+    for job in jobs:
+        file_date = job['date'].strftime('%Y-%m-%d')
+        if file_date not in used:
+            used[file_date] = len(post_index.posts_on(file_date))
+
+        entry = job_journal.load(job_journal.job_id(file_date, job['topic']))
+        if entry and entry['command'] == 'generate' and 'written' in entry['stages']:
+            accepted.append(job)
+            continue
+
+        if used[file_date] >= DAILY_LIMIT:
+            if not ignore_limit:
+                print(f"📅 '{job['topic']}': el {file_date} ya tiene {used[file_date]} posts "
+                      f"(límite diario: {DAILY_LIMIT}); se omite")
+                continue
+            print(f"⚠️  '{job['topic']}': el {file_date} pasa del límite diario de {DAILY_LIMIT} posts")
+        used[file_date] += 1
+        accepted.append(job)
+    return accepted
+
+def run_batch(client, batch_path, concurrency, stream=False, allow_duplicate=False,
+              sections=False, transitions=False, refine_metadata=False, ignore_daily_limit=False):
+    """Modo batch: genera un post por cada fila del CSV."""
+    try:
+        jobs = read_batch_file(batch_path)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: No se pudo leer el batch {batch_path}: {e}")
+        return 1
+
+    skipped = len(jobs)
+    jobs = filter_duplicate_jobs(jobs, allow_duplicate)
+    skipped -= len(jobs)
+    if skipped:
+        print(f"🚫 {skipped} tema(s) descartados por ser casi duplicados\n")
+
+    skipped = len(jobs)
+    jobs = filter_daily_limit(jobs, ignore_daily_limit)
+    skipped -= len(jobs)
+    if skipped:
+        print(f"📅 {skipped} tema(s) omitidos por el límite diario; ponles otra fecha en el CSV "
+              f"o usa --ignore-daily-limit\n")
+
+    if not jobs:
+        print(f"⚠️  El batch {batch_path} no contiene temas")
+        return 1
+
+    print(f"\n🚀 Generando {len(jobs)} artículos en batch (máximo {concurrency} peticiones en paralelo)\n")
+
+    options = job_options(stream, sections, transitions, refine_metadata)
+    entries = [start_job(job['topic'], job['category'], job['date'], options) for job in jobs]
+
+    start = time.monotonic()
+    created, failed = asyncio.run(generate_batch(client, entries, concurrency))
+    elapsed = time.monotonic() - start
+
+    print(f"\n📋 Batch completado en {elapsed:.1f}s: {len(created)} creados, {len(failed)} fallidos")
+    if created:
+        print("📥 Posts en cola; publícalos con un solo push: python scripts/blog.py publish")
+    http_pool.print_stats()
+    model_router.print_report()
+    return 0 if not failed else 1
+
+def create_client(api_key=None):
+    """Cliente de Groq con la key indicada, GROQ_API_KEY o scripts/.env; None si no hay."""
+    # Cargar scripts/.env y obtener API key
+    load_env_file()
+    api_key = api_key or os.environ.get('GROQ_API_KEY')
+    if not api_key:
+        print("ERROR: Necesitas proporcionar una API key de Groq.")
+        print("\nOpciones:")
+        print("1. Usar --api-key: python scripts/blog.py generate --api-key tu_key ...")
+        print("2. Variable de entorno: export GROQ_API_KEY=tu_key")
+        print("\nObtén una API key gratuita en: https://console.groq.com")
+        return None
+
+    # Inicializar cliente (el SDK de Groq solo se importa cuando hace falta)
+    try:
+        from groq import Groq
+        return Groq(api_key=api_key)
+    except Exception as e:
+        print(f"Error inicializando cliente Groq: {e}")
+        return None
+
+def resume_jobs(entries, concurrency=4):
+    """Retoma trabajos de `generate` del diario. Devuelve (creados, fallidos).
+
+    El cliente solo se crea si a algún trabajo le falta una llamada a la API.
+    """
+    needs_api = any(
+        'content' not in entry['stages']
+        or (entry['options'].get('refine_metadata') and 'metadata' not in entry['stages'])
+        for entry in entries
+    )
+    client = create_client() if needs_api else None
+    if needs_api and client is None:
+        return [], entries
+    return asyncio.run(generate_batch(client, entries, concurrency))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='blog.py generate',
+        description='Genera artículos de blog automáticamente usando IA',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos de uso:
+  python scripts/blog.py generate --topic "GPT-4 vs Claude" --category ia
+  python scripts/blog.py generate --topic "Cómo hacer staking en Ethereum" --category blockchain
+  python scripts/blog.py generate --topic "Configurar Visual Studio Code para Python" --category tutoriales
+  python scripts/blog.py generate --topic "Web scraping con Python" --category tutoriales --api-key tu_api_key
+  python scripts/blog.py generate --batch topics.csv --concurrency 8
+  python scripts/blog.py generate --topic "Qué es un rollup" --category blockchain --stream
+  python scripts/blog.py generate --topic "Zero-knowledge proofs" --category blockchain --sections --transitions
+
+Formato del CSV para --batch (la cabecera es opcional, date también):
+  topic,category,date
+  "Qué es un rollup",blockchain,2025-12-01
+
+En --batch cada fecha admite como mucho DAILY_POST_LIMIT posts (5), contando
+los que ya hay en _posts/; los temas que sobran se omiten salvo con
+--ignore-daily-limit.
+
+Categorías disponibles: ia, blockchain, tutoriales
+
+Para obtener una API key gratuita de Groq:
+1. Visita: https://console.groq.com
+2. Crea una cuenta gratuita
+3. Genera una API key en el dashboard
+4. Usa la key con --api-key o configúrala como variable de entorno GROQ_API_KEY
+        """
+    )
+
+    parser.add_argument(
+        '--topic',
+        help='Tema del artículo a generar'
+    )
+
+    parser.add_argument(
+        '--category',
+        choices=['ia', 'blockchain', 'tutoriales'],
+        help='Categoría del artículo'
+    )
+
+    parser.add_argument(
+        '--batch',
+        metavar='TOPICS_CSV',
+        help='CSV con columnas topic,category,date para generar varios posts'
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Máximo de peticiones a Groq en paralelo en modo batch o --sections (por defecto: 4)'
+    )
+
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Generar el contenido en streaming hacia un archivo temporal en _posts/ (reanudable si se corta)'
+    )
+
+    parser.add_argument(
+        '--sections',
+        action='store_true',
+        help='Pedir primero un índice y generar todas las secciones en paralelo'
+    )
+
+    parser.add_argument(
+        '--transitions',
+        action='store_true',
+        help='Con --sections, añadir una frase de transición entre secciones'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='No leer ni guardar respuestas en la caché local de LLM'
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignorar la caché local y regenerar (la nueva respuesta se guarda)'
+    )
+
+    parser.add_argument(
+        '--refine-metadata',
+        action='store_true',
+        help='Pedir título, excerpt y tags al LLM en lugar de inferirlos del blog en local'
+    )
+
+    parser.add_argument(
+        '--allow-duplicate',
+        action='store_true',
+        help='Generar aunque el tema sea casi idéntico a un post existente'
+    )
+
+    parser.add_argument(
+        '--ignore-daily-limit',
+        action='store_true',
+        help=f'En modo batch, generar aunque una fecha pase de {DAILY_LIMIT} posts (DAILY_POST_LIMIT)'
+    )
+
+    parser.add_argument(
+        '--api-key',
+        help='Groq API key (o usa la variable de entorno GROQ_API_KEY)'
+    )
+
+    parser.add_argument(
+        '--date',
+        help='Fecha del post en formato YYYY-MM-DD (por defecto: hoy)'
+    )
+
+    args = parser.parse_args(argv)
+
+    if not args.batch and not (args.topic and args.category):
+        parser.error('debes indicar --topic y --category, o --batch topics.csv')
+    if args.concurrency < 1:
+        parser.error('--concurrency debe ser al menos 1')
+    if args.sections and args.stream:
+        parser.error('--sections y --stream no se pueden combinar')
+    if args.transitions and not args.sections:
+        parser.error('--transitions requiere --sections')
+
+    llm_cache.configure(no_cache=args.no_cache, refresh=args.refresh)
+
+    # Antes de pedir nada a la API, comprobar que el tema no esté ya cubierto
+    if args.topic and not args.batch and not topic_dedup.check_topic(args.topic, args.allow_duplicate):
+        return 1
+
+    client = create_client(args.api_key)
+    if client is None:
+        return 1
+
+    if args.batch:
+        return run_batch(client, args.batch, args.concurrency, args.stream, args.allow_duplicate,
+                         args.sections, args.transitions, args.refine_metadata, args.ignore_daily_limit)
+
+    # Obtener fecha
+    try:
+        post_date = parse_post_date(args.date)
+    except ValueError:
+        print("ERROR: Formato de fecha inválido. Usa YYYY-MM-DD")
+        return 1
+
+    date_str = post_date.strftime('%Y-%m-%d %H:%M:%S -0500')
+
+    print(f"\n🚀 Generando artículo sobre: {args.topic}")
+    print(f"📁 Categoría: {CATEGORIES[args.category]['name']}\n")
+
+    # Generar título, contenido e imagen en paralelo
+    print("⏳ Generando título, tags, contenido e imagen (esto puede tardar un momento)...")
+    # Cada etapa queda en el diario: si algo falla, relanzar el comando (o `blog.py resume`) sigue desde ahí
+    entry = start_job(args.topic, args.category, post_date, job_options(
+        args.stream, args.sections, args.transitions, args.refine_metadata
+    ))
+    # Por secciones hacen falta tantas llamadas en vuelo como secciones
+    semaphore_size = max(2, args.concurrency) if args.sections else 2
+    try:
+        filepath, metadata = asyncio.run(generate_job(client, asyncio.Semaphore(semaphore_size), entry))
+    except Exception as e:
+        print(f"❌ Error generando el artículo: {e}")
+        print("   Lo ya generado queda en el diario; retómalo con: python scripts/blog.py resume")
+        return 1
+    print(f"✅ Título: {metadata['title']}")
+    print(f"✅ Tags: {', '.join(metadata['tags'])}")
+    print("✅ Contenido generado\n")
+
+    filename = entry['stages']['written']
+    image_url = entry['stages']['image_url']
+    pending = len(publish_queue.load_queue()['entries'])
+
+    print(f"✅ Artículo creado exitosamente: {filepath}\n")
+    print("📋 Información del post:")
+    print(f"   Título: {metadata['title']}")
+    print(f"   Fecha: {date_str}")
+    print(f"   Categoría: {args.category}")
+    print(f"   Tags: {', '.join(metadata['tags'])}")
+    print(f"   Imagen: {image_url}")
+    print(f"   Archivo: {filename}\n")
+
+    print("🎨 Próximos pasos:")
+    print("   1. Revisa y edita el contenido generado")
+    print("   2. Revisa que la imagen destacada encaje con el tema")
+    print("   3. Verifica que todo esté correcto")
+    print(f"   4. Publica la cola ({pending} post(s) pendientes): python scripts/blog.py publish")
+    print("\n🎉 ¡Listo!")
+
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
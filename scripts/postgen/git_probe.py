@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Comprobación cacheada de credenciales y remote antes de publicar.
+
+Comprobar repo, usuario y conexión con GitHub antes de cada publicación
+cuesta varios subprocesos y al menos una ida y vuelta por red. El último
+resultado bueno se guarda en .git/postgen-probe.json con un TTL
+(GIT_PROBE_TTL, 6 h por defecto). Mientras siga vigente y .git/config no
+haya cambiado (set-url, usuario...), se pasa directamente al commit/push.
+
+La prueba es una sola conexión al receive-pack de origin: `git push
+--dry-run` solo pide la lista de refs y no manda objetos. Un `ls-remote`
+no sirve para esto porque en un repo público funciona sin credenciales.
+Cualquier error de autenticación en un push real invalida la caché.
+"""
+
+import os
+import json
+import subprocess
+import time
+
+from .common import PROJECT_ROOT
+
+TTL_SECONDS = float(os.environ.get('GIT_PROBE_TTL', 6 * 3600))
+PROBE_TIMEOUT = 30
+
+AUTH_ERROR_MARKERS = (
+    'permission denied',
+    'authentication failed',
+    'could not read username',
+    'invalid username or password',
+    'the requested url returned error: 403',
+    'repository not found'
+)
+
+def git_dir():
+    """Ruta del directorio .git sin lanzar subprocesos (None si no es un repo)."""
+    dot_git = PROJECT_ROOT / '.git'
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        # Worktrees y submódulos: el archivo .git apunta al directorio real
+        content = dot_git.read_text(encoding='utf-8').strip()
+        if content.startswith('gitdir:'):
+            path = (PROJECT_ROOT / content[len('gitdir:'):].strip()).resolve()
+            return path if path.is_dir() else None
+    return None
+
+def _probe_file():
+    directory = git_dir()
+    return directory / 'postgen-probe.json' if directory else None
+
+def _config_fingerprint():
+    """Cambia si se toca .git/config (remote, usuario, credenciales en la URL)."""
+    config = git_dir() / 'config'
+    try:
+        stat = config.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def is_auth_error(output):
+    """True si la salida de git indica un problema de credenciales o permisos."""
+    output = (output or '').lower()
+    return any(marker in output for marker in AUTH_ERROR_MARKERS)
+
+def cached_result():
+    """Devuelve la entrada de caché vigente o None si caducó o cambió la config."""
+    path = _probe_file()
+    if not path:
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - entry.get('checked_at', 0) > TTL_SECONDS:
+        return None
+    if entry.get('config') != _config_fingerprint():
+        return None
+    return entry
+
+def is_healthy():
+    """True si hay una comprobación correcta reciente y se puede ir directo al push."""
+    return cached_result() is not None
+
+def record_success():
+    """Guarda (o renueva) el resultado bueno; un push real correcto también cuenta."""
+    path = _probe_file()
+    if not path:
+        return
+
+    entry = {'checked_at': time.time(), 'config': _config_fingerprint()}
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+
+def invalidate():
+    """Borra la caché; la siguiente publicación vuelve a comprobarlo todo."""
+    path = _probe_file()
+    if path and path.exists():
+        path.unlink()
+
+def probe(remote='origin', branch='main'):
+    """Prueba de escritura contra el remote con una sola conexión.
+
+    Devuelve (ok, salida_de_error). Un rechazo por non-fast-forward
+    significa que las credenciales valen, así que también cuenta como ok.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "push", "--dry-run", "--porcelain", remote, f"HEAD:refs/heads/{branch}"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        return False, "Timeout"
+
+    output = result.stdout + result.stderr
+    ok = result.returncode == 0 or ('[rejected]' in output and not is_auth_error(output))
+    if ok:
+        record_success()
+    else:
+        invalidate()
+    return ok, result.stderr.strip()
+
+def check(remote='origin', branch='main', force=False):
+    """Usa la caché si está vigente; si no (o con force), lanza la prueba.
+
+    La caché es para el camino de publicación. Las herramientas de
+    diagnóstico pasan force=True: después de arreglar la autenticación hay
+    que probar las credenciales de verdad, no repetir el último OK.
+
+    Devuelve (ok, salida_de_error, desde_cache).
+    """
+    if not force and is_healthy():
+        return True, '', True
+    ok, error = probe(remote, branch)
+    return ok, error, False
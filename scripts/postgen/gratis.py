@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Script 100% GRATIS para crear posts de blog.
+- NO requiere API keys
+- Usa IA gratuita (Hugging Face)
+- Genera imágenes automáticamente (gratis)
+- Sube todo a GitHub
+"""
+
+from datetime import datetime
+import sys
+
+from . import llm_cache
+from . import local_metadata
+from . import provider_router
+from .common import (CATEGORIES, create_post_file, generate_image_url, git_commit_and_push,
+                     parse_topic_args, post_filename)
+
+IMAGE_STYLE = 'professional, modern, digital, educational, high quality'
+
+def call_huggingface_api(prompt):
+    """Usa Hugging Face Inference API (gratis)."""
+    return provider_router.call_huggingface(prompt, max_new_tokens=2000)
+
+def generate_content(topic, category, use_ai):
+    """Genera el contenido con Hugging Face y la plantilla local como respaldo.
+
+    Sin --ia se usa directamente la plantilla local. Con --ia se pide el
+    artículo a Hugging Face y, si tarda más que su p95 habitual, la plantilla
+    local entra como respuesta de respaldo.
+    """
+    if not use_ai:
+        return generate_content_locally(topic, category)
+
+    prompt = f"""Escribe un artículo completo y detallado sobre: {topic}
+
+El artículo debe:
+- Tener entre 800-1200 palabras
+- Estar escrito en español
+- Ser informativo y técnico pero accesible
+- Incluir secciones con headers en markdown (##, ###)
+- Incluir una conclusión al final
+- NO incluir el título principal (solo secciones)
+
+Escribe el artículo completo en formato markdown:"""
+
+    provider, content = provider_router.hedged_call([
+        ('huggingface', lambda: call_huggingface_api(prompt)),
+        ('local', lambda: generate_content_locally(topic, category))
+    ])
+    provider_router.print_latency_report(['huggingface'])
+    return content or generate_content_locally(topic, category)
+
+def generate_content_locally(topic, category):
+    """Genera contenido localmente sin APIs."""
+
+    # Plantillas base por categoría
+    content_templates = {
+        'ia': {
+            'intro': f"La inteligencia artificial ha revolucionado el mundo tecnológico, y {topic} representa uno de los avances más significativos en este campo.",
+            'desarrollo': f"## ¿Qué es {topic}?\n\n{topic} es una tecnología emergente que está transformando la forma en que interactuamos con los sistemas inteligentes.\n\n## Aplicaciones Prácticas\n\nLas aplicaciones de {topic} son numerosas y variadas:\n\n### 1. Automatización de Procesos\n\nPermite optimizar flujos de trabajo y reducir tiempos de respuesta.\n\n### 2. Análisis Predictivo\n\nCapacidad de anticipar tendencias y patrones basados en datos históricos.\n\n### 3. Mejora de Experiencias\n\nPersonalización de servicios y adaptación a necesidades específicas.\n\n## Impacto en la Industria\n\nEl impacto de {topic} se refleja en múltiples sectores:\n\n- **Salud:** Mejora en diagnósticos y tratamientos\n- **Finanzas:** Optimización de riesgos y decisiones\n- **Educación:** Personalización del aprendizaje\n- **Retail:** Experiencias de compra mejoradas",
+            'conclusion': "El futuro de {topic} es prometedor, con un potencial ilimitado para transformar nuestra sociedad."
+        },
+        'blockchain': {
+            'intro': f"La tecnología blockchain continúa evolucionando, y {topic} emerge como una de las innovaciones más relevantes en el ecosistema cripto.",
+            'desarrollo': f"## ¿Qué es {topic}?\n\n{topic} es una solución blockchain que ofrece características únicas para el mundo digital descentralizado.\n\n## Características Principales\n\n### Seguridad y Transparencia\n\nUtiliza criptografía avanzada para garantizar la integridad de las transacciones.\n\n### Descentralización\n\nElimina intermediarios y permite transacciones peer-to-peer directas.\n\n### Inmutabilidad\n\nUna vez registrados, los datos no pueden ser modificados, garantizando confianza.\n\n## Casos de Uso\n\nLas aplicaciones prácticas de {topic} incluyen:\n\n- **Finanzas Descentralizadas (DeFi)**\n- **Tokens No Fungibles (NFTs)**\n- **Gestión de Cadena de Suministro**\n- **Identidad Digital**\n\n## Ventajas Competitivas\n\nComparado con soluciones tradicionales, {topic} ofrece:\n- Menores costos operativos\n- Mayor velocidad de transacción\n- Accesibilidad global\n- Resistencia a la censura",
+            'conclusion': "{topic} representa el futuro de las transacciones digitales y está posicionado para revolucionar múltiples industrias."
+        },
+        'tutoriales': {
+            'intro': f"En este tutorial completo, exploraremos paso a paso cómo implementar {topic}, una habilidad fundamental en el desarrollo tecnológico actual.",
+            'desarrollo': f"## ¿Qué aprenderás?\n\nAl finalizar este tutorial, podrás:\n- Comprender los conceptos básicos de {topic}\n- Implementar soluciones prácticas\n- Resolver problemas comunes\n- Aplicar mejores prácticas\n\n## Requisitos Previos\n\nAntes de comenzar, asegúrate de tener:\n- Conocimientos básicos de programación\n- Un entorno de desarrollo configurado\n- Motivación para aprender\n\n## Paso 1: Conceptos Fundamentales\n\n{topic} se basa en principios que debemos entender:\n\n### Nociones Básicas\n\nLos conceptos clave incluyen:\n- Estructuras de datos\n- Algoritmos eficientes\n- Patrones de diseño\n- Buenas prácticas\n\n## Paso 2: Implementación Práctica\n\n### Configuración Inicial\n\nComencemos con la configuración básica:\n\n1. Prepara tu entorno de desarrollo\n2. Instala las herramientas necesarias\n3. Configura tu espacio de trabajo\n\n### Desarrollo\n\nAhora implementemos {topic} paso a paso:\n\n#### Primera Parte: Fundamentos\n\nEstablezcamos las bases:\n- Definir objetivos claros\n- Planificar la arquitectura\n- Seleccionar las herramientas adecuadas\n\n#### Segunda Parte: Desarrollo\n\nImplementemos la solución:\n- Codificar la funcionalidad principal\n- Agregar validaciones\n- Optimizar el rendimiento\n\n## Paso 3: Buenas Prácticas\n\nPara garantizar calidad:\n\n### Testing y Validación\n\n- Realizar pruebas unitarias\n- Verificar el funcionamiento\n- Documentar el código\n\n### Optimización\n\n- Mejorar el rendimiento\n- Reducir la complejidad\n- Facilitar el mantenimiento",
+            'conclusion': "Has aprendido los fundamentos de {topic} y estás listo para aplicar estos conocimientos en proyectos reales."
+        }
+    }
+
+    template = content_templates.get(category, content_templates['ia'])
+
+    # Reemplazar marcadores
+    content = template['desarrollo'].replace('{topic}', topic)
+    intro = template['intro'].replace('{topic}', topic)
+    conclusion = template['conclusion'].replace('{topic}', topic)
+
+    full_content = f"## Introducción\n\n{intro}\n\n{content}\n\n## Conclusión\n\n{conclusion}\n\n## Recursos Adicionales\n\nPara continuar aprendiendo sobre {topic}, te recomendamos:\n\n- Documentación oficial\n- Comunidades en línea\n- Proyectos open source\n- Cursos especializados"
+
+    return full_content
+
+def generate_metadata(topic, category, content=None):
+    """Genera título, excerpt y tags sin IA, con el vocabulario del propio blog."""
+    return local_metadata.infer_metadata(topic, category, content)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Obtener argumentos
+    if len(argv) < 2:
+        print("🚀 POST GRATIS - Generador 100% gratuito de artículos")
+        print("=" * 60)
+        print("Uso: python3 scripts/blog.py gratis --topic 'Tema del artículo' --category ia")
+        print("\n📋 Categorías disponibles:")
+        print("  • ia        - Inteligencia Artificial")
+        print("  • blockchain - Blockchain y Criptomonedas")
+        print("  • tutoriales - Tutoriales y Guías")
+        print("\n✨ Características:")
+        print("  • 100% GRATIS - NO requiere API keys")
+        print("  • Genera contenido automáticamente")
+        print("  • Crea imágenes automáticamente (gratis)")
+        print("  • Sube todo a GitHub automáticamente")
+        print("  • Funciona sin dependencias")
+        print("\n⚙️  Opciones:")
+        print("  • --ia  - Pide el artículo a Hugging Face (plantilla local si tarda)")
+        return 1
+
+    topic, category = parse_topic_args(argv)
+
+    # --no-cache / --refresh para la caché local de respuestas de LLM
+    llm_cache.configure_from_argv(argv)
+    use_ai = '--ia' in argv
+
+    if not topic or not category:
+        print("❌ Error: Debes especificar --topic y --category")
+        return 1
+
+    # Validar categoría
+    valid_categories = list(CATEGORIES)
+    if category not in valid_categories:
+        print(f"❌ Error: Categoría '{category}' no válida")
+        print(f"   Categorías válidas: {', '.join(valid_categories)}")
+        return 1
+
+    print(f"\n🚀 POST GRATIS - Generando artículo...")
+    print(f"📋 Tema: {topic}")
+    print(f"📁 Categoría: {category}")
+    print(f"💰 Costo: $0 (100% GRATIS)")
+    print(f"🎨 Imagen: Automática (gratis)")
+    print(f"📤 GitHub: Automático\n")
+
+    # Generar contenido
+    print("📄 Generando contenido del artículo...")
+    content = generate_content(topic, category, use_ai)
+    print("✅ Contenido generado")
+
+    # Generar metadata (el excerpt sale del propio contenido)
+    print("📝 Generando metadata...")
+    metadata = generate_metadata(topic, category, content)
+    print(f"✅ Título: {metadata['title']}")
+
+    # Generar imagen
+    print("🎨 Generando imagen con IA gratuita...")
+    image_url, _ = generate_image_url(topic, category, IMAGE_STYLE)
+    print("✅ Imagen generada")
+
+    # Crear filename
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d %H:%M:%S -0500')
+    filename_date = now.strftime('%Y-%m-%d')
+    filename = post_filename(filename_date, metadata['title'])
+
+    # Crear archivo
+    print("📝 Creando archivo markdown...")
+    filepath = create_post_file(
+        metadata['title'],
+        content,
+        metadata['excerpt'],
+        metadata['tags'],
+        category,
+        date_str,
+        filename,
+        image_url,
+        footer_notes=["*Imagen generada automáticamente con IA gratuita*"]
+    )
+
+    print(f"✅ Artículo creado: {filepath}")
+
+    # Subir a GitHub
+    success = git_commit_and_push(
+        filename,
+        metadata['title'],
+        signature='🤖 Generado automáticamente 100% GRATIS'
+    )
+
+    if success == 'queued':
+        print(f"\n📥 Artículo creado y en cola de publicación")
+        print(f"📋 Título: {metadata['title']}")
+        print(f"📁 Archivo: {filename}")
+        print(f"📤 GitHub: ⏳ Pendiente (python scripts/blog.py publish)")
+    elif success:
+        print(f"\n🎉 ¡ARTÍCULO PUBLICADO 100% GRATIS!")
+        print("=" * 60)
+        print(f"📋 Título: {metadata['title']}")
+        print(f"🏷️  Tags: {', '.join(metadata['tags'])}")
+        print(f"📁 Archivo: {filename}")
+        print(f"🎨 Imagen: Generada con IA gratuita")
+        print(f"💰 Costo: $0.00")
+        print(f"📤 GitHub: ✓ Subido")
+        print(f"\n🌐 ¡Tu artículo ya está disponible en el blog!")
+    else:
+        print(f"\n⚠️  Artículo creado pero no subido a GitHub")
+        print(f"📁 Archivo local: {filepath}")
+
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
\ No newline at end of file
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Comando `blog.py images`: trae a local las imágenes de portada de los posts.
+
+El `image:` de cada post apunta a Unsplash o Pollinations, así que cada
+visita paga una descarga de un tercero (y Pollinations vuelve a generar la
+imagen si no la tiene en caché). Este comando descarga cada URL una sola
+vez, la guarda por su hash de contenido en assets/images/posts/ con
+variantes de 400, 800 y 1200 px en WebP y JPEG, y cambia el front matter:
+
+  image: "/assets/images/posts/<hash>-800.jpg"
+  image_hash: "<hash>"          # post-card.html arma el srcset con las variantes
+  image_widths: [400, 800]      # solo los anchos generados
+  image_source: "<URL original>"
+
+Una imagen nunca se amplía: solo se generan los anchos que no superan el
+original (y si es más estrecha que 400 px, una única variante a su ancho),
+así que el srcset no anuncia variantes que solo pesan más sin verse mejor.
+
+Qué URL corresponde a qué hash se guarda en assets/images/posts/.sources.json
+y qué anchos tiene cada hash en .variants.json, así que una URL ya
+descargada (o que comparten varios posts) no se vuelve a pedir; los posts
+que ya apuntan a local ni se miran. Las descargas van en
+hilos y el redimensionado en procesos. Necesita Pillow.
+
+Uso:
+  python scripts/blog.py images              # localiza las portadas nuevas
+  python scripts/blog.py images --dry-run    # solo dice cuántas hay
+"""
+
+import os
+import io
+import re
+import json
+import hashlib
+import argparse
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import http_pool
+from . import post_index
+from .common import POSTS_DIR, PROJECT_ROOT
+
+IMAGES_DIR = PROJECT_ROOT / 'assets' / 'images' / 'posts'
+SOURCES_FILE = IMAGES_DIR / '.sources.json'
+VARIANTS_FILE = IMAGES_DIR / '.variants.json'
+IMAGES_URL = '/assets/images/posts'
+
+WIDTHS = (400, 800, 1200)
+MAIN_WIDTH = 800
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+DOWNLOAD_WORKERS = int(os.environ.get('IMAGE_DOWNLOAD_WORKERS', 8))
+# Pollinations genera la imagen al pedirla: puede tardar bastante
+DOWNLOAD_TIMEOUT = 120
+MAX_REDIRECTS = 5
+
+IMAGE_LINE_RE = re.compile(r'^image: *"?([^"\r\n]*)"? *(\r?)$', re.MULTILINE)
+
+def variant_name(digest, width, extension):
+    return f"{digest}-{width}.{extension}"
+
+def variant_widths(source_width):
+    """Anchos a generar para una imagen de `source_width` px: nunca más anchos que el original."""
+    return [width for width in WIDTHS if width <= source_width] or [source_width]
+
+def main_width(widths):
+    """Ancho de la variante que va en image:, la de MAIN_WIDTH o la mayor por debajo."""
+    return max([width for width in widths if width <= MAIN_WIDTH] or [min(widths)])
+
+def has_variants(digest, variants):
+    """True si el hash tiene registrados sus anchos y existen todas sus variantes."""
+    widths = variants.get(digest)
+    return bool(widths) and all((IMAGES_DIR / variant_name(digest, width, extension)).exists()
+                                for width in widths for extension in ('webp', 'jpg'))
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_json(path, data):
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def load_sources():
+    return _load_json(SOURCES_FILE)
+
+def save_sources(sources):
+    _save_json(SOURCES_FILE, sources)
+
+def load_variants():
+    return _load_json(VARIANTS_FILE)
+
+def save_variants(variants):
+    _save_json(VARIANTS_FILE, variants)
+
+def download(url):
+    """Descarga la imagen siguiendo redirecciones; devuelve los bytes."""
+    for _ in range(MAX_REDIRECTS + 1):
+        status, headers, data = http_pool.request(
+            'GET', url, headers={'User-Agent': 'nachoweb3-blog/1.0'}, timeout=DOWNLOAD_TIMEOUT)
+        if status in (301, 302, 303, 307, 308) and headers.get('Location'):
+            url = urllib.parse.urljoin(url, headers['Location'])
+            continue
+        if status >= 400:
+            raise OSError(f"HTTP {status}")
+        if not headers.get('Content-Type', '').startswith('image/'):
+            raise OSError(f"no es una imagen ({headers.get('Content-Type')})")
+        return data
+    raise OSError("demasiadas redirecciones")
+
+def build_variants(digest, data):
+    """Worker: genera las variantes WebP y JPEG de una imagen (escritura atómica).
+
+    Devuelve (hash, anchos generados).
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = original.convert('RGB')
+
+    widths = variant_widths(image.width)
+    for width in widths:
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+        for extension, options in (('webp', {'format': 'WEBP', 'quality': WEBP_QUALITY, 'method': 6}),
+                                   ('jpg', {'format': 'JPEG', 'quality': JPEG_QUALITY,
+                                            'optimize': True, 'progressive': True})):
+            path = IMAGES_DIR / variant_name(digest, width, extension)
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            resized.save(tmp_path, **options)
+            os.replace(tmp_path, path)
+    return digest, widths
+
+def localize_post(filename, url, digest, widths):
+    """Cambia el image: del post por la variante local y apunta el hash, sus anchos y la URL original."""
+    path = POSTS_DIR / filename
+    # newline='' conserva los finales de línea del archivo (hay posts con CRLF)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+
+    match = IMAGE_LINE_RE.search(text)
+    if not match or match.group(1) != url:
+        return False
+    eol = match.group(2) + '\n'
+    lines = (f'image: "{IMAGES_URL}/{variant_name(digest, main_width(widths), "jpg")}"{eol}'
+             f'image_hash: "{digest}"{eol}'
+             f'image_widths: [{", ".join(str(width) for width in widths)}]{eol}'
+             f'image_source: "{url}"{match.group(2)}')
+    text = text[:match.start()] + lines + text[match.end():]
+
+    tmp_path = POSTS_DIR / f".{filename}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+def remote_images():
+    """{url: [posts]} de los posts cuya portada sigue siendo remota."""
+    pending = {}
+    for post in post_index.all_posts():
+        image = post.get('image') or ''
+        if image.startswith(('http://', 'https://')):
+            pending.setdefault(image, []).append(post['path'])
+    return pending
+
+def localize(dry_run=False):
+    """Descarga las URLs nuevas, genera sus variantes y reescribe los posts.
+
+    Devuelve (posts actualizados, URLs que fallaron).
+    """
+    pending = remote_images()
+    sources = load_sources()
+    variants = load_variants()
+    new_urls = [url for url in pending if not (url in sources and has_variants(sources[url], variants))]
+    print(f"🖼️  {sum(len(posts) for posts in pending.values())} post(s) con portada remota, "
+          f"{len(pending)} URL(s) distintas, {len(new_urls)} por descargar")
+    if dry_run or not pending:
+        return 0, []
+
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    failed = []
+    downloaded = {}
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        futures = {executor.submit(download, url): url for url in new_urls}
+        for future in futures:
+            url = futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                print(f"⚠️  No se pudo descargar {url[:80]}: {e}")
+                failed.append(url)
+                continue
+            digest = hashlib.sha256(data).hexdigest()[:16]
+            sources[url] = digest
+            # Misma imagen desde otra URL: ya tiene sus variantes
+            if not has_variants(digest, variants):
+                downloaded[digest] = data
+    print(f"⬇️  {len(new_urls) - len(failed)} descargada(s), {len(downloaded)} imagen(es) nuevas")
+
+    if downloaded:
+        with ProcessPoolExecutor() as executor:
+            futures = {executor.submit(build_variants, digest, data): digest
+                       for digest, data in downloaded.items()}
+            for future in futures:
+                try:
+                    digest, widths = future.result()
+                    variants[digest] = widths
+                except Exception as e:
+                    print(f"⚠️  No se pudieron generar las variantes de {futures[future]}: {e}")
+                    for url, digest in list(sources.items()):
+                        if digest == futures[future]:
+                            del sources[url]
+                            failed.append(url)
+    save_variants(variants)
+    save_sources(sources)
+
+    updated = 0
+    for url, posts in pending.items():
+        if url not in sources or sources[url] not in variants:
+            continue
+        for filename in posts:
+            updated += localize_post(filename, url, sources[url], variants[sources[url]])
+    post_index.refresh()
+    print(f"✅ {updated} post(s) apuntan ahora a {IMAGES_URL}/")
+    return updated, failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='blog.py images',
+        description='Descarga las portadas remotas y genera variantes locales WebP/JPEG'
+    )
+    parser.add_argument('--dry-run', action='store_true', help='Solo cuenta las portadas por localizar')
+    args = parser.parse_args(argv)
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("ERROR: Falta Pillow. Instálalo con: pip install Pillow")
+        return 1
+
+    _, failed = localize(args.dry_run)
+    if failed:
+        print(f"⚠️  {len(failed)} URL(s) siguen remotas; se reintentarán en la próxima ejecución")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    exit(main())
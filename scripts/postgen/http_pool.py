@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Pool de conexiones HTTP keep-alive compartido por los scripts de generación.
+
+urllib.request abre una conexión TCP+TLS nueva en cada llamada. Aquí se
+guardan las conexiones ya abiertas por host (http.client, sin dependencias
+externas) y se reutilizan en las siguientes peticiones, de modo que en un
+batch solo se paga el handshake una vez por host y por conexión paralela.
+
+- HTTP_POOL_SIZE: conexiones inactivas que se guardan por host (por defecto 4)
+- stats() / print_stats(): aciertos y fallos del pool y tiempo de handshake
+- cancel_on(event): las peticiones del hilo se abandonan antes de enviarse
+  si el evento está activo (lo usa el hedging para frenar al perdedor)
+"""
+
+import os
+import io
+import json
+import time
+import threading
+import http.client
+import urllib.error
+import urllib.parse
+
+POOL_SIZE = int(os.environ.get('HTTP_POOL_SIZE', 4))
+
+_idle = {}
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'handshake_seconds': 0.0}
+_local = threading.local()
+
+class Cancelled(Exception):
+    """La petición se abandonó antes de enviarse porque ya no hace falta."""
+
+def cancel_on(event):
+    """Las peticiones que haga este hilo a partir de ahora se cancelan si `event` está activo."""
+    _local.cancel = event
+
+# Errores que indican que el servidor cerró una conexión reutilizada
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError
+)
+
+def _host_key(parsed):
+    port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    return (parsed.scheme, parsed.hostname, port)
+
+def _acquire(key, timeout):
+    """Devuelve (conexión, reutilizada) para el host indicado."""
+    with _lock:
+        idle = _idle.get(key)
+        if idle:
+            conn = idle.pop()
+            _stats['hits'] += 1
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        _stats['misses'] += 1
+
+    scheme, host, port = key
+    if scheme == 'https':
+        conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+    else:
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    start = time.monotonic()
+    conn.connect()
+    elapsed = time.monotonic() - start
+    with _lock:
+        _stats['handshake_seconds'] += elapsed
+    return conn, False
+
+def _release(key, conn):
+    """Devuelve la conexión al pool si queda sitio; si no, la cierra."""
+    with _lock:
+        idle = _idle.setdefault(key, [])
+        if len(idle) < POOL_SIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+def request(method, url, body=None, headers=None, timeout=30):
+    """Hace una petición reutilizando una conexión del pool.
+
+    Devuelve (status, headers, body_bytes). Si una conexión reutilizada
+    resulta estar cerrada por el servidor, se reintenta una vez con otra nueva.
+    """
+    parsed = urllib.parse.urlsplit(url)
+    key = _host_key(parsed)
+    path = parsed.path or '/'
+    if parsed.query:
+        path += '?' + parsed.query
+
+    headers = dict(headers or {})
+    headers.setdefault('Connection', 'keep-alive')
+
+    for attempt in range(2):
+        # Lo que ya se envió se paga igual; lo que aún no, se puede ahorrar
+        cancel = getattr(_local, 'cancel', None)
+        if cancel is not None and cancel.is_set():
+            raise Cancelled(f"{method} {url} cancelada antes de enviarse")
+        conn, reused = _acquire(key, timeout)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except _STALE_ERRORS:
+            conn.close()
+            if reused and attempt == 0:
+                continue
+            raise
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            _release(key, conn)
+        return response.status, response.headers, data
+
+def _raise_for_status(url, status, response_headers, data):
+    if status >= 400:
+        raise urllib.error.HTTPError(url, status, http.client.responses.get(status, ''),
+                                     response_headers, io.BytesIO(data))
+
+def post_json(url, data, headers=None, timeout=30, with_headers=False):
+    """POST con cuerpo JSON; devuelve la respuesta JSON decodificada.
+
+    Con with_headers=True devuelve (respuesta, cabeceras).
+    """
+    headers = dict(headers or {})
+    headers.setdefault('Content-Type', 'application/json')
+    body = json.dumps(data).encode('utf-8')
+
+    status, response_headers, payload = request('POST', url, body, headers, timeout)
+    _raise_for_status(url, status, response_headers, payload)
+    result = json.loads(payload.decode('utf-8'))
+    if with_headers:
+        return result, response_headers
+    return result
+
+def get_json(url, params=None, headers=None, timeout=30):
+    """GET con parámetros de query; devuelve la respuesta JSON decodificada."""
+    if params:
+        url = f"{url}?{urllib.parse.urlencode(params)}"
+
+    status, response_headers, payload = request('GET', url, None, headers, timeout)
+    _raise_for_status(url, status, response_headers, payload)
+    return json.loads(payload.decode('utf-8'))
+
+def stats():
+    """Contadores del pool en este proceso."""
+    with _lock:
+        return dict(_stats)
+
+def print_stats():
+    """Muestra cuántas conexiones se reutilizaron y el handshake ahorrado estimado."""
+    current = stats()
+    if not current['hits'] and not current['misses']:
+        return
+
+    misses = current['misses']
+    avg_handshake = current['handshake_seconds'] / misses if misses else 0
+    print(f"🔌 Pool HTTP: {current['hits']} reutilizadas, {misses} nuevas "
+          f"(~{current['hits'] * avg_handshake:.2f}s de handshake ahorrados)")
+
+def close_all():
+    """Cierra todas las conexiones inactivas del pool."""
+    with _lock:
+        connections = [conn for idle in _idle.values() for conn in idle]
+        _idle.clear()
+    for conn in connections:
+        conn.close()
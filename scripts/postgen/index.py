@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Comando `blog.py index`: actualiza el índice SQLite de _posts/ y muestra un resumen.
+
+Uso:
+  python scripts/blog.py index             # refresco incremental + resumen
+  python scripts/blog.py index --rebuild   # descarta el índice y lo reconstruye
+"""
+
+import argparse
+import time
+
+from . import post_index
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='blog.py index',
+        description='Actualiza el índice del front matter de _posts/'
+    )
+    parser.add_argument('--rebuild', action='store_true', help='Reconstruye el índice desde cero')
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        post_index.connect().execute("DELETE FROM posts")
+
+    start = time.monotonic()
+    post_index.refresh(verbose=True)
+    print(f"⏱️  Refresco en {(time.monotonic() - start) * 1000:.1f} ms\n")
+
+    post_index.print_stats()
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
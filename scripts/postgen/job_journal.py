@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Diario de trabajos de generación: cada post es un trabajo con etapas.
+
+Cada etapa terminada se guarda en scripts/.cache/jobs/<id>.json (POST_JOBS_DIR
+para cambiarlo) en cuanto termina: metadata, contenido, URL de la imagen,
+archivo escrito, entrada en la cola de publicación, SHA del commit y push.
+Si el proceso muere a mitad, la siguiente ejecución con el mismo tema y
+fecha (o `blog.py resume`) sigue desde la última etapa completada en lugar
+de volver a pagar las llamadas al LLM o de escribir un segundo archivo.
+
+El id del trabajo sale de la fecha y el slug del tema, así que relanzar el
+mismo batch es idempotente: los posts ya escritos no se regeneran.
+"""
+
+import os
+import json
+import time
+from pathlib import Path
+
+from .common import POSTS_DIR, SCRIPTS_DIR, slugify
+
+JOBS_DIR = Path(os.environ.get('POST_JOBS_DIR', SCRIPTS_DIR / '.cache' / 'jobs'))
+
+STAGES = ('metadata', 'content', 'image_url', 'written', 'queued', 'committed', 'pushed')
+
+# Los trabajos publicados se borran del diario pasado este tiempo
+KEEP_FINISHED_DAYS = 30
+
+def job_id(file_date, topic):
+    return f"{file_date}-{slugify(topic)}"
+
+def _path(identifier):
+    return JOBS_DIR / f"{identifier}.json"
+
+def load(identifier):
+    """Lee un trabajo del diario o None si no existe (o está corrupto)."""
+    try:
+        with open(_path(identifier), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save(job):
+    """Guarda el trabajo de forma atómica (temporal + rename)."""
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+    path = _path(job['id'])
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(job, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def last_stage(job):
+    """Última etapa completada (en el orden de STAGES) o None."""
+    done = [stage for stage in STAGES if stage in job['stages']]
+    return done[-1] if done else None
+
+def is_finished(job):
+    return 'pushed' in job['stages']
+
+def start(command, topic, category, file_date, date_str, options=None, identifier=None):
+    """Abre el trabajo del tema y fecha, retomándolo si ya estaba en el diario.
+
+    Si el archivo que escribió ya no existe (se borró tras revisarlo), el
+    trabajo empieza de cero. identifier sustituye al id por fecha y tema
+    cuando la fecha aún puede cambiar (temas programados).
+    """
+    identifier = identifier or job_id(file_date, topic)
+    job = load(identifier)
+
+    if job and job['command'] == command:
+        written = job['stages'].get('written')
+        if written and not (POSTS_DIR / written).exists():
+            print(f"🗑️  {written} ya no existe; el trabajo {identifier} empieza de cero")
+        else:
+            if job['stages']:
+                print(f"↩️  Retomando trabajo {identifier} (última etapa: {last_stage(job)})")
+            return job
+
+    job = {
+        'id': identifier,
+        'command': command,
+        'topic': topic,
+        'category': category,
+        'file_date': file_date,
+        'date': date_str,
+        'options': options or {},
+        'stages': {},
+        'created_at': time.time(),
+        'updated_at': time.time()
+    }
+    save(job)
+    return job
+
+def complete(job, stage, value):
+    """Marca la etapa como terminada con su resultado y lo guarda en disco."""
+    job['stages'][stage] = value
+    job['updated_at'] = time.time()
+    job.pop('error', None)
+    save(job)
+
+def fail(job, error):
+    """Apunta el error del último intento; las etapas terminadas se conservan."""
+    job['error'] = str(error)
+    job['updated_at'] = time.time()
+    save(job)
+
+def all_jobs():
+    """Todos los trabajos del diario, del más antiguo al más reciente."""
+    if not JOBS_DIR.is_dir():
+        return []
+    jobs = []
+    for path in JOBS_DIR.glob('*.json'):
+        job = load(path.stem)
+        if job:
+            jobs.append(job)
+    return sorted(jobs, key=lambda job: job['created_at'])
+
+def unfinished_jobs():
+    return [job for job in all_jobs() if not is_finished(job)]
+
+def record_commit(filenames, sha):
+    """Apunta el SHA del commit en los trabajos de los posts comiteados."""
+    filenames = set(filenames)
+    for job in all_jobs():
+        if job['stages'].get('written') in filenames and 'committed' not in job['stages']:
+            complete(job, 'committed', sha)
+
+def record_push():
+    """Marca como subidos los trabajos comiteados y limpia los publicados antiguos."""
+    cutoff = time.time() - KEEP_FINISHED_DAYS * 86400
+    for job in all_jobs():
+        if 'committed' in job['stages'] and not is_finished(job):
+            complete(job, 'pushed', True)
+        elif is_finished(job) and job['updated_at'] < cutoff:
+            _path(job['id']).unlink(missing_ok=True)
+
+def print_status(jobs=None):
+    """Lista los trabajos sin terminar con su última etapa."""
+    jobs = unfinished_jobs() if jobs is None else jobs
+    print(f"📒 Trabajos sin terminar: {len(jobs)}")
+    for job in jobs:
+        stage = last_stage(job) or 'sin empezar'
+        error = f" ⚠️  {job['error']}" if job.get('error') else ''
+        print(f"   • [{job['command']}] {job['id']} - {stage}{error}")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Caché en disco de respuestas de LLM para los scripts de generación.
+
+Cada respuesta se guarda en scripts/.cache/llm/ con una clave derivada de
+proveedor, modelo, hash del prompt, temperature y max_tokens. Si el push a
+GitHub falla y se vuelve a lanzar el script, el texto ya generado sale de
+aquí en milisegundos en lugar de pedirlo otra vez a la API.
+
+El tamaño total está acotado (LLM_CACHE_MAX_BYTES, 50 MB por defecto): al
+superarlo se borran las entradas usadas hace más tiempo (LRU por mtime).
+
+Modos:
+- normal: lee y escribe en la caché
+- --refresh: ignora lo guardado pero guarda la nueva respuesta
+- --no-cache: ni lee ni escribe
+"""
+
+import os
+import json
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get('LLM_CACHE_DIR', Path(__file__).resolve().parent.parent / '.cache' / 'llm'))
+MAX_BYTES = int(os.environ.get('LLM_CACHE_MAX_BYTES', 50 * 1024 * 1024))
+
+_mode = 'off' if os.environ.get('LLM_CACHE', '').lower() in ('0', 'off', 'no') else 'on'
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+def configure(no_cache=False, refresh=False):
+    """Ajusta el modo de la caché según los flags --no-cache / --refresh."""
+    global _mode
+    if no_cache:
+        _mode = 'off'
+    elif refresh:
+        _mode = 'refresh'
+
+def configure_from_argv(argv):
+    """Lee --no-cache y --refresh de una lista de argumentos sin argparse."""
+    configure(no_cache='--no-cache' in argv, refresh='--refresh' in argv)
+
+def cache_key(provider, model, prompt, temperature, max_tokens):
+    """Clave de contenido: mismos parámetros y mismo prompt dan la misma clave."""
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    raw = json.dumps([provider, model, prompt_hash, temperature, max_tokens])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def _entry_path(key):
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+def get(provider, model, prompt, temperature, max_tokens):
+    """Devuelve la respuesta guardada o None si no existe (o la caché no se lee)."""
+    if _mode != 'on':
+        return None
+
+    path = _entry_path(cache_key(provider, model, prompt, temperature, max_tokens))
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        # Marcar como usada recientemente para el LRU
+        os.utime(path)
+    except (OSError, ValueError):
+        _stats['misses'] += 1
+        return None
+
+    _stats['hits'] += 1
+    return entry.get('response')
+
+def contains(provider, model, prompt, temperature, max_tokens):
+    """True si hay una entrada que get() devolvería (no cuenta como acierto ni fallo)."""
+    return _mode == 'on' and _entry_path(cache_key(provider, model, prompt, temperature, max_tokens)).exists()
+
+def put(provider, model, prompt, temperature, max_tokens, response):
+    """Guarda una respuesta y recorta la caché si supera MAX_BYTES."""
+    if _mode == 'off' or not response:
+        return
+
+    key = cache_key(provider, model, prompt, temperature, max_tokens)
+    path = _entry_path(key)
+    entry = {
+        'provider': provider,
+        'model': model,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+        'created': time.time(),
+        'response': response
+    }
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  No se pudo guardar en la caché de LLM: {e}")
+        return
+
+    evict(MAX_BYTES)
+
+def evict(max_bytes):
+    """Borra las entradas menos usadas hasta que la caché ocupe como mucho max_bytes."""
+    with _lock:
+        entries = []
+        total = 0
+        for path in CACHE_DIR.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        return removed
+
+def cached_call(provider, model, prompt, temperature, max_tokens, generate, is_valid=None, refresh=False):
+    """Devuelve la respuesta cacheada o llama a `generate()` y guarda su resultado.
+
+    `generate` debe devolver el texto generado o None si la llamada falló;
+    los fallos nunca se guardan. Con is_valid tampoco se guarda una respuesta
+    que no lo pase, y una entrada guardada que no lo pase (de antes de
+    validar) cuenta como fallo de caché. refresh=True no lee la caché (un
+    reintento tiene que llegar a la API) pero guarda la nueva respuesta.
+    """
+    response = None if refresh else get(provider, model, prompt, temperature, max_tokens)
+    if response is not None:
+        if is_valid is None or is_valid(response):
+            print(f"♻️  Respuesta recuperada de la caché ({provider}/{model})")
+            return response
+        _stats['hits'] -= 1
+        _stats['misses'] += 1
+
+    response = generate()
+    if response and (is_valid is None or is_valid(response)):
+        put(provider, model, prompt, temperature, max_tokens, response)
+    return response
+
+def stats():
+    """Contadores de aciertos y fallos de la caché en este proceso."""
+    return dict(_stats)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Metadata (título, excerpt y tags) inferida localmente a partir del blog.
+
+Sustituye la llamada al LLM que solo devolvía esos tres campos:
+- tags: vocabulario TF-IDF construido con los títulos, excerpts y tags de
+  _posts/ (vía el índice de posts). Cada término del tema vota por los tags
+  con los que suele aparecer, ponderado por su IDF. Antes se quitan los
+  adjetivos y palabras genéricas (modernas, nuevas, studio...) y los tags
+  que solo se diferencian en el plural o las mayúsculas cuentan como uno
+- excerpt: la frase del contenido con mejor puntuación TF-IDF y más
+  términos del tema, recortada a EXCERPT_MAX caracteres
+- título: el tema con longitud SEO forzada (TITLE_MIN-TITLE_MAX caracteres)
+
+Todo sale en milisegundos; el LLM queda como refinamiento opcional.
+"""
+
+import math
+import re
+from collections import Counter
+
+from . import post_index
+from .common import CATEGORIES, slugify
+from .topic_dedup import STOPWORDS, WORD_RE, normalize, terms
+
+TITLE_MIN = 30
+TITLE_MAX = 60
+EXCERPT_MAX = 160
+MAX_TAGS = 6
+MIN_TAGS = 4
+
+# Coletillas para alargar títulos demasiado cortos, por categoría
+TITLE_SUFFIXES = {
+    'ia': ': todo lo que debes saber',
+    'blockchain': ': guía completa',
+    'tutoriales': ': guía paso a paso'
+}
+
+# Palabras del tema que no dicen de qué va el post: nunca son un tag por sí solas
+TAG_STOPWORDS = {
+    'moderno', 'moderna', 'nuevo', 'nueva', 'actual', 'avanzado', 'avanzada', 'basico',
+    'basica', 'practico', 'practica', 'facil', 'rapido', 'rapida', 'simple', 'sencillo',
+    'gran', 'grande', 'principal', 'importante', 'real', 'futuro', 'tendencia', 'clave',
+    'herramienta', 'aplicacion', 'forma', 'manera', 'tipo', 'ejemplo', 'caso', 'uso',
+    'programar', 'usar', 'crear', 'aprender', 'entender', 'ganar', 'empezar', 'dominar',
+    'code', 'studio', 'app', 'tool', 'new', 'best', 'pro', 'free', 'how', 'what', 'why',
+    '2024', '2025', '2026'
+}
+
+# Participios y adverbios (explicados, descentralizadas, rápidamente)
+ADJECTIVE_RE = re.compile(r'(?:ad|id)[oa]s?$|mente$')
+
+SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Palabras con las que un título recortado no debe terminar
+TRAILING_WORDS = STOPWORDS | {'e', 'ni', 'u', 'tus', 'mis', 'sus', 'vs.'}
+
+_model = {}
+
+def build_model():
+    """Vocabulario del blog: IDF por término, co-ocurrencias término→tag y tags por categoría."""
+    posts = post_index.all_posts()
+    document_frequency = Counter()
+    term_tags = {}
+    category_tags = {}
+    tag_frequency = Counter()
+
+    for post in posts:
+        post_terms = set(terms(f"{post['title'] or ''} {post['excerpt'] or ''}"))
+        for tag in post['tags']:
+            post_terms.update(terms(tag.replace('-', ' ')))
+        document_frequency.update(post_terms)
+
+        for term in post_terms:
+            term_tags.setdefault(term, Counter()).update(post['tags'])
+        for category in post['categories']:
+            category_tags.setdefault(category, Counter()).update(post['tags'])
+        tag_frequency.update(post['tags'])
+
+    # Forma canónica -> grafía del blog, mejor en formato slug y la más usada
+    tag_keys = {}
+    for tag in sorted(tag_frequency, key=lambda tag: (tag != slugify(tag), -tag_frequency[tag], tag)):
+        tag_keys.setdefault(tag_key(tag), tag)
+
+    total = max(len(posts), 1)
+    _model.update({
+        'idf': {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()},
+        'default_idf': math.log(1 + total) + 1,
+        'term_tags': term_tags,
+        'category_tags': category_tags,
+        'tag_frequency': tag_frequency,
+        'tag_keys': tag_keys,
+        'posts': total
+    })
+    return _model
+
+def model():
+    return _model if _model else build_model()
+
+def idf(term):
+    current = model()
+    return current['idf'].get(term, current['default_idf'])
+
+def surface_words(text):
+    """término normalizado -> palabra tal como aparece (sin tildes), para no crear tags truncados."""
+    words = {}
+    for word in WORD_RE.findall(normalize(text)):
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        for term in terms(word):
+            words.setdefault(term, word)
+    return words
+
+def tag_key(tag):
+    """Forma canónica de un tag: slug con cada palabra en singular ('Rollups' → 'rollup')."""
+    words = []
+    for word in slugify(tag).split('-'):
+        if len(word) > 5 and word.endswith('iones'):
+            word = word[:-2]
+        elif len(word) > 4 and word.endswith('s'):
+            word = word[:-1]
+        words.append(word)
+    return '-'.join(words)
+
+def is_tag_term(term):
+    """Un término del tema puede dar tag si no es un adjetivo o una palabra genérica."""
+    return tag_key(term) not in TAG_STOPWORDS and not ADJECTIVE_RE.search(term)
+
+def merge_tags(scores):
+    """Suma los tags con la misma forma canónica y se queda con la grafía que usa el blog."""
+    current = model()
+    merged = Counter()
+    for tag, score in scores.items():
+        key = tag_key(tag)
+        if key:
+            merged[current['tag_keys'].get(key, tag)] += score
+    return merged
+
+def infer_tags(topic, category, content=None):
+    """4-6 tags en formato slug, priorizando los que ya usa el blog."""
+    current = model()
+    topic_terms = [term for term in terms(topic) if is_tag_term(term)]
+    scores = Counter()
+
+    # Cada término del tema vota por los tags con los que aparece en el blog
+    for term in set(topic_terms):
+        related = current['term_tags'].get(term)
+        if not related:
+            continue
+        total = sum(related.values())
+        for tag, count in related.items():
+            scores[tag] += idf(term) * count / total
+
+    # Términos del tema que son un tag del blog o poco frecuentes (p. ej. solana)
+    words = surface_words(topic)
+    for term in set(topic_terms):
+        if term in current['tag_frequency']:
+            scores[term] += idf(term)
+        elif idf(term) >= current['default_idf'] - 1:
+            scores[slugify(words.get(term, term))] += idf(term)
+
+    # Lo más repetido del contenido aporta un poco si ya es un tag del blog
+    if content:
+        for term, count in Counter(terms(content)).most_common(30):
+            if term in current['tag_frequency']:
+                scores[term] += 0.1 * idf(term) * math.log(1 + count)
+
+    tags = [tag for tag, _ in merge_tags(scores).most_common()][:MAX_TAGS]
+
+    # Completar con los tags habituales de la categoría
+    fallback = [tag for tag, _ in current['category_tags'].get(category, Counter()).most_common()]
+    fallback += CATEGORIES.get(category, {}).get('tags_comunes', [])
+    keys = {tag_key(tag) for tag in tags}
+    for tag in fallback:
+        if len(tags) >= MIN_TAGS:
+            break
+        if tag_key(tag) not in keys:
+            tags.append(tag)
+            keys.add(tag_key(tag))
+
+    return tags[:MAX_TAGS]
+
+def fit_length(text, limit):
+    """Recorta en el último límite de palabra antes de `limit` caracteres."""
+    text = ' '.join(text.split())
+    if len(text) <= limit:
+        return text
+    words = text[:limit - 1].split(' ')
+    # La última palabra quedó a medias si el corte no cae justo antes de un espacio
+    if text[limit - 1] != ' ' and len(words) > 1:
+        words.pop()
+    # Tampoco se termina en una palabra suelta ("... de desarrollo con…")
+    while len(words) > 1 and normalize(words[-1].rstrip(',;:')) in TRAILING_WORDS:
+        words.pop()
+    return ' '.join(words).rstrip(' ,;:-—(') + '…'
+
+def enforce_title(topic, category):
+    """Título SEO: mayúscula inicial y entre TITLE_MIN y TITLE_MAX caracteres."""
+    title = ' '.join(topic.split()).strip(' .')
+    title = title[:1].upper() + title[1:]
+
+    if len(title) > TITLE_MAX:
+        # Mejor cortar por un separador natural que a mitad de frase
+        for separator in (':', ' - ', ' — ', ' (', ','):
+            head = title.split(separator, 1)[0]
+            if TITLE_MIN <= len(head) <= TITLE_MAX:
+                return head
+        return fit_length(title, TITLE_MAX)
+
+    suffix = TITLE_SUFFIXES.get(category, '')
+    if len(title) < TITLE_MIN and suffix and not re.search(r'[:?¿!]', title):
+        if len(title) + len(suffix) <= TITLE_MAX:
+            title += suffix
+    return title
+
+def content_sentences(content):
+    """Frases del cuerpo, sin headers, listas, tablas ni bloques de código."""
+    sentences = []
+    in_code = False
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code or not stripped or stripped.startswith(('#', '-', '*', '|', '>')) or stripped[0].isdigit():
+            continue
+        plain = re.sub(r'[*_`\[\]]|\(http[^)]*\)', '', stripped)
+        sentences.extend(s.strip() for s in SENTENCE_RE.split(plain) if len(s.split()) >= 6)
+    return sentences
+
+def infer_excerpt(topic, content=None):
+    """Frase más representativa del contenido (o plantilla si no hay contenido)."""
+    if content:
+        topic_terms = set(terms(topic))
+        best = None
+        for position, sentence in enumerate(content_sentences(content)[:40]):
+            sentence_terms = terms(sentence)
+            # Una frase que presenta una lista ("...ofrece:") no sirve sola
+            if not sentence_terms or sentence.endswith(':'):
+                continue
+            weight = sum(idf(term) for term in sentence_terms) / len(sentence_terms)
+            overlap = len(topic_terms & set(sentence_terms))
+            # Las primeras frases suelen resumir mejor el artículo
+            score = weight + 2 * overlap - 0.05 * position
+            if len(sentence) > EXCERPT_MAX * 1.5:
+                score -= 1
+            if best is None or score > best[0]:
+                best = (score, sentence)
+        if best:
+            return fit_length(best[1], EXCERPT_MAX)
+
+    return fit_length(f"Descubre todo sobre {topic}: conceptos clave, aplicaciones y las últimas tendencias.",
+                      EXCERPT_MAX)
+
+def infer_metadata(topic, category, content=None):
+    """Metadata completa sin llamadas de red: {'title', 'excerpt', 'tags'}."""
+    return {
+        'title': enforce_title(topic, category),
+        'excerpt': infer_excerpt(topic, content),
+        'tags': infer_tags(topic, category, content)
+    }
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Elección de modelo y de max_tokens según la tarea.
+
+Cada llamada al LLM declara su ruta ('content', 'section', 'metadata',
+'outline', 'transition'). El contenido sigue yendo al modelo grande; las
+tareas cortas y estructuradas van primero a un modelo pequeño y rápido
+(LLM_SMALL_MODEL), con el grande como alternativa.
+
+max_tokens sale del propio prompt: el rango de palabras que pide ("entre
+800-1200 palabras", "unas 200 palabras") por TOKENS_PER_WORD (español con el
+tokenizador de Llama, ~1.7 tokens por palabra) más un margen, o los límites
+de caracteres ("máximo 160 caracteres") para las respuestas JSON, sin bajar
+nunca del valor por defecto de quien llama (la metadata no tiene
+continuación: un JSON cortado no se recupera). Si algo queda cortado, la
+continuación automática lo completa.
+
+De cada llamada se guarda, por ruta y modelo, la latencia y si la respuesta
+valió (en scripts/.cache/model_routes.json). Un modelo que falla a menudo
+en una ruta queda relegado detrás de los demás; de vez en cuando se prueba
+otro candidato para que un modelo relegado pueda recuperarse, salvo si la
+caché ya tiene la respuesta de uno de ellos (el modelo es parte de la clave).
+"""
+
+import os
+import re
+import json
+import math
+import time
+import random
+import threading
+from pathlib import Path
+
+from . import http_pool
+from . import llm_cache
+from .provider_router import percentile
+
+STATS_FILE = Path(__file__).resolve().parent.parent / '.cache' / 'model_routes.json'
+
+LARGE_MODEL = os.environ.get('LLM_LARGE_MODEL', 'llama-3.3-70b-versatile')
+SMALL_MODEL = os.environ.get('LLM_SMALL_MODEL', 'llama-3.1-8b-instant')
+
+# Candidatos por ruta, en orden de preferencia
+ROUTES = {
+    'content': [LARGE_MODEL],
+    'section': [LARGE_MODEL],
+    'metadata': [SMALL_MODEL, LARGE_MODEL],
+    'outline': [SMALL_MODEL, LARGE_MODEL],
+    'transition': [SMALL_MODEL, LARGE_MODEL]
+}
+
+TOKENS_PER_WORD = float(os.environ.get('LLM_TOKENS_PER_WORD', 1.7))
+CHARS_PER_TOKEN = 3.5
+TOKEN_MARGIN = 0.15
+# Headers markdown y bloques de código en el contenido; claves y tags en el JSON
+MARKDOWN_TOKENS = 100
+JSON_TOKENS = 50
+
+MAX_SAMPLES = 50
+OUTCOME_WINDOW = 20
+MIN_SAMPLES = 5
+DEMOTE_FAILURE_RATE = 0.3
+FAILURE_PENALTY = 4
+EXPLORE_RATE = 0.1
+
+WORD_RANGE_RE = re.compile(r'(\d+)\s*(?:-|a|y)\s*(\d+)\s+palabras')
+WORD_COUNT_RE = re.compile(r'(?:unas|máximo|hasta)\s+(\d+)\s+palabras')
+CHAR_LIMIT_RE = re.compile(r'máximo\s+(\d+)\s+caracteres')
+
+_lock = threading.Lock()
+_stats = {}
+
+def max_tokens_for(prompt, default, items=1):
+    """max_tokens para la longitud que pide el prompt; `default` si no pide ninguna.
+
+    items multiplica la parte variable cuando el prompt pide lo mismo para
+    varios elementos (metadata por lotes).
+    """
+    match = WORD_RANGE_RE.search(prompt)
+    if match:
+        words = int(match.group(2))
+    else:
+        match = WORD_COUNT_RE.search(prompt)
+        # "unas N palabras" es aproximado: se deja un 25% por encima
+        words = int(match.group(1)) * (1.25 if match and 'unas' in match.group(0) else 1) if match else 0
+
+    if words:
+        return math.ceil(words * items * TOKENS_PER_WORD * (1 + TOKEN_MARGIN)) + MARKDOWN_TOKENS
+
+    chars = sum(int(limit) for limit in CHAR_LIMIT_RE.findall(prompt))
+    if chars:
+        # Los límites de caracteres no cuentan tags ni claves largas: solo pueden subir el default
+        return max(default, math.ceil((chars / CHARS_PER_TOKEN + JSON_TOKENS) * items * (1 + TOKEN_MARGIN)))
+    return default
+
+def _load():
+    if not _stats:
+        try:
+            with open(STATS_FILE, 'r', encoding='utf-8') as f:
+                _stats.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+    return _stats
+
+def _save():
+    try:
+        STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = STATS_FILE.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_stats, f)
+        os.replace(tmp_path, STATS_FILE)
+    except OSError as e:
+        print(f"⚠️  No se pudieron guardar las estadísticas de modelos: {e}")
+
+def record(route, model, seconds, ok):
+    """Apunta el resultado de una llamada: latencia (si valió) y acierto o fallo."""
+    with _lock:
+        entry = _load().setdefault(route, {}).setdefault(model, {'latencies': [], 'outcomes': []})
+        if ok:
+            entry['latencies'].append(round(seconds, 3))
+            del entry['latencies'][:-MAX_SAMPLES]
+        entry['outcomes'].append(1 if ok else 0)
+        del entry['outcomes'][:-OUTCOME_WINDOW]
+        _save()
+
+def model_stats(route, model):
+    """Devuelve (p50 de latencia, tasa de fallos, llamadas en la ventana)."""
+    entry = _load().get(route, {}).get(model, {})
+    outcomes = entry.get('outcomes', [])
+    failure_rate = 1 - sum(outcomes) / len(outcomes) if outcomes else 0.0
+    return percentile(entry.get('latencies', []), 50), failure_rate, len(outcomes)
+
+def is_demoted(route, model):
+    _, failure_rate, calls = model_stats(route, model)
+    return calls >= MIN_SAMPLES and failure_rate >= DEMOTE_FAILURE_RATE
+
+def ranked_models(route):
+    """Candidatos de la ruta del mejor al peor.
+
+    Primero los no relegados; entre ellos, menor latencia penalizada por la
+    tasa de fallos. Un candidato sin datos solo va delante si es el preferido.
+    """
+    candidates = ROUTES.get(route, [LARGE_MODEL])
+
+    def cost(item):
+        index, model = item
+        p50, failure_rate, _ = model_stats(route, model)
+        if p50 is None:
+            score = 0.0 if index == 0 else float('inf')
+        else:
+            score = p50 * (1 + FAILURE_PENALTY * failure_rate)
+        return (is_demoted(route, model), score, index)
+
+    return [model for _, model in sorted(enumerate(candidates), key=cost)]
+
+def choose_model(route):
+    """Modelo para la siguiente llamada de la ruta (a veces explora otro candidato)."""
+    ranked = ranked_models(route)
+    if len(ranked) > 1 and random.random() < EXPLORE_RATE:
+        return random.choice(ranked[1:])
+    return ranked[0]
+
+def plan(route, prompt, default_max_tokens, items=1, temperature=0.7):
+    """(modelo, max_tokens) para una llamada de la ruta.
+
+    Si la caché ya tiene la respuesta de algún candidato se usa ese modelo
+    (el mejor clasificado que la tenga) en lugar de explorar o cambiar de
+    modelo y tirar el acierto.
+    """
+    max_tokens = max_tokens_for(prompt, default_max_tokens, items)
+    for model in ranked_models(route):
+        if llm_cache.contains('groq', model, prompt, temperature, max_tokens):
+            return model, max_tokens
+    return choose_model(route), max_tokens
+
+class InvalidResponse(ValueError):
+    """La API respondió, pero con algo vacío o que no pasa la validación de la ruta.
+
+    `response` guarda el texto recibido por si quien llama puede aprovechar
+    una parte (la metadata por lotes se queda con los temas que sí leyó).
+    """
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+def timed(route, model, request, is_valid=None):
+    """Ejecuta request() y registra su latencia y si la respuesta valió.
+
+    Una excepción cuenta como fallo y se relanza; una respuesta vacía o que
+    no pasa is_valid cuenta como fallo de calidad y lanza InvalidResponse,
+    así que nunca llega a la caché.
+    """
+    start = time.monotonic()
+    try:
+        result = request()
+    except http_pool.Cancelled:
+        # Perdió un hedge: no dice nada de la calidad del modelo
+        raise
+    except Exception:
+        record(route, model, time.monotonic() - start, False)
+        raise
+
+    ok = bool(result) and (is_valid is None or bool(is_valid(result)))
+    record(route, model, time.monotonic() - start, ok)
+    if not ok:
+        raise InvalidResponse(f"respuesta no válida de {model} en la ruta '{route}'", result)
+    return result
+
+def has_json(text, opening='{'):
+    """True si el texto contiene un objeto (o array, con opening='[') JSON que se puede leer."""
+    closing = '}' if opening == '{' else ']'
+    match = re.search(re.escape(opening) + r'.*' + re.escape(closing), text or '', re.DOTALL)
+    if not match:
+        return False
+    try:
+        json.loads(match.group())
+    except ValueError:
+        return False
+    return True
+
+def print_report():
+    """Resumen por ruta: modelo elegido, latencia p50 y tasa de fallos."""
+    stats = _load()
+    if not stats:
+        return
+    print("🧭 Rutas de modelos:")
+    for route in sorted(stats):
+        best = ranked_models(route)[0]
+        for model in sorted(stats[route]):
+            p50, failure_rate, calls = model_stats(route, model)
+            latency = f"p50 {p50:.1f}s" if p50 is not None else "sin latencias"
+            marker = '→' if model == best else ' '
+            demoted = ' (relegado)' if is_demoted(route, model) else ''
+            print(f"   {marker} {route:<10} {model:<28} {latency}, {failure_rate:.0%} fallos en {calls}{demoted}")
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Índice incremental en SQLite del front matter de _posts/.
+
+Guarda por post: ruta, fecha, slug, título, tags, categorías, imagen,
+número de palabras y hash del contenido, en scripts/.cache/posts_index.sqlite
+(POSTS_INDEX_DB para cambiarlo). refresh() solo hace stat de cada archivo y
+vuelve a leer los que cambiaron de mtime o tamaño; el resto sale de la base
+de datos sin abrirlos. El front matter se parsea leyendo solo las líneas de
+la cabecera; el cuerpo se recorre por bloques para el hash y el recuento de
+palabras sin cargarlo entero en memoria.
+
+Quien necesite saber qué posts, slugs, títulos o tags existen debe
+preguntar aquí en lugar de recorrer el directorio.
+"""
+
+import os
+import re
+import json
+import hashlib
+import sqlite3
+from pathlib import Path
+
+from .common import POSTS_DIR, SCRIPTS_DIR
+
+DB_PATH = Path(os.environ.get('POSTS_INDEX_DB', SCRIPTS_DIR / '.cache' / 'posts_index.sqlite'))
+
+SCHEMA_VERSION = 1
+FILENAME_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})-(.+)\.(md|markdown)$')
+WORD_RE = re.compile(rb'\S+')
+READ_CHUNK = 64 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    path TEXT PRIMARY KEY,
+    file_date TEXT NOT NULL,
+    date TEXT,
+    slug TEXT NOT NULL,
+    title TEXT,
+    tags TEXT NOT NULL,
+    categories TEXT NOT NULL,
+    image TEXT,
+    excerpt TEXT,
+    word_count INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_file_date ON posts (file_date);
+CREATE INDEX IF NOT EXISTS posts_slug ON posts (slug);
+"""
+
+_conn = None
+
+def connect():
+    """Abre (una vez por proceso) la base de datos y crea el esquema si falta."""
+    global _conn
+    if _conn is not None:
+        return _conn
+
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Varios workers del programador pueden refrescarlo a la vez
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+
+    # Un esquema antiguo se descarta entero: el índice se reconstruye desde _posts
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.execute("DROP TABLE IF EXISTS posts")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+
+    _conn = conn
+    return conn
+
+def parse_value(raw):
+    """Convierte un valor YAML sencillo (texto, "texto" o [a, b]) a str o lista."""
+    raw = raw.strip()
+    if raw.startswith('[') and raw.endswith(']'):
+        return [parse_value(item) for item in raw[1:-1].split(',') if item.strip()]
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in '"\'':
+        return raw[1:-1]
+    return raw
+
+def read_post(path):
+    """Lee el front matter línea a línea y recorre el cuerpo por bloques.
+
+    Devuelve (front_matter, word_count, content_hash).
+    """
+    front_matter = {}
+    digest = hashlib.sha256()
+    word_count = 0
+
+    with open(path, 'rb') as f:
+        first = f.readline()
+        digest.update(first)
+        current_list = None
+
+        if first.strip() == b'---':
+            for line in f:
+                digest.update(line)
+                text = line.decode('utf-8', errors='replace').rstrip('\r\n')
+                if text.strip() == '---':
+                    break
+                if current_list is not None and text.lstrip().startswith('- '):
+                    current_list.append(parse_value(text.lstrip()[2:]))
+                    continue
+                if ':' not in text or text.startswith((' ', '#')):
+                    continue
+                key, value = text.split(':', 1)
+                value = value.strip()
+                if value:
+                    front_matter[key.strip()] = parse_value(value)
+                    current_list = None
+                else:
+                    current_list = front_matter[key.strip()] = []
+        else:
+            word_count += len(WORD_RE.findall(first))
+
+        # Cuerpo: hash y palabras por bloques; un bloque puede cortar una palabra
+        tail = b''
+        while True:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            digest.update(chunk)
+            data = tail + chunk
+            cut = max(data.rfind(b' '), data.rfind(b'\n'))
+            if cut == -1:
+                tail = data
+                continue
+            word_count += len(WORD_RE.findall(data[:cut]))
+            tail = data[cut:]
+        word_count += len(WORD_RE.findall(tail))
+
+    return front_matter, word_count, digest.hexdigest()
+
+def as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def index_file(conn, entry):
+    """Parsea un post y lo inserta o actualiza en el índice."""
+    match = FILENAME_RE.match(entry.name)
+    front_matter, word_count, content_hash = read_post(entry.path)
+    stat = entry.stat()
+
+    conn.execute(
+        "INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            entry.name,
+            match.group(1),
+            str(front_matter.get('date', match.group(1))),
+            match.group(2),
+            front_matter.get('title'),
+            json.dumps(as_list(front_matter.get('tags')), ensure_ascii=False),
+            json.dumps(as_list(front_matter.get('categories')), ensure_ascii=False),
+            front_matter.get('image'),
+            front_matter.get('excerpt'),
+            word_count,
+            content_hash,
+            stat.st_mtime_ns,
+            stat.st_size
+        )
+    )
+
+def refresh(verbose=False):
+    """Sincroniza el índice con _posts/ y devuelve (nuevos, actualizados, borrados).
+
+    Los archivos con el mismo mtime y tamaño que la última vez no se abren.
+    """
+    conn = connect()
+    known = {
+        row['path']: (row['mtime_ns'], row['size'])
+        for row in conn.execute("SELECT path, mtime_ns, size FROM posts")
+    }
+
+    added = updated = 0
+    seen = set()
+    if POSTS_DIR.is_dir():
+        with os.scandir(POSTS_DIR) as entries:
+            for entry in entries:
+                # Jekyll ignora los archivos ocultos (.tmp, .part...)
+                if entry.name.startswith('.') or not FILENAME_RE.match(entry.name):
+                    continue
+                seen.add(entry.name)
+
+                stat = entry.stat()
+                if known.get(entry.name) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                try:
+                    index_file(conn, entry)
+                except OSError as e:
+                    print(f"⚠️  No se pudo indexar {entry.name}: {e}")
+                    continue
+                if entry.name in known:
+                    updated += 1
+                else:
+                    added += 1
+
+    removed = [path for path in known if path not in seen]
+    conn.executemany("DELETE FROM posts WHERE path = ?", [(path,) for path in removed])
+    conn.commit()
+
+    if verbose:
+        print(f"🗂️  Índice de posts: {len(seen)} posts ({added} nuevos, {updated} actualizados, {len(removed)} borrados)")
+    return added, updated, len(removed)
+
+def _row_to_dict(row):
+    post = dict(row)
+    post['tags'] = json.loads(post['tags'])
+    post['categories'] = json.loads(post['categories'])
+    return post
+
+def all_posts():
+    """Todos los posts indexados, del más reciente al más antiguo."""
+    refresh()
+    rows = connect().execute("SELECT * FROM posts ORDER BY file_date DESC, path")
+    return [_row_to_dict(row) for row in rows]
+
+def posts_on(file_date):
+    """Posts cuyo nombre de archivo empieza por la fecha dada (YYYY-MM-DD)."""
+    refresh()
+    rows = connect().execute("SELECT * FROM posts WHERE file_date = ? ORDER BY path", (file_date,))
+    return [_row_to_dict(row) for row in rows]
+
+def find_by_slug(slug):
+    """Posts con ese slug (en cualquier fecha)."""
+    refresh()
+    rows = connect().execute("SELECT * FROM posts WHERE slug = ? ORDER BY path", (slug,))
+    return [_row_to_dict(row) for row in rows]
+
+def existing_slugs():
+    refresh()
+    return {row[0] for row in connect().execute("SELECT slug FROM posts")}
+
+def existing_titles():
+    refresh()
+    return [row[0] for row in connect().execute("SELECT title FROM posts WHERE title IS NOT NULL")]
+
+def tag_counts():
+    """Número de posts por tag, de más a menos usado."""
+    counts = {}
+    for post in all_posts():
+        for tag in post['tags']:
+            counts[tag] = counts.get(tag, 0) + 1
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+def print_stats():
+    """Resumen del índice: posts, fechas con más posts, tags y categorías."""
+    posts = all_posts()
+    print(f"🗂️  {len(posts)} posts indexados en {DB_PATH}")
+    if not posts:
+        return
+
+    by_date = {}
+    by_category = {}
+    for post in posts:
+        by_date[post['file_date']] = by_date.get(post['file_date'], 0) + 1
+        for category in post['categories']:
+            by_category[category] = by_category.get(category, 0) + 1
+
+    words = sum(post['word_count'] for post in posts)
+    print(f"📝 {words} palabras ({words // len(posts)} de media por post)")
+    print("📅 Fechas con más posts: " + ', '.join(
+        f"{day} ({count})" for day, count in sorted(by_date.items(), key=lambda item: -item[1])[:3]))
+    print("📁 Categorías: " + ', '.join(f"{name} ({count})" for name, count in sorted(by_category.items())))
+    print("🏷️  Tags más usados: " + ', '.join(
+        f"{tag} ({count})" for tag, count in list(tag_counts().items())[:10]))
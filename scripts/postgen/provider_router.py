@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Router de proveedores de contenido con peticiones "hedged".
+
+Lanza la generación en el primer proveedor y, si no ha respondido dentro
+del umbral de latencia, lanza la misma petición en el siguiente. Gana la
+primera respuesta válida. Al perdedor se le cancelan las peticiones que aún
+no haya enviado (continuaciones, reintentos por 429) a través de
+http_pool.cancel_on; la que ya esté en vuelo termina en su hilo daemon.
+Como mucho HEDGE_MAX_IN_FLIGHT peticiones hedged a la vez en el proceso:
+sin hueco, se espera al primer proveedor en lugar de duplicar la cuota.
+
+El umbral se ajusta solo: es el p95 de las latencias recientes de cada
+proveedor, guardadas en scripts/.cache/provider_latency.json. Cuenta toda
+respuesta válida, gane o pierda; con solo las ganadoras el p95 bajaría
+cada vez más y el hedge saltaría cada vez antes.
+"""
+
+import os
+import json
+import time
+import queue
+import threading
+from pathlib import Path
+
+from . import http_pool
+from . import llm_cache
+
+LATENCY_FILE = Path(__file__).resolve().parent.parent / '.cache' / 'provider_latency.json'
+MAX_SAMPLES = 100
+MIN_SAMPLES = 5
+DEFAULT_HEDGE_DELAY = float(os.environ.get('HEDGE_DELAY', 15))
+MIN_HEDGE_DELAY = 2.0
+MAX_HEDGE_DELAY = 60.0
+MAX_HEDGES_IN_FLIGHT = int(os.environ.get('HEDGE_MAX_IN_FLIGHT', 2))
+
+HUGGINGFACE_URL = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.1"
+
+_lock = threading.Lock()
+_hedge_slots = threading.BoundedSemaphore(MAX_HEDGES_IN_FLIGHT)
+
+def call_huggingface(prompt, max_new_tokens=2000):
+    """Usa Hugging Face Inference API (gratis) con Mistral 7B."""
+    data = {
+        "inputs": f"<s>[INST] {prompt} [/INST]",
+        "parameters": {
+            "max_new_tokens": max_new_tokens,
+            "temperature": 0.7,
+            "do_sample": True,
+            "return_full_text": False
+        }
+    }
+
+    def request_completion():
+        try:
+            result = http_pool.post_json(
+                HUGGINGFACE_URL,
+                data,
+                headers={
+                    'Content-Type': 'application/json'
+                },
+                timeout=30
+            )
+            if isinstance(result, list) and len(result) > 0:
+                return result[0]['generated_text'].strip()
+            else:
+                return None
+        except Exception as e:
+            print(f"Error con Hugging Face API: {e}")
+            return None
+
+    parameters = data['parameters']
+    return llm_cache.cached_call(
+        'huggingface', 'mistralai/Mistral-7B-Instruct-v0.1', data['inputs'],
+        parameters['temperature'], parameters['max_new_tokens'], request_completion,
+        is_valid_article
+    )
+
+def is_valid_article(text, min_words=150):
+    """Una respuesta vale si existe y tiene un mínimo de palabras."""
+    return bool(text) and len(text.split()) >= min_words
+
+def _load_latencies():
+    try:
+        with open(LATENCY_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def record_latency(provider, seconds):
+    """Guarda la latencia de una respuesta válida del proveedor."""
+    with _lock:
+        latencies = _load_latencies()
+        samples = latencies.setdefault(provider, [])
+        samples.append(round(seconds, 3))
+        del samples[:-MAX_SAMPLES]
+        try:
+            LATENCY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = LATENCY_FILE.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(latencies, f)
+            os.replace(tmp_path, LATENCY_FILE)
+        except OSError as e:
+            print(f"⚠️  No se pudieron guardar las latencias: {e}")
+
+def percentile(samples, pct):
+    """Percentil por el método del rango más cercano."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def latency_summary(provider):
+    """Devuelve (p50, p95, muestras) del proveedor."""
+    samples = _load_latencies().get(provider, [])
+    return percentile(samples, 50), percentile(samples, 95), len(samples)
+
+def hedge_delay_for(provider):
+    """Segundos que se espera al proveedor antes de lanzar el siguiente (su p95)."""
+    _, p95, count = latency_summary(provider)
+    if count < MIN_SAMPLES:
+        return DEFAULT_HEDGE_DELAY
+    return max(MIN_HEDGE_DELAY, min(MAX_HEDGE_DELAY, p95))
+
+def hedged_call(candidates, is_valid=is_valid_article, hedge_delay=None):
+    """Ejecuta candidatos [(nombre, función_sin_argumentos), ...] con hedging.
+
+    Devuelve (nombre, texto) de la primera respuesta válida o (None, None)
+    si ningún proveedor dio una. Si un proveedor falla, el siguiente se lanza
+    enseguida sin esperar al umbral.
+    """
+    results = queue.Queue()
+    decided = threading.Event()
+
+    def run(name, generate, hedge):
+        http_pool.cancel_on(decided)
+        start = time.monotonic()
+        try:
+            text = generate()
+        except http_pool.Cancelled:
+            text = None
+        except Exception as e:
+            print(f"⚠️  Proveedor {name} falló: {e}")
+            text = None
+        elapsed = time.monotonic() - start
+        if is_valid(text):
+            record_latency(name, elapsed)
+        if hedge:
+            _hedge_slots.release()
+        results.put((name, text, elapsed))
+
+    launched = 0
+    pending = 0
+    deadline = None
+
+    def launch_next(hedge=False):
+        nonlocal launched, pending, deadline
+        name, generate = candidates[launched]
+        threading.Thread(target=run, args=(name, generate, hedge), daemon=True).start()
+        delay = hedge_delay if hedge_delay is not None else hedge_delay_for(name)
+        deadline = time.monotonic() + delay
+        launched += 1
+        pending += 1
+
+    launch_next()
+    while pending:
+        timeout = None
+        if launched < len(candidates) and deadline is not None:
+            timeout = max(0, deadline - time.monotonic())
+
+        try:
+            name, text, elapsed = results.get(timeout=timeout)
+        except queue.Empty:
+            if not _hedge_slots.acquire(blocking=False):
+                print(f"🔀 {candidates[launched - 1][0]} tarda más de lo normal, pero ya hay "
+                      f"{MAX_HEDGES_IN_FLIGHT} peticiones hedged en vuelo: se espera")
+                deadline = None
+                continue
+            print(f"🔀 {candidates[launched - 1][0]} tarda más de lo normal, lanzando {candidates[launched][0]} en paralelo")
+            launch_next(hedge=True)
+            continue
+
+        pending -= 1
+        if is_valid(text):
+            decided.set()
+            print(f"✅ Respuesta de {name} en {elapsed:.1f}s")
+            return name, text
+
+        print(f"⚠️  Respuesta no válida de {name}")
+        if launched < len(candidates):
+            launch_next()
+
+    return None, None
+
+def print_latency_report(providers):
+    """Muestra p50/p95 registrados de cada proveedor."""
+    for provider in providers:
+        p50, p95, count = latency_summary(provider)
+        if count:
+            print(f"   {provider}: p50 {p50:.1f}s, p95 {p95:.1f}s ({count} muestras)")
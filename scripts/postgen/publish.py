@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Comando `blog.py publish`: sube la cola de posts con un commit y un push.
+
+Uso:
+  python scripts/blog.py publish              # publica todo lo pendiente
+  python scripts/blog.py publish --if-due     # solo si se alcanzó un umbral (para cron)
+  python scripts/blog.py publish --status     # muestra la cola sin publicar
+"""
+
+import argparse
+
+from . import publish_queue
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='blog.py publish',
+        description='Publica los posts en cola con un único commit y un único push'
+    )
+    parser.add_argument('--status', action='store_true', help='Muestra la cola sin publicar')
+    parser.add_argument('--if-due', action='store_true',
+                        help='Publica solo si se alcanzó el umbral de posts o de antigüedad')
+    parser.add_argument('--no-push', action='store_true', help='Crea el commit pero no hace push')
+    args = parser.parse_args(argv)
+
+    if args.status:
+        publish_queue.print_status()
+        return 0
+
+    if args.if_due:
+        reason = publish_queue.flush_reason()
+        if not reason:
+            publish_queue.print_status()
+            print("⏳ Aún no toca publicar")
+            return 0
+        print(f"📦 Publicando cola: {reason}")
+
+    return 0 if publish_queue.flush(push=not args.no_push) else 1
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Cola de publicación: un commit y un push por lote de posts, no por post.
+
+Cada push a main dispara un rebuild completo de GitHub Pages. Los
+generadores dejan sus posts en la cola (scripts/.cache/publish_queue.json)
+y `blog.py publish` los sube todos juntos con un único commit y un único
+push, así que los minutos de build y la latencia del push escalan con los
+lotes y no con los artículos.
+
+La cola también se vacía sola al encolar cuando se alcanza un umbral:
+- PUBLISH_MAX_POSTS posts pendientes (5 por defecto; 1 = publicar al momento)
+- PUBLISH_MAX_AGE_HOURS horas desde el post pendiente más antiguo (24 por defecto)
+
+Los umbrales solo se miran cuando alguien encola o publica, así que la
+antigüedad necesita que `blog.py publish --if-due` corra en cron. Por eso
+los scripts de un solo post (super, simple, gratis, auto) publican al
+momento, con lo que hubiera en la cola, salvo con PUBLISH_BATCH=1; generate
+--batch y el programador sí encolan siempre.
+
+Si el commit se crea pero el push falla, el commit queda marcado como
+pendiente de subir y el siguiente flush lo empuja aunque no haya posts nuevos.
+El SHA del commit y el push se apuntan en el diario de trabajos (job_journal).
+"""
+
+import os
+import json
+import subprocess
+import time
+from pathlib import Path
+
+from . import git_probe
+from . import job_journal
+from .common import PROJECT_ROOT, SCRIPTS_DIR, check_git_config
+
+QUEUE_FILE = Path(os.environ.get('PUBLISH_QUEUE_FILE', SCRIPTS_DIR / '.cache' / 'publish_queue.json'))
+MAX_POSTS = int(os.environ.get('PUBLISH_MAX_POSTS', 5))
+MAX_AGE_HOURS = float(os.environ.get('PUBLISH_MAX_AGE_HOURS', 24))
+BATCH_ONE_SHOT = os.environ.get('PUBLISH_BATCH', '').lower() in ('1', 'true', 'yes', 'on')
+
+DEFAULT_SIGNATURE = '🤖 Generado automáticamente con IA'
+
+def load_queue():
+    """Lee la cola de disco; si no existe o está corrupta devuelve una vacía."""
+    try:
+        with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
+            queue = json.load(f)
+    except (OSError, ValueError):
+        queue = {}
+
+    queue.setdefault('entries', [])
+    queue.setdefault('unpushed', False)
+    return queue
+
+def save_queue(queue):
+    """Guarda la cola de forma atómica (temporal + rename)."""
+    QUEUE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = QUEUE_FILE.with_name(f".{QUEUE_FILE.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(queue, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, QUEUE_FILE)
+
+def enqueue(filename, title, signature=DEFAULT_SIGNATURE, extra_paths=()):
+    """Añade un post a la cola (si ya estaba, actualiza su título y firma).
+
+    Devuelve el número de posts pendientes tras encolar.
+    """
+    queue = load_queue()
+    entry = {
+        'filename': filename,
+        'title': title,
+        'signature': signature,
+        'paths': [f"_posts/{filename}"] + list(extra_paths),
+        'queued_at': time.time()
+    }
+
+    for i, existing in enumerate(queue['entries']):
+        if existing['filename'] == filename:
+            entry['queued_at'] = existing['queued_at']
+            queue['entries'][i] = entry
+            break
+    else:
+        queue['entries'].append(entry)
+
+    save_queue(queue)
+    return len(queue['entries'])
+
+def flush_reason(queue=None, now=None):
+    """Devuelve por qué toca publicar ya (texto) o None si aún no hay umbral alcanzado."""
+    queue = load_queue() if queue is None else queue
+    entries = queue['entries']
+    now = time.time() if now is None else now
+
+    if queue['unpushed']:
+        return "hay un commit pendiente de subir"
+    if not entries:
+        return None
+    if len(entries) >= MAX_POSTS:
+        return f"{len(entries)} posts en cola (umbral: {MAX_POSTS})"
+
+    age_hours = (now - min(e['queued_at'] for e in entries)) / 3600
+    if age_hours >= MAX_AGE_HOURS:
+        return f"el post más antiguo lleva {age_hours:.1f} h en cola (umbral: {MAX_AGE_HOURS:g} h)"
+    return None
+
+def build_commit_message(entries):
+    """Mensaje del commit del lote; con un solo post conserva el formato de siempre."""
+    signatures = list(dict.fromkeys(e['signature'] for e in entries))
+
+    if len(entries) == 1:
+        header = f"Add: Nuevo artículo '{entries[0]['title']}'"
+    else:
+        titles = '\n'.join(f"- {e['title']}" for e in entries)
+        header = f"Add: {len(entries)} nuevos artículos\n\n{titles}"
+
+    return f"{header}\n\n" + '\n'.join(signatures) + "\n\nCo-Authored-By: Claude <noreply@anthropic.com>"
+
+def _git(args):
+    return subprocess.run(["git"] + args, cwd=PROJECT_ROOT, capture_output=True, text=True)
+
+def flush(push=True):
+    """Publica toda la cola con un solo commit y un solo push.
+
+    Devuelve True si todo quedó subido (o no había nada que subir).
+    """
+    queue = load_queue()
+
+    # Descartar posts que ya no existen en disco (borrados a mano tras revisarlos)
+    entries = []
+    for entry in queue['entries']:
+        if (PROJECT_ROOT / entry['paths'][0]).exists():
+            entries.append(entry)
+        else:
+            print(f"⚠️  {entry['filename']} ya no existe; se quita de la cola")
+
+    if not entries and not queue['unpushed']:
+        queue['entries'] = []
+        save_queue(queue)
+        print("📭 No hay posts en la cola de publicación")
+        return True
+
+    if entries:
+        print(f"\n📤 Publicando {len(entries)} post(s) en un solo commit...")
+        check_git_config()
+
+        paths = [p for e in entries for p in e['paths'] if (PROJECT_ROOT / p).exists()]
+        result = _git(["add", "--"] + paths)
+        if result.returncode != 0:
+            print(f"⚠️  Error en git add: {result.stderr}")
+            return False
+
+        # Solo se comitean las rutas de la cola, no lo que hubiera en el índice
+        result = _git(["commit", "-m", build_commit_message(entries), "--"] + paths)
+        if result.returncode != 0 and "nothing to commit" not in result.stdout + result.stderr:
+            print(f"⚠️  Error en git commit: {result.stderr}")
+            return False
+
+        if result.returncode == 0:
+            for entry in entries:
+                print(f"   ✅ {entry['title']}")
+            queue['unpushed'] = True
+            sha = _git(["rev-parse", "HEAD"]).stdout.strip()
+            job_journal.record_commit([e['filename'] for e in entries], sha)
+        else:
+            print("⚠️  No hay cambios para comitear")
+
+        queue['entries'] = []
+        save_queue(queue)
+
+    if not push:
+        print("⏸️  Commit creado; push omitido (--no-push)")
+        return True
+
+    if queue['unpushed']:
+        print("🚀 Haciendo push a origin/main...")
+        result = _git(["push", "origin", "main"])
+        if result.returncode != 0:
+            print(f"⚠️  Error en git push: {result.stderr}")
+            print("   El commit está guardado localmente; se reintentará en el próximo publish")
+            if git_probe.is_auth_error(result.stderr):
+                git_probe.invalidate()
+            return False
+
+        git_probe.record_success()
+        queue['unpushed'] = False
+        save_queue(queue)
+        job_journal.record_push()
+
+    print("✅ Cola publicada en GitHub con un único push")
+    return True
+
+def submit_reason(batch=None):
+    """Por qué publicar ya el post de un script de un solo post, o None si espera en la cola."""
+    batch = BATCH_ONE_SHOT if batch is None else batch
+    if not batch:
+        return "publicación inmediata (PUBLISH_BATCH=1 para publicar por lotes)"
+    return flush_reason()
+
+def print_queued(pending):
+    """Aviso de que el post no está subido todavía y de cómo se publicará."""
+    print(f"\n📥 Post en cola de publicación ({pending}/{MAX_POSTS}): aún NO está subido a GitHub")
+    print("   Publica ahora con: python scripts/blog.py publish")
+    print(f"   El umbral de {MAX_AGE_HOURS:g} h solo se cumple si `blog.py publish --if-due` corre en cron")
+
+def submit(filename, title, signature=DEFAULT_SIGNATURE, extra_paths=(), batch=None):
+    """Encola un post y lo publica ya salvo que se publique por lotes y no toque aún.
+
+    Devuelve 'pushed' si quedó subido, 'queued' si espera en la cola o
+    False si falló el commit o el push.
+    """
+    pending = enqueue(filename, title, signature, extra_paths)
+    reason = submit_reason(batch)
+
+    if not reason:
+        print_queued(pending)
+        return 'queued'
+
+    print(f"\n📦 Publicando cola: {reason}")
+    return 'pushed' if flush() else False
+
+def print_status():
+    """Muestra los posts pendientes y si toca publicar."""
+    queue = load_queue()
+    entries = queue['entries']
+
+    print(f"📋 Cola de publicación: {len(entries)} post(s)")
+    now = time.time()
+    for entry in entries:
+        age_hours = (now - entry['queued_at']) / 3600
+        print(f"   • {entry['filename']} ({age_hours:.1f} h) - {entry['title']}")
+    if queue['unpushed']:
+        print("   ⚠️  Hay un commit local pendiente de push")
+
+    reason = flush_reason(queue, now)
+    print(f"   Umbral: {reason}" if reason else
+          f"   Umbrales: {MAX_POSTS} posts o {MAX_AGE_HOURS:g} h")
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Limitador de peticiones a Groq compartido por los scripts de generación.
+
+Lleva dos token buckets, uno de peticiones por minuto (GROQ_RPM) y otro de
+tokens por minuto (GROQ_TPM), y bloquea a quien pida más de lo disponible
+en lugar de dejar que la API devuelva 429. Las cabeceras x-ratelimit-* de
+cada respuesta corrigen el estado local con lo que dice el servidor: en
+Groq las de tokens son por minuto y ajustan el bucket de tokens, pero las
+de requests son por día (RPD), así que solo sirven para parar hasta el
+reset cuando el cupo diario llega a 0.
+
+Si aun así llega un 429, todos los hilos que estén llamando a Groq se
+pausan hasta el retry-after (o un backoff exponencial) y la petición se
+reintenta hasta MAX_ATTEMPTS veces; después el error llega a quien llamó.
+
+El estado de los buckets (niveles, pausa y cupo diario) se guarda en
+scripts/.cache/rate_limit.sqlite (GROQ_RATE_LIMIT_DB para cambiarlo) y se
+lee y escribe dentro de una transacción BEGIN IMMEDIATE, así que los
+procesos que compartan ese archivo (los `schedule worker`, un batch en
+paralelo) se reparten un único presupuesto de RPM/TPM en vez de gastarlo
+cada uno entero.
+"""
+
+import os
+import re
+import time
+import random
+import sqlite3
+import threading
+import urllib.error
+from contextlib import contextmanager
+from pathlib import Path
+
+from . import http_pool
+from .common import SCRIPTS_DIR
+
+RPM = int(os.environ.get('GROQ_RPM', 30))
+TPM = int(os.environ.get('GROQ_TPM', 12000))
+MAX_ATTEMPTS = int(os.environ.get('GROQ_RATE_LIMIT_ATTEMPTS', 8))
+MAX_BACKOFF = 60
+DB_PATH = Path(os.environ.get('GROQ_RATE_LIMIT_DB', SCRIPTS_DIR / '.cache' / 'rate_limit.sqlite'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS groq_limits (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    requests_level REAL NOT NULL,
+    tokens_level REAL NOT NULL,
+    tokens_capacity INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    paused_until REAL NOT NULL,
+    daily_remaining INTEGER
+);
+"""
+
+# Copia en memoria del estado compartido; solo vale dentro de _shared()
+_buckets = {
+    'requests': {'capacity': RPM, 'level': float(RPM), 'rate': RPM / 60.0},
+    'tokens': {'capacity': TPM, 'level': float(TPM), 'rate': TPM / 60.0}
+}
+_cond = threading.Condition()
+_state = {'updated': time.time(), 'paused_until': 0.0, 'daily_remaining': None}
+_local = threading.local()
+
+def _connect():
+    """Conexión (una por hilo) a la base de datos del estado compartido."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and getattr(_local, 'path', None) == DB_PATH:
+        return conn
+
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    _local.conn, _local.path = conn, DB_PATH
+    return conn
+
+@contextmanager
+def _shared():
+    """Bloquea el limitador para hilos y procesos y sincroniza _buckets/_state con la base de datos."""
+    with _cond:
+        conn = _connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT * FROM groq_limits WHERE id = 1").fetchone()
+            if row:
+                tokens = _buckets['tokens']
+                if row['tokens_capacity'] != tokens['capacity']:
+                    tokens['capacity'] = row['tokens_capacity']
+                    tokens['rate'] = row['tokens_capacity'] / 60.0
+                tokens['level'] = row['tokens_level']
+                _buckets['requests']['level'] = min(row['requests_level'], _buckets['requests']['capacity'])
+                _state.update(updated=row['updated'], paused_until=row['paused_until'],
+                              daily_remaining=row['daily_remaining'])
+            yield
+            conn.execute(
+                "INSERT OR REPLACE INTO groq_limits VALUES (1, ?, ?, ?, ?, ?, ?)",
+                (_buckets['requests']['level'], _buckets['tokens']['level'], _buckets['tokens']['capacity'],
+                 _state['updated'], _state['paused_until'], _state['daily_remaining'])
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+def estimate_tokens(prompt, max_tokens):
+    """Estimación de tokens de una petición: prompt (~4 caracteres por token) + salida máxima."""
+    return len(prompt) // 4 + max_tokens
+
+def _refill(now):
+    elapsed = now - _state['updated']
+    _state['updated'] = now
+    for bucket in _buckets.values():
+        bucket['level'] = min(bucket['capacity'], bucket['level'] + elapsed * bucket['rate'])
+
+def acquire(tokens):
+    """Bloquea hasta que haya una petición y `tokens` tokens disponibles.
+
+    Devuelve los segundos que se ha esperado.
+    """
+    start = time.monotonic()
+    while True:
+        with _shared():
+            now = time.time()
+            _refill(now)
+
+            if now < _state['paused_until']:
+                wait = _state['paused_until'] - now
+            else:
+                # Una petición más grande que el bucket entero se deja pasar con el bucket lleno
+                needed = min(tokens, _buckets['tokens']['capacity'])
+                requests_bucket = _buckets['requests']
+                tokens_bucket = _buckets['tokens']
+                if requests_bucket['level'] >= 1 and tokens_bucket['level'] >= needed:
+                    requests_bucket['level'] -= 1
+                    tokens_bucket['level'] -= needed
+                    return time.monotonic() - start
+
+                wait = max(
+                    (1 - requests_bucket['level']) / requests_bucket['rate'],
+                    (needed - tokens_bucket['level']) / tokens_bucket['rate']
+                )
+
+        # Fuera de la transacción: los demás procesos siguen pudiendo pedir
+        with _cond:
+            _cond.wait(max(wait, 0.05))
+
+def parse_reset(value):
+    """Convierte duraciones de Groq como '2m59.56s', '7.66s' o '120ms' a segundos."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    total = 0.0
+    matched = False
+    for amount, unit in re.findall(r'([\d.]+)(ms|h|m|s)', value):
+        matched = True
+        amount = float(amount)
+        total += {'h': 3600, 'm': 60, 's': 1, 'ms': 0.001}[unit] * amount
+    return total if matched else None
+
+def _header(headers, name):
+    if headers is None:
+        return None
+    return headers.get(name)
+
+def _pause(seconds):
+    if seconds:
+        _state['paused_until'] = max(_state['paused_until'], time.time() + seconds)
+
+def update_from_headers(headers):
+    """Ajusta los buckets con las cabeceras x-ratelimit-* de una respuesta."""
+    if headers is None:
+        return
+
+    with _shared():
+        _refill(time.time())
+
+        limit_tokens = _header(headers, 'x-ratelimit-limit-tokens')
+        if limit_tokens and limit_tokens.isdigit():
+            bucket = _buckets['tokens']
+            bucket['capacity'] = int(limit_tokens)
+            bucket['rate'] = int(limit_tokens) / 60.0
+
+        remaining = _header(headers, 'x-ratelimit-remaining-tokens')
+        if remaining and remaining.isdigit():
+            _buckets['tokens']['level'] = min(_buckets['tokens']['level'], int(remaining))
+            if int(remaining) == 0:
+                _pause(parse_reset(_header(headers, 'x-ratelimit-reset-tokens')))
+
+        # Peticiones por día: no dicen nada del bucket por minuto
+        remaining = _header(headers, 'x-ratelimit-remaining-requests')
+        if remaining and remaining.isdigit():
+            _state['daily_remaining'] = int(remaining)
+            if int(remaining) == 0:
+                _pause(parse_reset(_header(headers, 'x-ratelimit-reset-requests')))
+
+        _cond.notify_all()
+
+def rate_limit_headers(error):
+    """Si `error` es un 429 (urllib o SDK de Groq), devuelve sus cabeceras; si no, None."""
+    if isinstance(error, urllib.error.HTTPError):
+        return error.headers if error.code == 429 else None
+
+    if getattr(error, 'status_code', None) == 429:
+        response = getattr(error, 'response', None)
+        return getattr(response, 'headers', {}) or {}
+
+    return None
+
+def backoff(headers, attempt):
+    """Pausa a todos los hilos tras un 429 y devuelve los segundos de pausa."""
+    delay = parse_reset(_header(headers, 'retry-after'))
+    if delay is None:
+        delay = parse_reset(_header(headers, 'x-ratelimit-reset-tokens'))
+    # El reset de requests es el del cupo diario: solo vale si ese cupo se agotó
+    if delay is None and _header(headers, 'x-ratelimit-remaining-requests') == '0':
+        delay = parse_reset(_header(headers, 'x-ratelimit-reset-requests'))
+    if delay is None:
+        delay = min(MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 1)
+
+    with _shared():
+        _refill(time.time())
+        _pause(delay)
+        # El servidor dice que no queda margen: vaciar los buckets
+        for bucket in _buckets.values():
+            bucket['level'] = 0.0
+        _cond.notify_all()
+
+    print(f"⏳ Límite de Groq alcanzado, pausando las peticiones {delay:.1f}s...")
+    return delay
+
+def limited_call(request, estimated_tokens):
+    """Ejecuta request() respetando RPM/TPM y reintentando si la API responde 429."""
+    for attempt in range(MAX_ATTEMPTS):
+        acquire(estimated_tokens)
+        try:
+            return request()
+        except Exception as e:
+            headers = rate_limit_headers(e)
+            if headers is None or attempt == MAX_ATTEMPTS - 1:
+                raise
+            backoff(headers, attempt)
+
+def groq_post_json(url, data, headers, timeout=30):
+    """POST a la API de Groq (sin SDK) pasando por el limitador."""
+    prompt = ''.join(message['content'] for message in data['messages'])
+    estimated = estimate_tokens(prompt, data.get('max_tokens', 0))
+
+    def send():
+        response, response_headers = http_pool.post_json(
+            url, data, headers, timeout=timeout, with_headers=True
+        )
+        update_from_headers(response_headers)
+        return response
+
+    return limited_call(send, estimated)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Comando `blog.py resume`: retoma los trabajos del diario que no terminaron.
+
+Cada trabajo sigue desde su última etapa completada: lo que ya se generó
+no se vuelve a pedir al LLM y un post ya escrito no se escribe otra vez.
+Los que solo esperan commit o push se quedan en la cola de publicación.
+
+Uso:
+  python scripts/blog.py resume                 # retoma todos los trabajos pendientes
+  python scripts/blog.py resume --list          # solo los muestra
+  python scripts/blog.py resume --job ID        # retoma uno concreto
+  python scripts/blog.py resume --publish       # y después publica la cola
+"""
+
+import argparse
+
+from . import job_journal
+from . import publish_queue
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='blog.py resume',
+        description='Retoma los trabajos de generación interrumpidos desde su última etapa'
+    )
+    parser.add_argument('--list', action='store_true', help='Muestra los trabajos sin terminar')
+    parser.add_argument('--job', metavar='ID', help='Retoma solo este trabajo')
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Máximo de peticiones a Groq en paralelo (por defecto: 4)')
+    parser.add_argument('--publish', action='store_true',
+                        help='Publica la cola al terminar aunque no se haya alcanzado el umbral')
+    args = parser.parse_args(argv)
+
+    jobs = job_journal.unfinished_jobs()
+    if args.job:
+        jobs = [job for job in jobs if job['id'] == args.job]
+        if not jobs:
+            print(f"❌ No hay ningún trabajo pendiente con id {args.job}")
+            return 1
+
+    if args.list or not jobs:
+        job_journal.print_status(jobs)
+        return 0
+
+    # Los que ya están en la cola solo esperan a publish; los programados los
+    # retoma `schedule run`; el resto se retoma aquí
+    to_run = [job for job in jobs if 'queued' not in job['stages'] and job['command'] != 'schedule']
+    waiting = sum('queued' in job['stages'] for job in jobs)
+    if waiting:
+        print(f"📥 {waiting} trabajo(s) ya en la cola de publicación")
+    scheduled = sum(job['command'] == 'schedule' and 'queued' not in job['stages'] for job in jobs)
+    if scheduled:
+        print(f"🗓️  {scheduled} trabajo(s) del programador: los retoma `blog.py schedule run`")
+
+    failed = []
+    generate_jobs = [job for job in to_run if job['command'] == 'generate']
+    if generate_jobs:
+        # El generador (y el SDK de Groq) solo se carga si hay trabajos suyos
+        from . import generate
+        print(f"\n↩️  Retomando {len(generate_jobs)} trabajo(s) de generate\n")
+        _, generate_failed = generate.resume_jobs(generate_jobs, args.concurrency)
+        failed += generate_failed
+
+    for job in to_run:
+        if job['command'] != 'auto':
+            continue
+        from . import auto
+        print(f"\n↩️  Retomando {job['id']}")
+        _, _, _, success, message = auto.run_job(job)
+        if not success:
+            print(f"⚠️  {job['id']}: {message}")
+            failed.append(job)
+
+    if args.publish or publish_queue.flush_reason():
+        if not publish_queue.flush():
+            return 1
+    else:
+        publish_queue.print_status()
+
+    return 0 if not failed else 1
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+Comando `blog.py schedule`: cola de temas y programador de publicaciones.
+
+El proceso `schedule run` se queda en marcha y en cada vuelta:
+1. Publica los borradores cuya hora llegó: mover el archivo a _posts/ y
+   un push. En ese momento no hay ninguna llamada al LLM.
+2. Genera por adelantado (SCHEDULE_AHEAD borradores, 2 por defecto) los
+   siguientes temas de la cola y les asigna hueco de publicación.
+
+Los huecos reparten DAILY_POST_LIMIT posts (5, el de check_daily_limit) a lo
+largo de la ventana SCHEDULE_WINDOW (08:00-22:00). Los posts publicados a
+mano ese día también cuentan. SCHEDULE_CATEGORY_QUOTAS (p. ej.
+"ia=2,blockchain=2") limita los posts por categoría y día.
+
+Para generar más rápido, la generación se reparte entre workers: procesos
+`schedule worker` (en esta máquina o en otras que compartan el disco) que
+reservan temas en la cola, escriben su borrador y nada más. Publicar lo hace
+un único proceso `schedule run`, protegido por un archivo de bloqueo.
+`schedule run --workers N` arranca N workers locales y solo publica. Con
+varios workers conviene subir --ahead (o SCHEDULE_AHEAD): cada uno genera un
+tema a la vez y AHEAD limita cuántos hay por delante en total. Todos los
+workers que compartan scripts/.cache/rate_limit.sqlite se reparten un único
+presupuesto de RPM/TPM de Groq (ver rate_limit), así que más allá de unos
+pocos workers el cuello de botella es el rate limit y no se pasa de él.
+
+Uso:
+  python scripts/blog.py schedule add "Qué es un rollup" --category blockchain --priority 2
+  python scripts/blog.py schedule import temas.csv     # topic,category[,priority]
+  python scripts/blog.py schedule list
+  python scripts/blog.py schedule run                  # proceso en marcha
+  python scripts/blog.py schedule run --once           # una vuelta (para cron)
+  python scripts/blog.py schedule run --workers 4 --ahead 8
+  python scripts/blog.py schedule worker               # solo genera (otra máquina)
+"""
+
+import os
+import re
+import csv
+import sys
+import time
+import atexit
+import shutil
+import socket
+import asyncio
+import argparse
+import subprocess
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from . import generate
+from . import job_journal
+from . import post_index
+from . import publish_queue
+from . import topic_dedup
+from . import topic_queue
+from .common import CATEGORIES, POSTS_DIR, SCRIPTS_DIR, create_post_file, post_filename
+
+DRAFTS_DIR = Path(os.environ.get('SCHEDULE_DRAFTS_DIR', SCRIPTS_DIR / '.cache' / 'drafts'))
+WINDOW = os.environ.get('SCHEDULE_WINDOW', '08:00-22:00')
+AHEAD = int(os.environ.get('SCHEDULE_AHEAD', 2))
+POLL_SECONDS = int(os.environ.get('SCHEDULE_POLL', 60))
+MAX_DAYS_AHEAD = 14
+PUBLISHER_LOCK = SCRIPTS_DIR / '.cache' / 'publisher.lock'
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def parse_quotas(raw):
+    """'ia=2,blockchain=1' -> {'ia': 2, 'blockchain': 1}"""
+    quotas = {}
+    for item in raw.split(','):
+        if '=' in item:
+            category, value = item.split('=', 1)
+            quotas[category.strip()] = int(value)
+    return quotas
+
+CATEGORY_QUOTAS = parse_quotas(os.environ.get('SCHEDULE_CATEGORY_QUOTAS', ''))
+
+def _minutes(hhmm):
+    hours, minutes = hhmm.strip().split(':')
+    return int(hours) * 60 + int(minutes)
+
+def day_slots(day):
+    """Horas de publicación del día: DAILY_LIMIT huecos repartidos por la ventana."""
+    start, end = (_minutes(part) for part in WINDOW.split('-'))
+    spacing = (end - start) / generate.DAILY_LIMIT
+    base = datetime.combine(day, datetime.min.time())
+    return [base + timedelta(minutes=int(start + i * spacing)) for i in range(generate.DAILY_LIMIT)]
+
+def post_date_str(slot):
+    return slot.strftime('%Y-%m-%d %H:%M:%S -0500')
+
+def free_slot(now, category):
+    """Primer hueco futuro con sitio en el límite diario y en la cuota de la categoría."""
+    for offset in range(MAX_DAYS_AHEAD):
+        day = now.date() + timedelta(days=offset)
+        published = post_index.posts_on(day.isoformat())
+        scheduled = topic_queue.scheduled_on(day.isoformat())
+        if len(published) + len(scheduled) >= generate.DAILY_LIMIT:
+            continue
+
+        quota = CATEGORY_QUOTAS.get(category)
+        if quota is not None:
+            used = (sum(category in post['categories'] for post in published)
+                    + sum(row['category'] == category for row in scheduled))
+            if used >= quota:
+                continue
+
+        taken = {row['publish_at'] for row in scheduled}
+        for slot in day_slots(day):
+            if slot > now and slot.strftime(TIME_FORMAT) not in taken:
+                return slot
+    return None
+
+def plan_next(now):
+    """(hueco, tema) que toca generar: el hueco más cercano y, para él, el tema de más prioridad."""
+    best = None
+    for category in topic_queue.pending_categories():
+        slot = free_slot(now, category)
+        if slot is None:
+            continue
+        row = topic_queue.next_topic(category)
+        key = (slot, -row['priority'], row['added_at'])
+        if best is None or key < best[0]:
+            best = (key, slot, row)
+    return best[1:] if best else None
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def reserve_draft(file_date, title):
+    """Reserva en los borradores un nombre que no choque con _posts/ ni con otro worker.
+
+    El archivo se crea vacío con O_EXCL, así que dos workers con el mismo slug
+    nunca se quedan con el mismo nombre; create_post_file lo sustituye después.
+    """
+    DRAFTS_DIR.mkdir(parents=True, exist_ok=True)
+    while True:
+        filename = post_filename(file_date, title, [DRAFTS_DIR])
+        try:
+            os.close(os.open(DRAFTS_DIR / filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return filename
+        except FileExistsError:
+            continue
+
+def generate_draft(client, row, slot):
+    """Genera el post del tema como borrador fechado para su hueco. Devuelve el nombre del archivo."""
+    entry = job_journal.start('schedule', row['topic'], row['category'], slot.strftime('%Y-%m-%d'),
+                              post_date_str(slot), identifier=row['job_id'])
+    # Si el trabajo viene de un intento anterior, la fecha es la del hueco nuevo
+    entry['file_date'] = slot.strftime('%Y-%m-%d')
+    entry['date'] = post_date_str(slot)
+    job_journal.save(entry)
+
+    metadata, content, image_url = asyncio.run(generate.generate_post_parts(
+        client, asyncio.Semaphore(2), row['topic'], row['category'], entry=entry
+    ))
+
+    filename = reserve_draft(entry['file_date'], metadata['title'])
+    create_post_file(
+        metadata['title'],
+        content,
+        metadata['excerpt'],
+        metadata['tags'],
+        row['category'],
+        entry['date'],
+        filename,
+        image_url,
+        directory=DRAFTS_DIR
+    )
+    return filename
+
+def claim_plan():
+    """plan_next() en el formato de topic_queue.claim_next: (publish_at, tema)."""
+    planned = plan_next(datetime.now())
+    if not planned:
+        return None
+    slot, row = planned
+    return slot.strftime(TIME_FORMAT), row
+
+@contextmanager
+def keep_claim(topic_id, worker):
+    """Renueva la reserva del tema cada tercio de CLAIM_TTL mientras dura el bloque.
+
+    Una generación larga (secciones, pausas por 429) no llega a caducar y
+    otro worker no la repite. Si la reserva se pierde igualmente, el
+    mark_ready del final no se aplica.
+    """
+    done = threading.Event()
+
+    def beat():
+        while not done.wait(topic_queue.CLAIM_TTL / 3):
+            if not topic_queue.heartbeat(topic_id, worker):
+                print(f"⚠️  [{worker}] La reserva del tema {topic_id} ya no es nuestra")
+                return
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        done.set()
+        thread.join()
+
+def pregenerate(get_client, worker=None, ahead=None):
+    """Genera borradores hasta tener `ahead` (AHEAD) temas listos por delante.
+
+    Cada tema se reserva con topic_queue.claim_next antes de generarlo, así
+    que varios workers pueden llamar a esto a la vez sin pisarse.
+    """
+    worker = worker or worker_name()
+    ahead = ahead or AHEAD
+    generated = 0
+    # Aquí solo importa lo ya publicado, no los demás temas de la cola
+    topic_dedup.forget('queue:')
+    topic_dedup.refresh()
+    while True:
+        client = get_client()
+        if client is None:
+            break
+        row = topic_queue.claim_next(claim_plan, worker, ahead)
+        if row is None:
+            break
+        slot = datetime.strptime(row['publish_at'], TIME_FORMAT)
+
+        # Un post publicado después de encolar el tema puede haberlo cubierto ya
+        if not topic_dedup.check_topic(row['topic']):
+            topic_queue.mark_failed(row['id'], 'casi duplicado de un post existente', worker)
+            continue
+
+        print(f"\n⏳ [{worker}] Generando por adelantado: {row['topic']} (hueco {slot:%d/%m %H:%M})")
+        try:
+            with keep_claim(row['id'], worker):
+                draft = generate_draft(client, row, slot)
+        except KeyboardInterrupt:
+            topic_queue.unclaim(row['id'], worker)
+            raise
+        except Exception as e:
+            # Lo generado queda en el diario; el siguiente intento sigue desde ahí
+            print(f"❌ Error generando '{row['topic']}': {e}")
+            topic_queue.release(row['id'], e, worker)
+            break
+
+        if not topic_queue.mark_ready(row['id'], draft, worker):
+            # Otro worker tomó el tema cuando caducó la reserva: su borrador es el que vale
+            print(f"⚠️  [{worker}] El tema ya no estaba reservado por este worker; se descarta {draft}")
+            (DRAFTS_DIR / draft).unlink(missing_ok=True)
+            continue
+        print(f"📝 Borrador listo: {draft}")
+        generated += 1
+    return generated
+
+TITLE_RE = re.compile(r'^title: *"?(.*?)"? *$', re.MULTILINE)
+
+def draft_title(entry, path):
+    """Título del borrador: el del diario o, si el trabajo falta o está corrupto, el del front matter."""
+    if entry:
+        return entry['stages']['metadata']['title']
+    with open(path, 'r', encoding='utf-8') as f:
+        match = TITLE_RE.search(f.read())
+    return match.group(1) if match else path.stem[11:]
+
+def postpone(row, now):
+    """Mueve un borrador a otro hueco: cambia la fecha del nombre y del front matter."""
+    slot = free_slot(now, row['category'])
+    if slot is None:
+        print(f"⚠️  No hay hueco libre para {row['draft']} en {MAX_DAYS_AHEAD} días")
+        return
+
+    entry = job_journal.load(row['job_id'])
+    filename = row['draft']
+    if filename[:10] != f"{slot:%Y-%m-%d}":
+        title = draft_title(entry, DRAFTS_DIR / row['draft'])
+        filename = reserve_draft(f"{slot:%Y-%m-%d}", title)
+    old_path = DRAFTS_DIR / row['draft']
+    with open(old_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    text = re.sub(r'^date: .*$', f'date: {post_date_str(slot)}', text, count=1, flags=re.MULTILINE)
+
+    tmp_path = DRAFTS_DIR / f".{filename}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, DRAFTS_DIR / filename)
+    if filename != row['draft']:
+        old_path.unlink()
+
+    if entry:
+        entry['file_date'] = f"{slot:%Y-%m-%d}"
+        entry['date'] = post_date_str(slot)
+        job_journal.save(entry)
+
+    topic_queue.reschedule(row['id'], slot.strftime(TIME_FORMAT), filename)
+    print(f"⏭️  {row['draft']} pasa al hueco {slot:%d/%m %H:%M}")
+
+def publish_due(now):
+    """Mueve a _posts/ los borradores cuya hora llegó y los sube con un solo push."""
+    moved = 0
+    for row in topic_queue.due(now.strftime(TIME_FORMAT)):
+        draft = DRAFTS_DIR / row['draft']
+        if not draft.exists():
+            print(f"⚠️  Falta el borrador {row['draft']}; el tema vuelve a la cola")
+            topic_queue.release(row['id'], 'borrador perdido')
+            continue
+
+        # El hueco era de otro día (el proceso estuvo parado) o el día se llenó con posts a mano
+        if row['publish_at'][:10] != now.strftime('%Y-%m-%d') or not generate.check_daily_limit(now.date())[0]:
+            postpone(row, now)
+            continue
+
+        # Un post a mano con el mismo slug pudo aparecer después de generar el borrador
+        entry = job_journal.load(row['job_id'])
+        title = draft_title(entry, draft)
+        filename = row['draft']
+        if (POSTS_DIR / filename).exists():
+            filename = post_filename(filename[:10], title)
+
+        shutil.move(str(draft), str(POSTS_DIR / filename))
+        publish_queue.enqueue(filename, title)
+        if entry:
+            job_journal.complete(entry, 'written', filename)
+            job_journal.complete(entry, 'queued', True)
+        topic_queue.mark_published(row['id'])
+        print(f"📤 Publicando {filename}")
+        moved += 1
+
+    # Un push por vuelta; también reintenta un push que quedó pendiente
+    if moved or publish_queue.flush_reason():
+        publish_queue.flush()
+    return moved
+
+def seconds_until_next(now):
+    """Espera hasta la próxima publicación o como mucho POLL_SECONDS."""
+    ready = topic_queue.list_topics('ready')
+    if not ready:
+        return POLL_SECONDS
+    next_at = datetime.strptime(ready[0]['publish_at'], TIME_FORMAT)
+    return max(1, min(POLL_SECONDS, (next_at - now).total_seconds()))
+
+def recover_stale():
+    stale = topic_queue.recover_stale()
+    if stale:
+        print(f"↩️  {stale} tema(s) reservados por un worker que ya no responde vuelven a la cola")
+
+def client_factory():
+    """get_client() que crea el cliente de Groq solo la primera vez que hay algo que generar."""
+    clients = {}
+
+    def get_client():
+        if 'groq' not in clients:
+            clients['groq'] = generate.create_client()
+        return clients['groq']
+    return get_client
+
+def lock_holder_alive(holder):
+    """False solo si el dueño del bloqueo es un proceso de esta máquina que ya no existe."""
+    host, _, pid = holder.rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def acquire_publisher_lock():
+    """Garantiza un único publicador: crea PUBLISHER_LOCK con O_EXCL y lo borra al salir.
+
+    Un bloqueo que dejó un proceso muerto de esta máquina se recupera; uno de
+    otra máquina hay que borrarlo a mano si su dueño ya no existe.
+    """
+    PUBLISHER_LOCK.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            fd = os.open(PUBLISHER_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                holder = PUBLISHER_LOCK.read_text(encoding='utf-8').strip()
+            except FileNotFoundError:
+                continue
+            if holder and not lock_holder_alive(holder):
+                print(f"🧹 Bloqueo de publicador abandonado por {holder}")
+                PUBLISHER_LOCK.unlink(missing_ok=True)
+                continue
+            print(f"❌ Ya hay un publicador en marcha ({holder or 'arrancando'}): {PUBLISHER_LOCK}")
+            return False
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(worker_name())
+        atexit.register(PUBLISHER_LOCK.unlink, missing_ok=True)
+        return True
+
+def start_workers(count, ahead):
+    """Arranca `count` procesos `schedule worker` en esta máquina."""
+    command = [sys.executable, str(SCRIPTS_DIR / 'blog.py'), 'schedule', 'worker', '--ahead', str(ahead)]
+    return [subprocess.Popen(command + ['--name', f"{socket.gethostname()}:w{number}"])
+            for number in range(1, count + 1)]
+
+def stop_workers(workers):
+    for process in workers:
+        if process.poll() is None:
+            process.terminate()
+    for process in workers:
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def run(once=False, workers=0, generate_here=True, ahead=None):
+    """Bucle del publicador: publica lo que toca y, sin workers, genera lo siguiente."""
+    if not acquire_publisher_lock():
+        return 1
+    recover_stale()
+    ahead = ahead or AHEAD
+    get_client = client_factory()
+
+    processes = start_workers(workers, ahead) if workers and not once else []
+    generate_here = generate_here and not processes
+    mode = (f"{len(processes)} worker(s) generando" if processes
+            else "generando aquí" if generate_here else "solo publica")
+    print(f"🗓️  Programador en marcha: {generate.DAILY_LIMIT} posts/día entre {WINDOW}, "
+          f"{ahead} borrador(es) por adelantado, {mode}")
+    try:
+        while True:
+            now = datetime.now()
+            publish_due(now)
+            if generate_here:
+                pregenerate(get_client, ahead=ahead)
+            else:
+                recover_stale()
+            if once:
+                return 0
+            time.sleep(seconds_until_next(datetime.now()))
+    except KeyboardInterrupt:
+        print("\n👋 Programador detenido")
+        return 0
+    finally:
+        stop_workers(processes)
+
+def work(name=None, ahead=None, once=False):
+    """Bucle de un worker: reserva temas y escribe sus borradores; nunca publica."""
+    name = name or worker_name()
+    get_client = client_factory()
+    print(f"🛠️  Worker {name} en marcha")
+    try:
+        while True:
+            recover_stale()
+            generated = pregenerate(get_client, name, ahead)
+            if once:
+                return 0
+            if not generated:
+                time.sleep(POLL_SECONDS)
+    except KeyboardInterrupt:
+        print(f"\n👋 Worker {name} detenido")
+        return 0
+
+def load_queue_topics():
+    """Los temas que ya están en la cola también cuentan para detectar duplicados."""
+    for row in topic_queue.list_topics():
+        if row['status'] != 'failed':
+            topic_dedup.add_topic(f"queue:{row['id']}", row['topic'])
+
+def add_topic(topic, category, priority=0, allow_duplicate=False):
+    if category not in CATEGORIES:
+        print(f"❌ Categoría '{category}' no válida (elige entre: {', '.join(CATEGORIES)})")
+        return False
+    if not topic_dedup.check_topic(topic, allow_duplicate):
+        return False
+    topic_id = topic_queue.add(topic, category, priority)
+    if topic_id is None:
+        print(f"⚠️  '{topic}' ya estaba en la cola")
+        return False
+    topic_dedup.add_topic(f"queue:{topic_id}", topic)
+    print(f"➕ [{category}] {topic} (prioridad {priority})")
+    return True
+
+def import_topics(csv_path, allow_duplicate=False):
+    """CSV con columnas topic, category y priority (opcional); la cabecera es opcional."""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.reader(f))
+    if rows and [cell.strip().lower() for cell in rows[0][:2]] == ['topic', 'category']:
+        rows = rows[1:]
+
+    added = 0
+    for row in rows:
+        if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+            continue
+        priority = int(row[2]) if len(row) > 2 and row[2].strip() else 0
+        category = row[1].strip() if len(row) > 1 else ''
+        added += add_topic(row[0].strip(), category, priority, allow_duplicate)
+    print(f"📥 {added} tema(s) añadidos a la cola")
+    return added
+
+def print_queue(status=None):
+    counts = topic_queue.counts()
+    print("🗂️  Cola de temas: " + (', '.join(f"{name} {count}" for name, count in sorted(counts.items()))
+                                  or 'vacía'))
+    for row in topic_queue.list_topics(status):
+        when = f" -> {row['publish_at'][:16]}" if row['publish_at'] and row['status'] != 'published' else ''
+        error = f" ⚠️  {row['error']}" if row['error'] and row['status'] != 'published' else ''
+        worker = f" ({row['claimed_by']})" if row['status'] == 'generating' and row['claimed_by'] else ''
+        print(f"   • [{row['status']}] p{row['priority']} [{row['category']}] {row['topic']}{when}{worker}{error}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='blog.py schedule',
+        description='Cola de temas y publicación programada a lo largo del día'
+    )
+    subparsers = parser.add_subparsers(dest='action', required=True)
+
+    add_parser = subparsers.add_parser('add', help='Añade un tema a la cola')
+    add_parser.add_argument('topic')
+    add_parser.add_argument('--category', required=True, choices=list(CATEGORIES))
+    add_parser.add_argument('--priority', type=int, default=0, help='Mayor = antes (por defecto: 0)')
+    add_parser.add_argument('--allow-duplicate', action='store_true',
+                            help='Añadir aunque el tema sea casi idéntico a un post existente')
+
+    import_parser = subparsers.add_parser('import', help='Añade los temas de un CSV (topic,category[,priority])')
+    import_parser.add_argument('csv_path')
+    import_parser.add_argument('--allow-duplicate', action='store_true')
+
+    list_parser = subparsers.add_parser('list', help='Muestra la cola de temas')
+    list_parser.add_argument('--status', choices=['pending', 'generating', 'ready', 'published', 'failed'])
+
+    run_parser = subparsers.add_parser('run', help='Arranca el programador (el único que publica)')
+    run_parser.add_argument('--once', action='store_true', help='Una sola vuelta (para cron)')
+    run_parser.add_argument('--workers', type=int, default=0,
+                            help='Workers locales que generan mientras este proceso publica')
+    run_parser.add_argument('--no-generate', action='store_true',
+                            help='Solo publicar (los workers están en otras máquinas)')
+    run_parser.add_argument('--ahead', type=int, help=f'Borradores por adelantado (por defecto: {AHEAD})')
+
+    worker_parser = subparsers.add_parser('worker', help='Genera borradores de la cola sin publicar')
+    worker_parser.add_argument('--name', help='Nombre del worker (por defecto: host:pid)')
+    worker_parser.add_argument('--ahead', type=int, help=f'Borradores por adelantado (por defecto: {AHEAD})')
+    worker_parser.add_argument('--once', action='store_true', help='Genera lo que pueda y termina')
+
+    args = parser.parse_args(argv)
+
+    if args.action in ('add', 'import'):
+        load_queue_topics()
+    if args.action == 'add':
+        return 0 if add_topic(args.topic, args.category, args.priority, args.allow_duplicate) else 1
+    if args.action == 'import':
+        try:
+            import_topics(args.csv_path, args.allow_duplicate)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: No se pudo leer {args.csv_path}: {e}")
+            return 1
+        return 0
+    if args.action == 'list':
+        print_queue(args.status)
+        return 0
+    if args.action == 'worker':
+        return work(args.name, args.ahead, args.once)
+    return run(args.once, args.workers, not args.no_generate, args.ahead)
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Script simplificado para crear posts de blog y subirlos automáticamente.
+No requiere dependencias externas, solo usa APIs web estándar.
+"""
+
+import json
+import re
+from datetime import datetime
+import sys
+
+from . import continuation
+from . import http_pool
+from . import llm_cache
+from . import model_router
+from . import provider_router
+from . import rate_limit
+from .common import create_post_file, get_groq_api_key, git_commit_and_push, parse_topic_args, post_filename
+
+DEFAULT_IMAGE_URL = "https://images.unsplash.com/photo-1518770660439-4636190af475?w=800&h=600&fit=crop"
+
+def call_groq_api(topic, api_key, prompt, route='content'):
+    """Llama a la API de Groq sin dependencias externas."""
+    url = "https://api.groq.com/openai/v1/chat/completions"
+    model, max_tokens = model_router.plan(route, prompt, 500 if route == 'metadata' else 3000)
+
+    data = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.7,
+        "max_tokens": max_tokens
+    }
+
+    def send(messages, max_tokens):
+        result = rate_limit.groq_post_json(
+            url,
+            dict(data, messages=messages, max_tokens=max_tokens),
+            headers={
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {api_key}'
+            },
+            timeout=30
+        )
+        choice = result['choices'][0]
+        return choice['message']['content'], choice.get('finish_reason'), result.get('usage', {}).get('completion_tokens')
+
+    is_valid = model_router.has_json if route == 'metadata' else provider_router.is_valid_article
+
+    def request_completion():
+        # Si la respuesta llega cortada por max_tokens se pide continuación
+        try:
+            return model_router.timed(
+                route, model, lambda: continuation.complete(send, prompt, max_tokens) or None, is_valid
+            )
+        except Exception as e:
+            print(f"Error calling Groq API: {e}")
+            return None
+
+    return llm_cache.cached_call(
+        'groq', data['model'], prompt, data['temperature'], data['max_tokens'], request_completion, is_valid
+    )
+
+def generate_post(topic, category, api_key):
+    """Genera un post completo."""
+
+    # Generar título y metadata
+    print("📝 Generando título y metadata...")
+    metadata_prompt = f"""Para un artículo de blog sobre "{topic}" en la categoría {category}, genera:
+
+1. Un título SEO-friendly (máximo 60 caracteres, atractivo y claro)
+2. Un excerpt de 1-2 líneas (máximo 160 caracteres)
+3. 4-6 tags relevantes en español (separados por comas)
+
+Responde SOLO en este formato JSON:
+{{
+    "title": "título aquí",
+    "excerpt": "excerpt aquí",
+    "tags": ["tag1", "tag2", "tag3", "tag4"]
+}}"""
+
+    metadata_response = call_groq_api(topic, api_key, metadata_prompt, route='metadata')
+    if not metadata_response:
+        return None
+
+    json_match = re.search(r'\{.*\}', metadata_response, re.DOTALL)
+    if json_match:
+        metadata = json.loads(json_match.group())
+    else:
+        # Fallback
+        metadata = {
+            "title": topic[:60],
+            "excerpt": f"Descubre todo sobre {topic} en este artículo detallado.",
+            "tags": ["ia", "tecnologia", "actualidad"]
+        }
+
+    print(f"✅ Título: {metadata['title']}")
+
+    # Generar contenido
+    print("📄 Generando contenido del artículo...")
+    content_prompt = f"""Escribe un artículo completo y detallado sobre: {topic}
+
+El artículo debe:
+- Tener entre 800-1200 palabras
+- Estar escrito en español
+- Ser informativo y técnico pero accesible
+- Incluir secciones con headers en markdown (##, ###)
+- Tener un tono profesional pero cercano
+- Incluir una conclusión al final
+- NO incluir el título principal (solo secciones)
+
+Escribe el artículo completo en formato markdown:"""
+
+    content = call_groq_api(topic, api_key, content_prompt)
+    if not content:
+        # Mejor no publicar nada que publicar una plantilla vacía
+        print("❌ No se pudo generar el contenido (límite de la API agotado o respuesta no válida)")
+        return None
+
+    print("✅ Contenido generado")
+    return metadata, content
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Obtener argumentos
+    if len(argv) < 2:
+        print("Uso: python3 scripts/blog.py simple --topic 'Tema del artículo' --category ia")
+        print("\nCategorías disponibles: ia, blockchain, tutoriales")
+        print("Opciones: --refresh (regenerar ignorando la caché), --no-cache (no usar caché)")
+        return 1
+
+    topic, category = parse_topic_args(argv)
+
+    # --no-cache / --refresh para la caché local de respuestas de LLM
+    llm_cache.configure_from_argv(argv)
+
+    if not topic or not category:
+        print("Error: Debes especificar --topic y --category")
+        return 1
+
+    # Obtener API key (entorno o scripts/.env)
+    api_key = get_groq_api_key()
+    if not api_key:
+        print("❌ ERROR: No se encontró la API key de Groq")
+        print("\nPara configurarla:")
+        print("1. Obtén tu key gratuita en: https://console.groq.com")
+        print("2. Agrégala al archivo scripts/.env:")
+        print("   GROQ_API_KEY=tu_key_aqui")
+        return 1
+
+    print(f"\n🚀 Generando artículo sobre: {topic}")
+    print(f"📁 Categoría: {category}\n")
+
+    # Generar post
+    result = generate_post(topic, category, api_key)
+    if not result:
+        print("❌ Error generando el artículo")
+        return 1
+
+    metadata, content = result
+
+    # Crear filename
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d %H:%M:%S -0500')
+    filename_date = now.strftime('%Y-%m-%d')
+    filename = post_filename(filename_date, metadata['title'])
+
+    # Crear archivo
+    print("📝 Creando archivo...")
+    filepath = create_post_file(
+        metadata['title'],
+        content,
+        metadata['excerpt'],
+        metadata['tags'],
+        category,
+        date_str,
+        filename,
+        DEFAULT_IMAGE_URL
+    )
+
+    print(f"✅ Artículo creado: {filepath}")
+
+    # Subir a GitHub
+    success = git_commit_and_push(filename, metadata['title'])
+
+    http_pool.print_stats()
+
+    if success == 'queued':
+        print(f"\n📥 Artículo creado y en cola de publicación")
+        print(f"📋 Título: {metadata['title']}")
+        print(f"📁 Archivo: {filename}")
+    elif success:
+        print(f"\n🎉 ¡Artículo publicado exitosamente!")
+        print(f"📋 Título: {metadata['title']}")
+        print(f"🏷️  Tags: {', '.join(metadata['tags'])}")
+        print(f"📁 Archivo: {filename}")
+    else:
+        print(f"\n⚠️  Artículo creado pero no subido a GitHub")
+        print(f"📁 Archivo local: {filepath}")
+        print(f"📋 Puedes subirlo manualmente con:")
+        print(f"   git add _posts/{filename}")
+        print(f"   git commit -m 'Add: Nuevo artículo'")
+        print(f"   git push origin main")
+
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
\ No newline at end of file
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Script ULTRA simplificado para crear posts de blog con imágenes generadas por IA.
+- No requiere instalar dependencias
+- Usa APIs gratuitas
+- Genera imágenes automáticamente
+- Sube todo a GitHub
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import sys
+import re
+
+from . import continuation
+from . import http_pool
+from . import llm_cache
+from . import model_router
+from . import provider_router
+from . import rate_limit
+from . import topic_dedup
+from .common import (CATEGORIES, create_post_file, generate_image_url, get_groq_api_key,
+                     git_commit_and_push, parse_topic_args, post_filename)
+
+def call_groq_api(topic, api_key, prompt, max_tokens=3000, route='content'):
+    """Llama a la API de Groq para generar texto.
+
+    El modelo y max_tokens los decide model_router según la ruta y el prompt;
+    max_tokens queda como valor por defecto si el prompt no pide una longitud.
+    """
+    url = "https://api.groq.com/openai/v1/chat/completions"
+    model, max_tokens = model_router.plan(route, prompt, max_tokens)
+    data = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.7,
+        "max_tokens": max_tokens
+    }
+    headers = {
+        'Content-Type': 'application/json',
+        'Authorization': f'Bearer {api_key}'
+    }
+
+    def send(messages, tokens):
+        response = rate_limit.groq_post_json(url, dict(data, messages=messages, max_tokens=tokens), headers, timeout=30)
+        choice = response['choices'][0]
+        return choice['message']['content'], choice.get('finish_reason'), response.get('usage', {}).get('completion_tokens')
+
+    is_valid = model_router.has_json if route == 'metadata' else provider_router.is_valid_article
+
+    def request_completion():
+        # Si la respuesta llega cortada por max_tokens se pide continuación
+        try:
+            return model_router.timed(
+                route, model, lambda: continuation.complete(send, prompt, max_tokens) or None, is_valid
+            )
+        except Exception as e:
+            print(f"Error calling API: {e}")
+            return None
+
+    return llm_cache.cached_call(
+        'groq', data['model'], prompt, data['temperature'], max_tokens, request_completion, is_valid
+    )
+
+def generate_post(topic, category, api_key):
+    """Genera un post completo con imagen.
+
+    Las peticiones de metadata y de contenido no dependen una de la otra,
+    así que se lanzan a la vez y se juntan antes de crear el archivo.
+    """
+
+    metadata_prompt = f"""Para un artículo de blog sobre "{topic}" en la categoría {category}, genera:
+
+1. Un título SEO-friendly (máximo 60 caracteres, atractivo y claro)
+2. Un excerpt de 1-2 líneas (máximo 160 caracteres)
+3. 4-6 tags relevantes en español (separados por comas)
+
+Responde SOLO en este formato JSON:
+{{
+    "title": "título aquí",
+    "excerpt": "excerpt aquí",
+    "tags": ["tag1", "tag2", "tag3", "tag4"]
+}}"""
+
+    content_prompt = f"""Escribe un artículo completo y detallado sobre: {topic}
+
+El artículo debe:
+- Tener entre 800-1200 palabras
+- Estar escrito en español
+- Ser informativo y técnico pero accesible
+- Incluir secciones con headers en markdown (##, ###)
+- Incluir ejemplos concretos cuando sea relevante
+- Tener un tono profesional pero cercano
+- Incluir una conclusión al final
+- Ser optimizado para SEO
+- NO incluir el título principal (solo secciones)
+
+Estructura sugerida:
+1. Introducción breve y enganchadora
+2. Contexto o explicación del tema
+3. Puntos principales con subsecciones
+4. Casos de uso o aplicaciones
+5. Conclusión
+
+Escribe el artículo completo en formato markdown:"""
+
+    # Groq primero; si tarda más que su p95, Hugging Face en paralelo
+    content_candidates = [
+        ('groq', lambda: call_groq_api(topic, api_key, content_prompt, max_tokens=4000)),
+        ('huggingface', lambda: provider_router.call_huggingface(content_prompt))
+    ]
+
+    print("📝 Generando título, metadata y contenido en paralelo...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        metadata_future = executor.submit(call_groq_api, topic, api_key, metadata_prompt, 500, 'metadata')
+        content_future = executor.submit(provider_router.hedged_call, content_candidates)
+
+        # La URL de la imagen se construye mientras esperamos a Groq
+        print("🎨 Generando imagen con IA gratuita...")
+        image_url, image_prompt = generate_image_url(topic, category)
+        print(f"✅ Imagen generada: {image_prompt}")
+
+        metadata_response = metadata_future.result()
+        content_provider, content = content_future.result()
+
+    if not metadata_response:
+        return None
+
+    json_match = re.search(r'\{.*\}', metadata_response, re.DOTALL)
+    if json_match:
+        metadata = json.loads(json_match.group())
+    else:
+        # Fallback
+        metadata = {
+            "title": topic[:60],
+            "excerpt": f"Descubre todo sobre {topic} en este artículo detallado.",
+            "tags": ["tecnologia", "actualidad", "innovacion"]
+        }
+
+    print(f"✅ Título: {metadata['title']}")
+
+    if not content:
+        # Mejor no publicar nada que publicar una plantilla vacía
+        print("❌ Ningún proveedor devolvió contenido válido (límite de la API agotado o respuesta no válida)")
+        return None
+
+    print(f"✅ Contenido generado ({content_provider})")
+    provider_router.print_latency_report(['groq', 'huggingface'])
+
+    return metadata, content, image_url
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Obtener argumentos
+    if len(argv) < 2:
+        print("🚀 SUPER POST - Generador de artículos con IA")
+        print("=" * 50)
+        print("Uso: python3 scripts/blog.py super --topic 'Tema del artículo' --category ia")
+        print("\n📋 Categorías disponibles:")
+        print("  • ia        - Inteligencia Artificial")
+        print("  • blockchain - Blockchain y Criptomonedas")
+        print("  • tutoriales - Tutoriales y Guías")
+        print("\n✨ Características:")
+        print("  • Genera texto con IA (Groq API)")
+        print("  • Crea imágenes automáticamente (gratis)")
+        print("  • Sube todo a GitHub automáticamente")
+        print("  • No requiere instalar dependencias")
+        print("\n⚙️  Opciones:")
+        print("  • --refresh   - Regenera aunque haya respuesta en caché")
+        print("  • --no-cache  - No usa la caché local de respuestas")
+        print("  • --allow-duplicate - Genera aunque el tema ya esté cubierto en el blog")
+        return 1
+
+    topic, category = parse_topic_args(argv)
+
+    # --no-cache / --refresh para la caché local de respuestas de LLM
+    llm_cache.configure_from_argv(argv)
+
+    if not topic or not category:
+        print("❌ Error: Debes especificar --topic y --category")
+        return 1
+
+    # Validar categoría
+    valid_categories = list(CATEGORIES)
+    if category not in valid_categories:
+        print(f"❌ Error: Categoría '{category}' no válida")
+        print(f"   Categorías válidas: {', '.join(valid_categories)}")
+        return 1
+
+    # No gastar llamadas a la API en un tema que el blog ya cubre
+    if not topic_dedup.check_topic(topic, '--allow-duplicate' in argv):
+        return 1
+
+    # Obtener API key (entorno o scripts/.env)
+    api_key = get_groq_api_key()
+    if not api_key:
+        print("❌ ERROR: No se encontró una API key válida de Groq")
+        print("\n🔑 Para configurar tu API key:")
+        print("1. Obtén tu key gratuita en: https://console.groq.com")
+        print("2. Edita el archivo scripts/.env:")
+        print("   GROQ_API_KEY=tu_key_aqui")
+        print("3. O usa variable de entorno: export GROQ_API_KEY=tu_key")
+        return 1
+
+    print(f"\n🚀 SUPER POST - Generando artículo...")
+    print(f"📋 Tema: {topic}")
+    print(f"📁 Categoría: {category}")
+    print(f"🎨 Imagen: Sí (IA gratuita)")
+    print(f"📤 GitHub: Automático\n")
+
+    # Generar post
+    result = generate_post(topic, category, api_key)
+    if not result:
+        print("❌ Error generando el artículo")
+        return 1
+
+    metadata, content, image_url = result
+
+    # Crear filename
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d %H:%M:%S -0500')
+    filename_date = now.strftime('%Y-%m-%d')
+    filename = post_filename(filename_date, metadata['title'])
+
+    # Crear archivo
+    print("📝 Creando archivo markdown...")
+    filepath = create_post_file(
+        metadata['title'],
+        content,
+        metadata['excerpt'],
+        metadata['tags'],
+        category,
+        date_str,
+        filename,
+        image_url,
+        footer_notes=["*Imagen generada automáticamente con IA gratuita*"]
+    )
+
+    print(f"✅ Artículo creado: {filepath}")
+
+    # Subir a GitHub
+    success = git_commit_and_push(
+        filename,
+        metadata['title'],
+        signature='🤖 Generado automáticamente con IA e imagen incluida'
+    )
+
+    http_pool.print_stats()
+
+    if success == 'queued':
+        print(f"\n📥 Artículo creado y en cola de publicación")
+        print(f"📋 Título: {metadata['title']}")
+        print(f"📁 Archivo: {filename}")
+        print(f"📤 GitHub: ⏳ Pendiente (python scripts/blog.py publish)")
+    elif success:
+        print(f"\n🎉 ¡ARTÍCULO PUBLICADO EXITOSAMENTE!")
+        print("=" * 50)
+        print(f"📋 Título: {metadata['title']}")
+        print(f"🏷️  Tags: {', '.join(metadata['tags'])}")
+        print(f"📁 Archivo: {filename}")
+        print(f"🎨 Imagen: Generada con IA gratuita")
+        print(f"📤 GitHub: ✓ Subido")
+        print(f"\n🌐 Tu artículo ya está disponible en el blog!")
+    else:
+        print(f"\n⚠️  Artículo creado pero no subido a GitHub")
+        print(f"📁 Archivo local: {filepath}")
+        print(f"📋 Puedes subirlo manualmente:")
+        print(f"   git add _posts/{filename}")
+        print(f"   git commit -m 'Add: Nuevo artículo'")
+        print(f"   git push origin main")
+
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
\ No newline at end of file
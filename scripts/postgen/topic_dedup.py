@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Detección de temas casi duplicados antes de gastar llamadas al LLM.
+
+Un tema se compara con lo que tiene su misma forma: el título de cada post
+(y los temas ya aceptados en el batch o la cola). Cada uno se resume en un
+conjunto de términos normalizados y en una firma MinHash de NUM_PERM
+valores. Las firmas se guardan en la misma base de datos que el índice de
+posts (tabla topic_minhash) y solo se recalculan para los posts cuyo hash
+de contenido cambió.
+
+Para consultar un tema candidato, las firmas se reparten en bandas LSH de
+BAND_ROWS filas en memoria (32 bandas de 4: un título con similitud 0.6
+sale candidato el 99% de las veces, uno con 0.2 el 5%). A los candidatos
+se les calcula la similitud de Jaccard exacta entre sus términos y los del
+tema. Con las firmas ya en memoria, una consulta tarda menos de un
+milisegundo.
+
+Umbrales (variables de entorno):
+- TOPIC_DUPLICATE_WARN (0.7): avisa pero deja generar
+- TOPIC_DUPLICATE_REFUSE (0.85): no genera salvo con --allow-duplicate
+- TOPIC_DUPLICATE_MIN_TERMS (2): un tema con menos términos distintos
+  ("Qué es Bitcoin" → bitcoin) puede avisar pero nunca se rechaza
+"""
+
+import os
+import re
+import json
+import zlib
+import random
+import unicodedata
+from array import array
+
+from . import post_index
+
+NUM_PERM = 128
+BAND_ROWS = 4
+
+WARN_THRESHOLD = float(os.environ.get('TOPIC_DUPLICATE_WARN', 0.7))
+REFUSE_THRESHOLD = float(os.environ.get('TOPIC_DUPLICATE_REFUSE', 0.85))
+MIN_REFUSE_TERMS = int(os.environ.get('TOPIC_DUPLICATE_MIN_TERMS', 2))
+
+# Primo de Mersenne 2^61 - 1 para las permutaciones (a*x + b) mod p
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20251118)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+STOPWORDS = {
+    'a', 'al', 'algo', 'como', 'con', 'cual', 'cuando', 'de', 'del', 'desde', 'donde', 'el',
+    'ella', 'en', 'entre', 'era', 'es', 'esta', 'este', 'esto', 'fue', 'ha', 'hacer', 'hay',
+    'la', 'las', 'le', 'lo', 'los', 'mas', 'me', 'mi', 'muy', 'no', 'nos', 'o', 'para',
+    'pero', 'por', 'que', 'se', 'ser', 'si', 'sin', 'sobre', 'su', 'sus', 'tu', 'un', 'una',
+    'uno', 'y', 'ya', 'todo', 'todos', 'cada', 'puede', 'pueden', 'tiene', 'son', 'estan',
+    'guia', 'completa', 'completo', 'tutorial', 'paso', 'introduccion', 'conclusion',
+    'mejor', 'mejores', 'nuevo', 'nueva', 'definitiva', 'funciona', 'explicado', 'explicada',
+    'the', 'and', 'of', 'to', 'in', 'for', 'is', 'vs'
+}
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topic_minhash (
+    path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    tokens TEXT NOT NULL,
+    signature BLOB NOT NULL
+);
+"""
+
+# Firmas en memoria: path -> {'title', 'tokens', 'signature'}; bandas -> paths
+_store = {'entries': {}, 'buckets': {}, 'loaded': False}
+
+def normalize(text):
+    """Minúsculas y sin tildes, para que 'Qué' y 'que' sean el mismo término."""
+    text = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in text if not unicodedata.combining(c))
+
+def terms(text):
+    """Lista de términos útiles del texto (sin stopwords, plural simple quitado)."""
+    result = []
+    for word in WORD_RE.findall(normalize(text)):
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 4 and word.endswith('s'):
+            word = word[:-1]
+        result.append(word)
+    return result
+
+def tokenize(text):
+    return set(terms(text))
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+def signature(tokens):
+    """Firma MinHash: para cada permutación, el mínimo hash de los términos."""
+    hashes = [zlib.crc32(token.encode('utf-8')) for token in tokens]
+    if not hashes:
+        return [_PRIME] * NUM_PERM
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+def _bands(sig):
+    for start in range(0, NUM_PERM, BAND_ROWS):
+        yield (start, tuple(sig[start:start + BAND_ROWS]))
+
+def _add_to_memory(key, title, tokens, sig):
+    _remove_from_memory(key)
+    _store['entries'][key] = {'title': title, 'tokens': tokens, 'signature': sig}
+    for band in _bands(sig):
+        _store['buckets'].setdefault(band, set()).add(key)
+
+def _remove_from_memory(key):
+    entry = _store['entries'].pop(key, None)
+    if entry:
+        for band in _bands(entry['signature']):
+            _store['buckets'].get(band, set()).discard(key)
+
+def refresh():
+    """Sincroniza las firmas con el índice de posts (solo recalcula lo que cambió)."""
+    conn = post_index.connect()
+    conn.executescript(SCHEMA)
+
+    posts = {post['path']: post for post in post_index.all_posts()}
+    stored = {
+        row['path']: row
+        for row in conn.execute("SELECT path, content_hash, tokens, signature FROM topic_minhash")
+    }
+
+    changed = 0
+    for path, post in posts.items():
+        row = stored.get(path)
+        if row and row['content_hash'] == post['content_hash']:
+            if path not in _store['entries']:
+                sig = list(array('Q', row['signature']))
+                _add_to_memory(path, post['title'], set(json.loads(row['tokens'])), sig)
+            continue
+
+        tokens = tokenize(post['title'] or '')
+        sig = signature(tokens)
+        conn.execute(
+            "INSERT OR REPLACE INTO topic_minhash VALUES (?, ?, ?, ?)",
+            (path, post['content_hash'], json.dumps(sorted(tokens)), array('Q', sig).tobytes())
+        )
+        _add_to_memory(path, post['title'], tokens, sig)
+        changed += 1
+
+    for path in set(stored) - set(posts):
+        conn.execute("DELETE FROM topic_minhash WHERE path = ?", (path,))
+    for key in [key for key in _store['entries'] if key in stored and key not in posts]:
+        _remove_from_memory(key)
+
+    conn.commit()
+    _store['loaded'] = True
+    return changed
+
+def add_topic(key, topic):
+    """Registra en memoria un tema aceptado (p. ej. en un batch) aunque aún no haya post."""
+    tokens = tokenize(topic)
+    _add_to_memory(key, topic, tokens, signature(tokens))
+
+def forget(prefix):
+    """Quita de memoria los temas registrados con add_topic cuya clave empieza por prefix."""
+    for key in [key for key in _store['entries'] if key.startswith(prefix)]:
+        _remove_from_memory(key)
+
+def query(topic, limit=3):
+    """Posts más parecidos al tema: lista de (similitud, clave, título), de mayor a menor.
+
+    La similitud es el índice de Jaccard entre los términos del tema y los
+    del título del post (o del tema registrado).
+    """
+    if not _store['loaded']:
+        refresh()
+
+    tokens = tokenize(topic)
+    if not tokens:
+        return []
+
+    candidates = set()
+    for band in _bands(signature(tokens)):
+        candidates |= _store['buckets'].get(band, set())
+
+    matches = []
+    for key in candidates:
+        entry = _store['entries'][key]
+        matches.append((jaccard(tokens, entry['tokens']), key, entry['title']))
+
+    matches.sort(key=lambda match: (-match[0], match[1]))
+    return matches[:limit]
+
+def check_topic(topic, allow_duplicate=False):
+    """Avisa o rechaza si el tema ya está cubierto. Devuelve True si se puede generar."""
+    matches = [match for match in query(topic) if match[0] >= WARN_THRESHOLD]
+    if not matches:
+        return True
+
+    best_score = matches[0][0]
+    # Con un solo término cualquier título que lo comparta sin más daría 100%
+    specific = len(tokenize(topic)) >= MIN_REFUSE_TERMS
+    refuse = best_score >= REFUSE_THRESHOLD and specific and not allow_duplicate
+
+    print(f"{'🚫' if refuse else '⚠️ '} El tema '{topic}' se parece a posts existentes:")
+    for score, key, title in matches:
+        print(f"   {score:.0%}  {title}  ({key})")
+
+    if refuse:
+        print(f"   Similitud ≥ {REFUSE_THRESHOLD:.0%}: no se genera. Usa --allow-duplicate para forzarlo.")
+        return False
+    return True
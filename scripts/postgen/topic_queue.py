@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Cola persistente de temas en SQLite para el programador de publicaciones.
+
+Cada tema pasa por: pending -> generating -> ready -> published (o failed
+tras MAX_ATTEMPTS intentos fallidos). Se guarda en
+scripts/.cache/topic_queue.sqlite (TOPIC_QUEUE_DB para cambiarlo), así que
+sobrevive a reinicios del proceso. Los temas se sirven por prioridad (mayor
+primero) y, a igual prioridad, por antigüedad.
+
+Un tema en ready tiene su borrador ya escrito y una hora de publicación
+(publish_at); publicarlo no necesita ninguna llamada al LLM.
+
+Varios workers (procesos en la misma máquina o en varias que compartan el
+disco) reservan temas con claim_next(): el hueco se elige y el tema se
+marca como suyo dentro de una transacción BEGIN IMMEDIATE, así que dos
+workers nunca se llevan el mismo tema ni el mismo hueco. Cada reserva
+guarda quién la hizo y cuándo; el worker la renueva con heartbeat() mientras
+genera y, si muere, pasado CLAIM_TTL (TOPIC_CLAIM_TTL, 30 min) sin latidos
+el tema vuelve a pending. Los cambios de estado de un tema en generación
+llevan el worker y solo se aplican si la reserva sigue siendo suya: un
+worker que perdió el tema no pisa la fila del nuevo dueño.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .common import SCRIPTS_DIR
+
+DB_PATH = Path(os.environ.get('TOPIC_QUEUE_DB', SCRIPTS_DIR / '.cache' / 'topic_queue.sqlite'))
+
+MAX_ATTEMPTS = 3
+CLAIM_TTL = float(os.environ.get('TOPIC_CLAIM_TTL', 30 * 60))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL UNIQUE,
+    category TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    added_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    job_id TEXT,
+    draft TEXT,
+    publish_at TEXT,
+    published_at REAL,
+    error TEXT,
+    claimed_by TEXT,
+    claimed_at REAL
+);
+CREATE INDEX IF NOT EXISTS topics_status ON topics (status, priority DESC, added_at);
+"""
+
+# Una conexión por hilo: el latido de la reserva va en su propio hilo
+_local = threading.local()
+
+def connect():
+    """Abre (una vez por hilo) la base de datos y crea el esquema si falta."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        return conn
+
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+
+    _local.conn = conn
+    return conn
+
+def add(topic, category, priority=0):
+    """Añade un tema; devuelve su id o None si ya estaba en la cola."""
+    conn = connect()
+    cursor = conn.execute(
+        "INSERT OR IGNORE INTO topics (topic, category, priority, added_at) VALUES (?, ?, ?, ?)",
+        (topic, category, priority, time.time())
+    )
+    conn.commit()
+    return cursor.lastrowid if cursor.rowcount else None
+
+def get(topic_id):
+    return connect().execute("SELECT * FROM topics WHERE id = ?", (topic_id,)).fetchone()
+
+def list_topics(status=None):
+    """Temas de la cola (de un estado o todos), en el orden en que se servirán."""
+    query = "SELECT * FROM topics"
+    params = ()
+    if status:
+        query += " WHERE status = ?"
+        params = (status,)
+    query += " ORDER BY publish_at IS NULL, publish_at, priority DESC, added_at"
+    return connect().execute(query, params).fetchall()
+
+def counts():
+    """Número de temas por estado."""
+    return {row[0]: row[1] for row in connect().execute(
+        "SELECT status, COUNT(*) FROM topics GROUP BY status")}
+
+def pending_categories():
+    return [row[0] for row in connect().execute(
+        "SELECT DISTINCT category FROM topics WHERE status = 'pending'")]
+
+def next_topic(category):
+    """El tema pendiente de la categoría que toca generar: más prioridad y más antiguo."""
+    return connect().execute(
+        "SELECT * FROM topics WHERE status = 'pending' AND category = ? "
+        "ORDER BY priority DESC, added_at LIMIT 1",
+        (category,)
+    ).fetchone()
+
+def scheduled_on(day):
+    """Temas en generación o listos con hora de publicación en ese día (YYYY-MM-DD)."""
+    return connect().execute(
+        "SELECT * FROM topics WHERE status IN ('generating', 'ready') AND substr(publish_at, 1, 10) = ?",
+        (day,)
+    ).fetchall()
+
+def in_flight():
+    """Temas ya reservados para una publicación futura (generándose o listos)."""
+    return connect().execute(
+        "SELECT COUNT(*) FROM topics WHERE status IN ('generating', 'ready')").fetchone()[0]
+
+def claim_next(plan, worker, ahead):
+    """Reserva el siguiente tema para `worker` de forma atómica.
+
+    plan() devuelve (publish_at, fila) o None y se evalúa con la cola
+    bloqueada para escritura, así que el hueco que elige no puede dárselo
+    otro worker a la vez. No reserva nada si ya hay `ahead` temas por
+    delante. Devuelve la fila reservada o None.
+    """
+    conn = connect()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        planned = plan() if in_flight() < ahead else None
+        if not planned:
+            conn.rollback()
+            return None
+        publish_at, row = planned
+        conn.execute(
+            "UPDATE topics SET status = 'generating', publish_at = ?, job_id = ?, error = NULL, "
+            "claimed_by = ?, claimed_at = ? WHERE id = ? AND status = 'pending'",
+            (publish_at, f"topic-{row['id']}", worker, time.time(), row['id'])
+        )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return get(row['id'])
+
+def _update(sql, params, topic_id, worker=None):
+    """UPDATE de un tema; con worker, solo si sigue reservado por él. True si cambió la fila."""
+    conn = connect()
+    if worker is None:
+        cursor = conn.execute(f"{sql} WHERE id = ?", params + (topic_id,))
+    else:
+        cursor = conn.execute(f"{sql} WHERE id = ? AND status = 'generating' AND claimed_by = ?",
+                              params + (topic_id, worker))
+    conn.commit()
+    return cursor.rowcount == 1
+
+def heartbeat(topic_id, worker):
+    """Renueva la reserva del worker. False si ya no es suya (caducó y la tomó otro)."""
+    return _update("UPDATE topics SET claimed_at = ?", (time.time(),), topic_id, worker)
+
+def unclaim(topic_id, worker):
+    """Suelta una reserva sin contarla como intento fallido (p. ej. al parar el worker)."""
+    return _update("UPDATE topics SET status = 'pending', publish_at = NULL, claimed_by = NULL",
+                   (), topic_id, worker)
+
+def mark_ready(topic_id, draft, worker):
+    return _update("UPDATE topics SET status = 'ready', draft = ?, claimed_by = NULL", (draft,), topic_id, worker)
+
+def reschedule(topic_id, publish_at, draft):
+    conn = connect()
+    conn.execute("UPDATE topics SET publish_at = ?, draft = ? WHERE id = ?", (publish_at, draft, topic_id))
+    conn.commit()
+
+def mark_published(topic_id):
+    conn = connect()
+    conn.execute("UPDATE topics SET status = 'published', published_at = ? WHERE id = ?",
+                 (time.time(), topic_id))
+    conn.commit()
+
+def mark_failed(topic_id, error, worker=None):
+    return _update("UPDATE topics SET status = 'failed', error = ?, claimed_by = NULL",
+                   (str(error),), topic_id, worker)
+
+def release(topic_id, error, worker=None):
+    """Devuelve un tema a pending tras un fallo (o a failed si agotó los intentos).
+
+    Sin worker es el publicador soltando un tema listo (borrador perdido).
+    """
+    return _update(
+        "UPDATE topics SET attempts = attempts + 1, error = ?, publish_at = NULL, claimed_by = NULL, "
+        "status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END",
+        (str(error), MAX_ATTEMPTS), topic_id, worker
+    )
+
+def due(now):
+    """Temas listos cuya hora de publicación (YYYY-MM-DD HH:MM:SS) ya llegó."""
+    return connect().execute(
+        "SELECT * FROM topics WHERE status = 'ready' AND publish_at <= ? ORDER BY publish_at",
+        (now,)
+    ).fetchall()
+
+def recover_stale():
+    """Vuelve a pending los temas reservados hace más de CLAIM_TTL (el worker murió).
+
+    Lo ya generado sigue en el diario de trabajos, así que no se vuelve a pagar.
+    """
+    conn = connect()
+    cursor = conn.execute(
+        "UPDATE topics SET status = 'pending', publish_at = NULL, claimed_by = NULL "
+        "WHERE status = 'generating' AND (claimed_at IS NULL OR claimed_at < ?)",
+        (time.time() - CLAIM_TTL,)
+    )
+    conn.commit()
+    return cursor.rowcount
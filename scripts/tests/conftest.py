@@ -0,0 +1,43 @@
+"""
+Configuración común de los tests de scripts/postgen.
+
+Los tests importan el paquete igual que blog.py (con scripts/ en sys.path)
+y nunca tocan scripts/.cache ni la red: cada módulo con estado en disco se
+redirige a un directorio temporal.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from postgen import llm_cache, model_router  # noqa: E402
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Caché de LLM vacía y en modo normal en un directorio temporal."""
+    monkeypatch.setattr(llm_cache, 'CACHE_DIR', tmp_path / 'llm')
+    monkeypatch.setattr(llm_cache, '_mode', 'on')
+    return tmp_path / 'llm'
+
+@pytest.fixture
+def route_stats(tmp_path, monkeypatch):
+    """Estadísticas de rutas de modelos vacías en un archivo temporal."""
+    monkeypatch.setattr(model_router, 'STATS_FILE', tmp_path / 'model_routes.json')
+    monkeypatch.setattr(model_router, '_stats', {})
+    return model_router._stats
+
+@pytest.fixture
+def posts_dir(tmp_path, monkeypatch):
+    """_posts/, diario de trabajos y cola de publicación vacíos en un directorio temporal."""
+    from postgen import common, generate, job_journal, publish_queue
+
+    posts = tmp_path / '_posts'
+    posts.mkdir()
+    for module in (common, generate, job_journal):
+        monkeypatch.setattr(module, 'POSTS_DIR', posts)
+    monkeypatch.setattr(job_journal, 'JOBS_DIR', tmp_path / 'jobs')
+    monkeypatch.setattr(publish_queue, 'QUEUE_FILE', tmp_path / 'publish_queue.json')
+    return posts
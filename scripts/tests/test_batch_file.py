@@ -0,0 +1,58 @@
+import pytest
+
+from postgen import generate
+
+def write_csv(tmp_path, text):
+    path = tmp_path / 'temas.csv'
+    path.write_text(text, encoding='utf-8')
+    return path
+
+def test_error_cites_the_file_line_after_a_header(tmp_path):
+    path = write_csv(tmp_path, 'topic,category\nQué es un rollup,blockchain\nRedes neuronales,cocina\n')
+
+    with pytest.raises(ValueError, match='Línea 3:'):
+        generate.read_batch_file(path)
+
+def test_error_cites_the_file_line_without_a_header(tmp_path):
+    path = write_csv(tmp_path, 'Qué es un rollup,blockchain\nRedes neuronales,ia,01-12-2025\n')
+
+    with pytest.raises(ValueError, match='Línea 2:'):
+        generate.read_batch_file(path)
+
+def test_comments_and_blank_lines_are_skipped(tmp_path):
+    path = write_csv(tmp_path, 'topic,category,date\n# pendiente\n\nQué es un rollup,blockchain,2025-12-01\n')
+
+    jobs = generate.read_batch_file(path)
+
+    assert [(job['topic'], job['date'].strftime('%Y-%m-%d')) for job in jobs] == [('Qué es un rollup', '2025-12-01')]
+
+def batch_jobs(count, day='2025-12-01'):
+    return [{'topic': f'Tema {i}', 'category': 'ia', 'date': generate.parse_post_date(day)}
+            for i in range(count)]
+
+@pytest.fixture
+def published(posts_dir, monkeypatch):
+    posts = {}
+    monkeypatch.setattr(generate.post_index, 'posts_on', lambda day: posts.get(day, []))
+    monkeypatch.setattr(generate, 'DAILY_LIMIT', 5)
+    return posts
+
+def test_batch_keeps_only_what_fits_in_the_daily_limit(published):
+    published['2025-12-01'] = [{'path': 'a.md'}, {'path': 'b.md'}]
+
+    jobs = generate.filter_daily_limit(batch_jobs(20) + batch_jobs(2, '2025-12-02'))
+
+    assert [job['topic'] for job in jobs] == ['Tema 0', 'Tema 1', 'Tema 2', 'Tema 0', 'Tema 1']
+
+def test_daily_limit_can_be_overridden(published):
+    assert len(generate.filter_daily_limit(batch_jobs(20), ignore_limit=True)) == 20
+
+def test_rerun_keeps_jobs_whose_post_was_already_written(published):
+    jobs = batch_jobs(6)
+    entry = generate.job_journal.start('generate', 'Tema 5', 'ia', '2025-12-01', '2025-12-01')
+    generate.job_journal.complete(entry, 'written', '2025-12-01-tema-5.md')
+    published['2025-12-01'] = [{'path': '2025-12-01-tema-5.md'}]
+
+    kept = [job['topic'] for job in generate.filter_daily_limit(jobs)]
+
+    assert kept == ['Tema 0', 'Tema 1', 'Tema 2', 'Tema 3', 'Tema 5']
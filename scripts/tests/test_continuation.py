@@ -0,0 +1,72 @@
+from postgen import continuation
+
+PROMPT = 'Escribe un artículo sobre Bitcoin'
+
+def sender(*responses):
+    """send() falso que devuelve las respuestas en orden y apunta cada llamada."""
+    pending = list(responses)
+    calls = []
+
+    def send(messages, max_tokens):
+        calls.append((messages, max_tokens))
+        return pending.pop(0)
+
+    send.calls = calls
+    return send
+
+def test_complete_answer_is_not_continued():
+    send = sender(('Artículo completo', 'stop', 10))
+
+    assert continuation.complete(send, PROMPT, 4000) == 'Artículo completo'
+    assert len(send.calls) == 1
+
+def test_cut_answer_is_continued_from_its_tail():
+    send = sender(('Primera parte ', 'length', 100), ('y segunda parte.', 'stop', 50))
+
+    assert continuation.complete(send, PROMPT, 4000) == 'Primera parte y segunda parte.'
+    messages, _ = send.calls[1]
+    assert messages == continuation.continuation_messages(PROMPT, 'Primera parte ')
+    assert messages[1] == {'role': 'assistant', 'content': 'Primera parte '}
+
+def test_tail_is_limited_to_tail_chars():
+    text = 'a' * (continuation.TAIL_CHARS + 10)
+
+    messages = continuation.continuation_messages(PROMPT, text)
+
+    assert len(messages[1]['content']) == continuation.TAIL_CHARS
+
+def test_continuations_stop_at_max_continuations():
+    responses = [(f'parte{i} ', 'length', 10) for i in range(continuation.MAX_CONTINUATIONS + 2)]
+    send = sender(*responses)
+
+    text = continuation.complete(send, PROMPT, 4000)
+
+    assert len(send.calls) == continuation.MAX_CONTINUATIONS + 1
+    assert text == ' '.join(f'parte{i}' for i in range(continuation.MAX_CONTINUATIONS + 1))
+
+def test_continuations_stop_when_the_budget_is_spent(monkeypatch):
+    monkeypatch.setattr(continuation, 'TOKEN_BUDGET', 1000)
+    send = sender(('uno ', 'length', 700), ('dos ', 'length', 300), ('tres', 'stop', 10))
+
+    assert continuation.complete(send, PROMPT, 4000) == 'uno dos'
+    # La continuación solo puede pedir lo que queda del presupuesto
+    assert send.calls[1][1] == 300
+    assert len(send.calls) == 2
+
+def test_empty_continuation_stops():
+    send = sender(('Texto cortado', 'length', 10), ('  ', 'length', 0))
+
+    assert continuation.complete(send, PROMPT, 4000) == 'Texto cortado'
+    assert len(send.calls) == 2
+
+def test_join_removes_the_repeated_overlap():
+    text = 'El consenso de Bitcoin se basa en la prueba de trabajo'
+    addition = 'se basa en la prueba de trabajo, que exige gastar energía.'
+
+    joined = continuation.join_continuation(text, addition)
+
+    assert joined == 'El consenso de Bitcoin se basa en la prueba de trabajo, que exige gastar energía.'
+
+def test_join_keeps_short_coincidences():
+    # Menos de 21 caracteres repetidos puede ser casualidad: no se recorta
+    assert continuation.join_continuation('Fin de la frase.', 'frase. Otra') == 'Fin de la frase.frase. Otra'
@@ -0,0 +1,121 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import convert_svg_images  # noqa: E402
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """SVGs en un directorio temporal y un conversor falso que escribe los destinos.
+
+    Los destinos de `backend.skip` no se escriben y los de `backend.fail` se
+    marcan como fallidos, igual que hacen cairosvg y wand.
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'assets' / 'images').mkdir(parents=True)
+    (tmp_path / 'assets' / 'images' / 'logo.svg').write_text(SVG, encoding='utf-8')
+
+    class Backend:
+        converted = []
+        skip = set()
+        fail = set()
+
+    def convert(jobs, sources, failed):
+        for job in jobs:
+            Backend.converted.append(job['target'])
+            if job['target'] in Backend.fail:
+                failed.add(job['target'])
+            elif job['target'] not in Backend.skip:
+                Path(job['target']).write_bytes(b'imagen')
+        return True
+
+    monkeypatch.setattr(convert_svg_images, 'convert_with_inkscape', lambda jobs: False)
+    monkeypatch.setattr(convert_svg_images, 'convert_with_cairosvg', convert)
+    return Backend
+
+def jobs():
+    return [convert_svg_images.parse_job('assets/images/logo.svg', 'assets/images/logo.png', '600x600'),
+            convert_svg_images.parse_job('assets/images/logo.svg', 'assets/images/logo.webp', '256x256')]
+
+def conversions():
+    with open(convert_svg_images.CONVERSIONS_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+def test_unchanged_jobs_are_skipped(backend):
+    assert convert_svg_images.convert_batch(jobs()) == (2, 0, 0)
+    backend.converted.clear()
+
+    assert convert_svg_images.convert_batch(jobs()) == (0, 2, 0)
+    assert backend.converted == []
+
+def test_force_converts_unchanged_jobs(backend):
+    convert_svg_images.convert_batch(jobs())
+    backend.converted.clear()
+
+    assert convert_svg_images.convert_batch(jobs(), force=True) == (2, 0, 0)
+    assert len(backend.converted) == 2
+
+def test_changed_source_or_spec_is_converted_again(backend, tmp_path):
+    convert_svg_images.convert_batch(jobs())
+    backend.converted.clear()
+
+    resized = [jobs()[0], convert_svg_images.parse_job('assets/images/logo.svg', 'assets/images/logo.webp', '512x512')]
+    assert convert_svg_images.convert_batch(resized) == (1, 1, 0)
+    assert backend.converted == ['assets/images/logo.webp']
+
+    (tmp_path / 'assets' / 'images' / 'logo.svg').write_text(SVG.replace('10', '20'), encoding='utf-8')
+    assert convert_svg_images.convert_batch(resized) == (2, 0, 0)
+
+def test_deleted_target_is_converted_again(backend, tmp_path):
+    convert_svg_images.convert_batch(jobs())
+    (tmp_path / 'assets' / 'images' / 'logo.png').unlink()
+
+    assert convert_svg_images.convert_batch(jobs()) == (1, 1, 0)
+
+def test_target_not_written_counts_as_failed(backend):
+    backend.skip = {'assets/images/logo.webp'}
+
+    assert convert_svg_images.convert_batch(jobs()) == (1, 0, 1)
+    assert list(conversions()) == ['assets/images/logo.png']
+
+def test_stale_target_counts_as_failed(backend, tmp_path):
+    # Un destino de una ejecución anterior que esta no reescribió no cuenta como convertido
+    target = tmp_path / 'assets' / 'images' / 'logo.webp'
+    target.write_bytes(b'vieja')
+    old = target.stat().st_mtime - 60
+    os.utime(target, (old, old))
+    backend.skip = {'assets/images/logo.webp'}
+
+    assert convert_svg_images.convert_batch(jobs()) == (1, 0, 1)
+    assert 'assets/images/logo.webp' not in conversions()
+
+def test_failed_job_keeps_its_old_hash(backend, tmp_path):
+    convert_svg_images.convert_batch(jobs())
+    before = conversions()
+
+    (tmp_path / 'assets' / 'images' / 'logo.svg').write_text(SVG.replace('10', '20'), encoding='utf-8')
+    backend.fail = {'assets/images/logo.webp'}
+    assert convert_svg_images.convert_batch(jobs()) == (1, 0, 1)
+
+    after = conversions()
+    assert after['assets/images/logo.webp'] == before['assets/images/logo.webp']
+    assert after['assets/images/logo.png'] != before['assets/images/logo.png']
+
+    # La siguiente ejecución lo reintenta aunque el SVG ya no cambie
+    backend.fail = set()
+    backend.converted.clear()
+    assert convert_svg_images.convert_batch(jobs()) == (1, 1, 0)
+    assert backend.converted == ['assets/images/logo.webp']
+
+def test_no_backend_returns_none(backend, monkeypatch):
+    monkeypatch.setattr(convert_svg_images, 'convert_with_cairosvg', lambda jobs, sources, failed: False)
+    monkeypatch.setattr(convert_svg_images, 'convert_with_wand', lambda jobs, failed: False)
+
+    assert convert_svg_images.convert_batch(jobs()) is None
@@ -0,0 +1,89 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytest.importorskip('numpy')
+pytest.importorskip('PIL')
+
+import generate_seo_images  # noqa: E402
+from scripts.postgen import post_index  # noqa: E402
+
+def post(name, title, tags=('bitcoin',)):
+    return {'path': f'{name}.md', 'slug': name[11:], 'title': title,
+            'categories': ['blockchain'], 'tags': list(tags)}
+
+@pytest.fixture
+def posts(tmp_path, monkeypatch):
+    """Índice de posts falso (lista `posts`) y tarjetas en un directorio temporal."""
+    monkeypatch.chdir(tmp_path)
+    indexed = [post('2025-01-01-que-es-bitcoin', 'Qué es Bitcoin'),
+               post('2025-01-02-que-es-un-rollup', 'Qué es un rollup')]
+    monkeypatch.setattr(post_index, 'all_posts', lambda: list(indexed))
+    return indexed
+
+def render(force=False):
+    return generate_seo_images.render_post_cards(force, workers=1)
+
+def card(name):
+    return Path(generate_seo_images.CARDS_DIR) / f'{name}.jpg'
+
+def manifest():
+    with open(generate_seo_images.CARDS_MANIFEST, encoding='utf-8') as f:
+        return json.load(f)
+
+def age(path):
+    """Atrasa el mtime de la tarjeta para ver si la siguiente ejecución la reescribe."""
+    old = path.stat().st_mtime - 60
+    os.utime(path, (old, old))
+    return path.stat().st_mtime
+
+def test_typical_run_renders_only_new_posts(posts):
+    assert render() == 2
+    assert set(manifest()) == {'_posts/2025-01-01-que-es-bitcoin.md', '_posts/2025-01-02-que-es-un-rollup.md'}
+    assert manifest()['_posts/2025-01-01-que-es-bitcoin.md']['card'] == \
+        '/assets/images/og/2025-01-01-que-es-bitcoin.jpg'
+    mtime = age(card('2025-01-01-que-es-bitcoin'))
+
+    posts.append(post('2025-01-03-que-es-ethereum', 'Qué es Ethereum'))
+    assert render() == 1
+
+    assert card('2025-01-03-que-es-ethereum').exists()
+    assert card('2025-01-01-que-es-bitcoin').stat().st_mtime == mtime
+    assert len(manifest()) == 3
+
+def test_changed_title_or_tags_render_the_card_again(posts):
+    render()
+
+    posts[0] = post('2025-01-01-que-es-bitcoin', 'Qué es Bitcoin y cómo funciona')
+    assert render() == 1
+    posts[1] = post('2025-01-02-que-es-un-rollup', 'Qué es un rollup', tags=('ethereum', 'capa-2'))
+    assert render() == 1
+
+def test_missing_card_is_rendered_again(posts):
+    render()
+    card('2025-01-01-que-es-bitcoin').unlink()
+
+    assert render() == 1
+    assert card('2025-01-01-que-es-bitcoin').exists()
+
+def test_force_renders_every_card(posts):
+    render()
+    mtime = age(card('2025-01-01-que-es-bitcoin'))
+
+    assert render(force=True) == 2
+    assert card('2025-01-01-que-es-bitcoin').stat().st_mtime > mtime
+
+def test_cards_of_deleted_posts_are_removed(posts):
+    render()
+
+    posts.pop(0)
+    assert render() == 0
+
+    assert not card('2025-01-01-que-es-bitcoin').exists()
+    assert card('2025-01-02-que-es-un-rollup').exists()
+    assert list(manifest()) == ['_posts/2025-01-02-que-es-un-rollup.md']
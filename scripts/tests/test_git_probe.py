@@ -0,0 +1,39 @@
+import pytest
+
+from postgen import git_probe
+
+@pytest.fixture(autouse=True)
+def repo(tmp_path, monkeypatch):
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'config').write_text('[core]\n', encoding='utf-8')
+    monkeypatch.setattr(git_probe, 'PROJECT_ROOT', tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def probes(monkeypatch):
+    calls = []
+
+    def probe(remote='origin', branch='main'):
+        calls.append(remote)
+        git_probe.invalidate()
+        return False, 'Permission denied'
+
+    monkeypatch.setattr(git_probe, 'probe', probe)
+    return calls
+
+def test_publish_path_uses_the_cached_ok(probes):
+    git_probe.record_success()
+    assert git_probe.check() == (True, '', True)
+    assert probes == []
+
+def test_forced_check_tests_the_credentials_again(probes):
+    git_probe.record_success()
+    assert git_probe.check(force=True) == (False, 'Permission denied', False)
+    assert probes == ['origin']
+    assert not git_probe.is_healthy()
+
+def test_config_change_invalidates_the_cache(repo, probes):
+    git_probe.record_success()
+    (repo / '.git' / 'config').write_text('[remote "origin"]\n\turl = https://example.invalid/x.git\n',
+                                          encoding='utf-8')
+    assert not git_probe.is_healthy()
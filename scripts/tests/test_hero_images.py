@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+from postgen import hero_images
+
+Image = pytest.importorskip('PIL.Image')
+
+@pytest.fixture(autouse=True)
+def images_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(hero_images, 'IMAGES_DIR', tmp_path / 'images')
+    monkeypatch.setattr(hero_images, 'POSTS_DIR', tmp_path / '_posts')
+    (tmp_path / 'images').mkdir()
+    (tmp_path / '_posts').mkdir()
+    return tmp_path / 'images'
+
+def png(width, height):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), (200, 50, 50)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+def test_widths_never_exceed_the_source():
+    assert hero_images.variant_widths(1600) == [400, 800, 1200]
+    assert hero_images.variant_widths(1000) == [400, 800]
+    assert hero_images.variant_widths(250) == [250]
+
+def test_main_width_is_the_largest_up_to_main_width():
+    assert hero_images.main_width([400, 800, 1200]) == 800
+    assert hero_images.main_width([400]) == 400
+    assert hero_images.main_width([250]) == 250
+
+def test_small_source_is_not_upscaled(images_dir):
+    digest, widths = hero_images.build_variants('abc', png(640, 360))
+
+    assert (digest, widths) == ('abc', [400])
+    assert sorted(path.name for path in images_dir.iterdir()) == ['abc-400.jpg', 'abc-400.webp']
+    with Image.open(images_dir / 'abc-400.jpg') as image:
+        assert image.size == (400, 225)
+
+def test_has_variants_checks_the_recorded_widths(images_dir):
+    hero_images.build_variants('abc', png(640, 360))
+
+    assert hero_images.has_variants('abc', {'abc': [400]})
+    assert not hero_images.has_variants('abc', {'abc': [400, 800]})
+    # Generado antes de guardar los anchos: se vuelve a generar
+    assert not hero_images.has_variants('abc', {})
+
+def test_front_matter_lists_only_generated_widths(tmp_path):
+    url = 'https://images.unsplash.com/photo-1'
+    post = tmp_path / '_posts' / '2025-01-01-post.md'
+    post.write_text(f'---\ntitle: "Post"\nimage: "{url}"\n---\nTexto\n', encoding='utf-8')
+
+    assert hero_images.localize_post(post.name, url, 'abc', [400])
+
+    text = post.read_text(encoding='utf-8')
+    assert 'image: "/assets/images/posts/abc-400.jpg"\n' in text
+    assert 'image_widths: [400]\n' in text
+    assert f'image_source: "{url}"\n' in text
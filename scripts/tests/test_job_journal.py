@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from postgen import generate, job_journal, publish_queue
+
+METADATA = {'title': 'Qué es Bitcoin', 'excerpt': 'Resumen', 'tags': ['bitcoin', 'cripto']}
+CONTENT = 'palabra ' * 200
+
+def start(topic='Qué es Bitcoin'):
+    return job_journal.start('generate', topic, 'blockchain', '2025-01-01', '2025-01-01 09:00:00 -0500')
+
+def run(entry):
+    return asyncio.run(generate.generate_job(None, asyncio.Semaphore(1), entry))
+
+def test_start_resumes_the_saved_job(posts_dir):
+    entry = start()
+    job_journal.complete(entry, 'metadata', METADATA)
+
+    resumed = start()
+
+    assert resumed['id'] == '2025-01-01-que-es-bitcoin'
+    assert resumed['stages'] == {'metadata': METADATA}
+    assert job_journal.last_stage(resumed) == 'metadata'
+
+def test_job_starts_over_when_its_post_was_deleted(posts_dir):
+    entry = start()
+    job_journal.complete(entry, 'content', CONTENT)
+    job_journal.complete(entry, 'written', '2025-01-01-que-es-bitcoin.md')
+
+    assert start()['stages'] == {}
+
+def test_failure_keeps_the_finished_stages(posts_dir):
+    entry = start()
+    job_journal.complete(entry, 'content', CONTENT)
+    job_journal.fail(entry, RuntimeError('429'))
+
+    resumed = start()
+    assert resumed['error'] == '429'
+    assert resumed['stages'] == {'content': CONTENT}
+
+    job_journal.complete(resumed, 'image_url', None)
+    assert 'error' not in job_journal.load(resumed['id'])
+
+def test_resumed_job_does_not_call_the_api_again(posts_dir, monkeypatch):
+    def no_api(*args, **kwargs):
+        raise AssertionError('la etapa ya estaba en el diario')
+
+    monkeypatch.setattr(generate, 'groq_completion', no_api)
+    monkeypatch.setattr(generate, 'get_unsplash_image', no_api)
+    entry = start()
+    for stage, value in (('metadata', METADATA), ('content', CONTENT), ('image_url', None)):
+        job_journal.complete(entry, stage, value)
+
+    filepath, metadata = run(start())
+
+    assert metadata == METADATA
+    assert filepath == str(posts_dir / '2025-01-01-que-es-bitcoin.md')
+    assert job_journal.last_stage(job_journal.load(entry['id'])) == 'queued'
+    assert [e['filename'] for e in publish_queue.load_queue()['entries']] == ['2025-01-01-que-es-bitcoin.md']
+
+    # Otra vez desde el diario: ni se reescribe ni se encola dos veces
+    (posts_dir / '2025-01-01-que-es-bitcoin.md').write_text('revisado', encoding='utf-8')
+    run(start())
+    assert (posts_dir / '2025-01-01-que-es-bitcoin.md').read_text(encoding='utf-8') == 'revisado'
+    assert len(publish_queue.load_queue()['entries']) == 1
+
+def test_content_failure_is_recorded_instead_of_a_placeholder(posts_dir, cache_dir, route_stats, monkeypatch):
+    def groq_down(client, **kwargs):
+        raise RuntimeError('servicio no disponible')
+
+    monkeypatch.setattr(generate, 'groq_completion', groq_down)
+    entry = start()
+    job_journal.complete(entry, 'metadata', METADATA)
+    job_journal.complete(entry, 'image_url', None)
+
+    with pytest.raises(RuntimeError):
+        run(entry)
+
+    saved = job_journal.load(entry['id'])
+    assert saved['error'] == 'servicio no disponible'
+    assert set(saved['stages']) == {'metadata', 'image_url'}
+    assert not list(posts_dir.iterdir())
+    assert job_journal.unfinished_jobs()[0]['id'] == entry['id']
+
+def test_commit_and_push_finish_the_job(posts_dir):
+    entry = start()
+    job_journal.complete(entry, 'written', '2025-01-01-que-es-bitcoin.md')
+
+    job_journal.record_commit(['2025-01-01-que-es-bitcoin.md'], 'abc123')
+    job_journal.record_push()
+
+    saved = job_journal.load(entry['id'])
+    assert saved['stages']['committed'] == 'abc123'
+    assert job_journal.is_finished(saved)
+    assert job_journal.unfinished_jobs() == []
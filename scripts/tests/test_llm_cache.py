@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from postgen import llm_cache, model_router
+
+def call(prompt, generate, is_valid=None):
+    return llm_cache.cached_call('groq', 'modelo', prompt, 0.7, 300, generate, is_valid)
+
+def test_invalid_response_is_not_cached(cache_dir, route_stats):
+    responses = iter(['no es json', '{"title": "Bitcoin"}'])
+
+    def generate():
+        return model_router.timed('metadata', 'modelo', lambda: next(responses), model_router.has_json)
+
+    with pytest.raises(model_router.InvalidResponse):
+        call('prompt', generate, model_router.has_json)
+    assert llm_cache.get('groq', 'modelo', 'prompt', 0.7, 300) is None
+    assert route_stats['metadata']['modelo']['outcomes'] == [0]
+
+    # El siguiente intento vuelve a llamar a la API y esa respuesta sí se guarda
+    assert call('prompt', generate, model_router.has_json) == '{"title": "Bitcoin"}'
+    assert llm_cache.get('groq', 'modelo', 'prompt', 0.7, 300) == '{"title": "Bitcoin"}'
+
+def test_empty_response_is_not_cached(cache_dir):
+    assert call('prompt', lambda: None) is None
+    assert call('prompt', lambda: '') == ''
+    assert not list(cache_dir.glob('*/*.json'))
+
+def test_cached_entry_failing_validation_is_a_miss(cache_dir):
+    # Entrada envenenada de antes de validar: no se devuelve y se sustituye
+    llm_cache.put('groq', 'modelo', 'prompt', 0.7, 300, 'cortado a medi')
+    assert call('prompt', lambda: '{"ok": 1}', model_router.has_json) == '{"ok": 1}'
+    assert llm_cache.get('groq', 'modelo', 'prompt', 0.7, 300) == '{"ok": 1}'
+
+def test_key_changes_with_every_parameter():
+    key = llm_cache.cache_key('groq', 'modelo', 'prompt', 0.7, 300)
+
+    assert key == llm_cache.cache_key('groq', 'modelo', 'prompt', 0.7, 300)
+    assert len({key,
+                llm_cache.cache_key('huggingface', 'modelo', 'prompt', 0.7, 300),
+                llm_cache.cache_key('groq', 'otro', 'prompt', 0.7, 300),
+                llm_cache.cache_key('groq', 'modelo', 'prompt.', 0.7, 300),
+                llm_cache.cache_key('groq', 'modelo', 'prompt', 0.5, 300),
+                llm_cache.cache_key('groq', 'modelo', 'prompt', 0.7, 301)}) == 6
+
+def test_refresh_skips_the_read_but_stores_the_new_response(cache_dir, monkeypatch):
+    llm_cache.put('groq', 'modelo', 'prompt', 0.7, 300, 'vieja')
+    monkeypatch.setattr(llm_cache, '_mode', 'refresh')
+
+    assert call('prompt', lambda: 'nueva') == 'nueva'
+
+    monkeypatch.setattr(llm_cache, '_mode', 'on')
+    assert llm_cache.get('groq', 'modelo', 'prompt', 0.7, 300) == 'nueva'
+
+def test_refresh_argument_reaches_the_api(cache_dir):
+    llm_cache.put('groq', 'modelo', 'prompt', 0.7, 300, 'vieja')
+
+    response = llm_cache.cached_call('groq', 'modelo', 'prompt', 0.7, 300, lambda: 'nueva', refresh=True)
+
+    assert response == 'nueva'
+    assert llm_cache.get('groq', 'modelo', 'prompt', 0.7, 300) == 'nueva'
+
+def test_no_cache_neither_reads_nor_writes(cache_dir, monkeypatch):
+    llm_cache.put('groq', 'modelo', 'prompt', 0.7, 300, 'vieja')
+    monkeypatch.setattr(llm_cache, '_mode', 'off')
+
+    assert call('prompt', lambda: 'nueva') == 'nueva'
+    assert not llm_cache.contains('groq', 'modelo', 'prompt', 0.7, 300)
+
+    monkeypatch.setattr(llm_cache, '_mode', 'on')
+    assert llm_cache.get('groq', 'modelo', 'prompt', 0.7, 300) == 'vieja'
+
+def test_eviction_removes_the_least_recently_used(cache_dir, monkeypatch):
+    monkeypatch.setattr(llm_cache, 'MAX_BYTES', 10 ** 9)
+    for i, prompt in enumerate(('a', 'b', 'c')):
+        llm_cache.put('groq', 'modelo', prompt, 0.7, 300, 'x' * 100)
+        path = llm_cache._entry_path(llm_cache.cache_key('groq', 'modelo', prompt, 0.7, 300))
+        os.utime(path, (1000 + i, 1000 + i))
+
+    # Leer 'a' la marca como usada ahora: la más antigua pasa a ser 'b'
+    assert llm_cache.get('groq', 'modelo', 'a', 0.7, 300)
+    kept = sum(llm_cache._entry_path(llm_cache.cache_key('groq', 'modelo', prompt, 0.7, 300)).stat().st_size
+               for prompt in ('a', 'c'))
+
+    assert llm_cache.evict(kept) == 1
+    assert llm_cache.contains('groq', 'modelo', 'a', 0.7, 300)
+    assert not llm_cache.contains('groq', 'modelo', 'b', 0.7, 300)
+    assert llm_cache.contains('groq', 'modelo', 'c', 0.7, 300)
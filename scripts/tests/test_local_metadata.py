@@ -0,0 +1,74 @@
+from postgen import local_metadata, post_index
+
+POSTS = [
+    {'title': 'Qué son los rollups de Ethereum', 'excerpt': 'Escalabilidad en capa 2',
+     'tags': ['rollups', 'ethereum', 'Layer 2'], 'categories': ['blockchain']},
+    {'title': 'Arbitrum frente a Optimism', 'excerpt': 'Dos rollups optimistas comparados',
+     'tags': ['arbitrum', 'optimism', 'rollups'], 'categories': ['blockchain']},
+    {'title': 'Claude para programadores', 'excerpt': 'Asistentes de código con IA',
+     'tags': ['claude', 'ia', 'desarrollo'], 'categories': ['ia']},
+    {'title': 'Primeros pasos con Solana', 'excerpt': 'Programas en Rust sobre Solana',
+     'tags': ['solana', 'blockchain', 'Blockchain'], 'categories': ['blockchain']},
+]
+
+def setup_function(function):
+    local_metadata._model.clear()
+
+def teardown_function(function):
+    local_metadata._model.clear()
+
+def build(monkeypatch):
+    monkeypatch.setattr(post_index, 'all_posts', lambda: POSTS)
+    return local_metadata.build_model()
+
+def test_adjectives_and_generic_words_are_not_tags(monkeypatch):
+    build(monkeypatch)
+
+    tags = local_metadata.infer_tags('Herramientas modernas para programar con Claude Code', 'ia')
+
+    assert 'claude' in tags
+    for word in ('modernas', 'herramientas', 'programar', 'code'):
+        assert word not in tags
+
+def test_participles_are_not_tags(monkeypatch):
+    build(monkeypatch)
+
+    tags = local_metadata.infer_tags('Aplicaciones descentralizadas explicadas con Solana', 'blockchain')
+
+    assert 'solana' in tags
+    assert 'descentralizadas' not in tags
+    assert 'explicadas' not in tags
+
+def test_plural_forms_collapse_into_the_blog_tag(monkeypatch):
+    build(monkeypatch)
+
+    tags = local_metadata.infer_tags('Un rollup frente a otros rollups', 'blockchain')
+
+    assert 'rollups' in tags
+    assert 'rollup' not in tags
+
+def test_case_variants_use_the_slug_spelling(monkeypatch):
+    model = build(monkeypatch)
+
+    assert model['tag_keys'][local_metadata.tag_key('Blockchain')] == 'blockchain'
+    tags = local_metadata.infer_tags('Solana para principiantes', 'blockchain')
+    assert 'Blockchain' not in tags
+    assert len({local_metadata.tag_key(tag) for tag in tags}) == len(tags)
+
+def test_fit_length_cuts_at_a_word_boundary():
+    text = 'Android Studio y las nuevas herramientas de desarrollo con IA y mucho más'
+
+    cut = local_metadata.fit_length(text, 60)
+
+    assert cut == 'Android Studio y las nuevas herramientas de desarrollo…'
+    assert len(cut) <= 60
+
+def test_fit_length_keeps_a_word_that_ends_at_the_limit():
+    assert local_metadata.fit_length('Bitcoin Ethereum Solana', 17) == 'Bitcoin Ethereum…'
+
+def test_long_title_is_cut_before_the_ellipsis():
+    title = local_metadata.enforce_title(
+        'aplicaciones descentralizadas modernas con Solana y Rust y mucho más texto', 'blockchain')
+
+    assert title == 'Aplicaciones descentralizadas modernas con Solana y Rust…'
+    assert len(title) <= local_metadata.TITLE_MAX
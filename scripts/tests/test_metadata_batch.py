@@ -0,0 +1,39 @@
+import json
+from types import SimpleNamespace
+
+from postgen import generate, llm_cache
+
+ITEMS = [('Qué es Bitcoin', 'blockchain'), ('Redes neuronales', 'ia'), ('Docker paso a paso', 'tutoriales')]
+
+def completion(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+def metadata_json(*ids):
+    return json.dumps([{'id': i, 'title': f'Título {i}', 'excerpt': 'x', 'tags': ['a', 'b']} for i in ids])
+
+def fake_groq(responses, prompts):
+    def groq_completion(client, **kwargs):
+        prompts.append(kwargs['messages'][0]['content'])
+        return completion(responses.pop(0))
+    return groq_completion
+
+def test_retry_reaches_the_api_and_keeps_partial_results(cache_dir, route_stats, monkeypatch):
+    prompts = []
+    # Primera respuesta: solo se lee el tema 1; el reintento pide los otros dos
+    monkeypatch.setattr(generate, 'groq_completion', fake_groq([metadata_json(1), metadata_json(1, 2)], prompts))
+
+    results = generate.generate_metadata_batch(None, ITEMS)
+
+    assert [item['title'] for item in results] == ['Título 1', 'Título 1', 'Título 2']
+    assert len(prompts) == 2
+    # La respuesta parcial no se cacheó; la completa del reintento sí
+    assert len(list(cache_dir.glob('*/*.json'))) == 1
+
+def test_retry_of_the_same_chunk_is_not_served_from_cache(cache_dir, route_stats, monkeypatch):
+    prompts = []
+    monkeypatch.setattr(generate, 'groq_completion', fake_groq(['[]', '[]', metadata_json(1, 2, 3)], prompts))
+
+    results = generate.generate_metadata_batch(None, ITEMS)
+
+    assert len(prompts) == 3 and len(set(prompts)) == 1
+    assert [item['title'] for item in results] == ['Título 1', 'Título 2', 'Título 3']
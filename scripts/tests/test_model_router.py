@@ -0,0 +1,37 @@
+import pytest
+
+from postgen import llm_cache, model_router
+
+METADATA_PROMPT = """Genera:
+1. Un título SEO-friendly (máximo 60 caracteres, atractivo y claro)
+2. Un excerpt de 1-2 líneas (máximo 160 caracteres)
+3. 4-6 tags relevantes"""
+
+def test_word_range_sets_max_tokens():
+    tokens = model_router.max_tokens_for('Tener entre 800-1200 palabras', 4000)
+    assert tokens == pytest.approx(1200 * model_router.TOKENS_PER_WORD * 1.15 + 100, abs=1)
+
+def test_char_limits_never_go_below_the_callers_default():
+    assert model_router.max_tokens_for(METADATA_PROMPT, 300) == 300
+    # Por lotes la estimación por elemento sí puede superar el default
+    assert model_router.max_tokens_for(METADATA_PROMPT, 300, items=15) > 300
+
+def test_prompt_without_length_uses_default():
+    assert model_router.max_tokens_for('Escribe una frase', 120) == 120
+
+def test_repeated_failures_demote_a_model(route_stats):
+    for _ in range(model_router.MIN_SAMPLES):
+        model_router.record('metadata', model_router.SMALL_MODEL, 0.2, False)
+        model_router.record('metadata', model_router.LARGE_MODEL, 1.5, True)
+    assert model_router.ranked_models('metadata') == [model_router.LARGE_MODEL, model_router.SMALL_MODEL]
+
+def test_exploration_never_discards_a_cached_response(cache_dir, route_stats, monkeypatch):
+    monkeypatch.setattr(model_router, 'EXPLORE_RATE', 1.0)
+    preferred = model_router.ranked_models('metadata')[0]
+    _, max_tokens = model_router.plan('metadata', METADATA_PROMPT, 300)
+    assert model_router.plan('metadata', METADATA_PROMPT, 300)[0] != preferred
+
+    llm_cache.put('groq', preferred, METADATA_PROMPT, 0.7, max_tokens, '{"title": "x"}')
+    assert model_router.plan('metadata', METADATA_PROMPT, 300) == (preferred, max_tokens)
+    # Otra temperatura es otra clave: ahí sí se explora
+    assert model_router.plan('metadata', METADATA_PROMPT, 300, temperature=0.5)[0] != preferred
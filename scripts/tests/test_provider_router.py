@@ -0,0 +1,79 @@
+import json
+import threading
+import time
+
+import pytest
+
+from postgen import http_pool, provider_router
+
+ARTICLE = 'palabra ' * 200
+
+@pytest.fixture(autouse=True)
+def latency_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(provider_router, 'LATENCY_FILE', tmp_path / 'provider_latency.json')
+    monkeypatch.setattr(provider_router, '_hedge_slots', threading.BoundedSemaphore(2))
+    return tmp_path / 'provider_latency.json'
+
+def recorded(latency_file):
+    with open(latency_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def test_loser_latency_is_recorded_too(latency_file):
+    loser_done = threading.Event()
+
+    def slow():
+        time.sleep(0.3)
+        loser_done.set()
+        return ARTICLE
+
+    name, text = provider_router.hedged_call([('lento', slow), ('rapido', lambda: ARTICLE)], hedge_delay=0.05)
+    assert name == 'rapido'
+    loser_done.wait(2)
+    time.sleep(0.05)
+    samples = recorded(latency_file)
+    assert samples['lento'][0] >= 0.3
+    assert 'rapido' in samples
+
+def test_loser_requests_not_yet_sent_are_cancelled():
+    outcome = []
+
+    def slow_then_continue():
+        time.sleep(0.2)
+        try:
+            # Una continuación o un reintento del perdedor: no debe salir a la red
+            http_pool.request('GET', 'http://127.0.0.1:9/')
+        except Exception as e:
+            outcome.append(type(e))
+            raise
+        return ARTICLE
+
+    name, _ = provider_router.hedged_call([('lento', slow_then_continue), ('rapido', lambda: ARTICLE)],
+                                          hedge_delay=0.05)
+    assert name == 'rapido'
+    time.sleep(0.4)
+    assert outcome == [http_pool.Cancelled]
+
+def test_no_hedge_without_a_free_slot(monkeypatch):
+    monkeypatch.setattr(provider_router, '_hedge_slots', threading.BoundedSemaphore(1))
+    provider_router._hedge_slots.acquire()
+    called = []
+
+    def second():
+        called.append('segundo')
+        return ARTICLE
+
+    def slow():
+        time.sleep(0.2)
+        return ARTICLE
+
+    assert provider_router.hedged_call([('primero', slow), ('segundo', second)], hedge_delay=0.05)[0] == 'primero'
+    assert called == []
+
+def test_failed_provider_falls_through_without_a_slot(monkeypatch):
+    monkeypatch.setattr(provider_router, '_hedge_slots', threading.BoundedSemaphore(1))
+    provider_router._hedge_slots.acquire()
+
+    def broken():
+        raise RuntimeError('caído')
+
+    assert provider_router.hedged_call([('roto', broken), ('bueno', lambda: ARTICLE)], hedge_delay=5)[0] == 'bueno'
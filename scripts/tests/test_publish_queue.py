@@ -0,0 +1,109 @@
+import subprocess
+
+import pytest
+
+from postgen import common, git_probe, job_journal, publish_queue
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True, check=True).stdout.strip()
+
+@pytest.fixture
+def repo(tmp_path, posts_dir, monkeypatch):
+    """Repositorio con _posts/ y un remote origin (bare) en directorios temporales."""
+    root = posts_dir.parent
+    git(tmp_path, 'init', '-q', '--bare', '-b', 'main', 'origin.git')
+    git(root, 'init', '-q', '-b', 'main')
+    git(root, 'config', 'user.name', 'Test')
+    git(root, 'config', 'user.email', 'test@example.com')
+    git(root, 'remote', 'add', 'origin', str(tmp_path / 'origin.git'))
+    (root / 'README.md').write_text('blog\n', encoding='utf-8')
+    git(root, 'add', 'README.md')
+    git(root, 'commit', '-q', '-m', 'init')
+    for module in (common, git_probe, publish_queue):
+        monkeypatch.setattr(module, 'PROJECT_ROOT', root)
+    return root
+
+def write_post(posts_dir, filename):
+    (posts_dir / filename).write_text('---\ntitle: "Post"\n---\n', encoding='utf-8')
+
+def test_enqueue_again_updates_the_entry_and_keeps_its_age(posts_dir):
+    publish_queue.enqueue('a.md', 'Primero')
+    queued_at = publish_queue.load_queue()['entries'][0]['queued_at']
+
+    assert publish_queue.enqueue('a.md', 'Primero (corregido)') == 1
+
+    entry = publish_queue.load_queue()['entries'][0]
+    assert (entry['title'], entry['queued_at']) == ('Primero (corregido)', queued_at)
+
+def test_flush_reason_thresholds(posts_dir, monkeypatch):
+    monkeypatch.setattr(publish_queue, 'MAX_POSTS', 2)
+    monkeypatch.setattr(publish_queue, 'MAX_AGE_HOURS', 1)
+    publish_queue.enqueue('a.md', 'A')
+    queue = publish_queue.load_queue()
+    now = queue['entries'][0]['queued_at']
+
+    assert publish_queue.flush_reason(queue, now) is None
+    assert 'h en cola' in publish_queue.flush_reason(queue, now + 3601)
+
+    publish_queue.enqueue('b.md', 'B')
+    assert 'posts en cola' in publish_queue.flush_reason(publish_queue.load_queue(), now)
+
+    queue = {'entries': [], 'unpushed': True}
+    assert publish_queue.flush_reason(queue, now) == "hay un commit pendiente de subir"
+
+def test_flush_publishes_the_batch_in_one_commit_and_one_push(repo, posts_dir):
+    for filename in ('2025-01-01-a.md', '2025-01-02-b.md'):
+        write_post(posts_dir, filename)
+        entry = job_journal.start('generate', filename, 'ia', '2025-01-01', '2025-01-01', identifier=filename)
+        job_journal.complete(entry, 'written', filename)
+        publish_queue.enqueue(filename, filename)
+
+    assert publish_queue.flush()
+
+    assert git(repo, 'rev-list', '--count', 'HEAD') == '2'
+    assert git(repo, 'rev-parse', 'HEAD') == git(repo, 'rev-parse', 'origin/main')
+    assert git(repo, 'log', '-1', '--format=%s') == 'Add: 2 nuevos artículos'
+    assert publish_queue.load_queue() == {'entries': [], 'unpushed': False}
+    assert all(job_journal.is_finished(job) for job in job_journal.all_jobs())
+
+def test_failed_push_is_retried_by_the_next_flush(repo, posts_dir):
+    write_post(posts_dir, '2025-01-01-a.md')
+    publish_queue.enqueue('2025-01-01-a.md', 'A')
+    git(repo, 'remote', 'set-url', 'origin', str(repo / 'no-existe.git'))
+
+    assert not publish_queue.flush()
+    assert publish_queue.load_queue() == {'entries': [], 'unpushed': True}
+
+    git(repo, 'remote', 'set-url', 'origin', str(repo / 'origin.git'))
+    assert publish_queue.flush()
+    assert git(repo, 'rev-parse', 'HEAD') == git(repo, 'rev-parse', 'origin/main')
+    assert git(repo, 'rev-list', '--count', 'HEAD') == '2'
+
+def test_deleted_post_is_dropped_from_the_queue(repo, posts_dir):
+    publish_queue.enqueue('2025-01-01-borrado.md', 'Borrado')
+
+    assert publish_queue.flush()
+    assert publish_queue.load_queue()['entries'] == []
+    assert git(repo, 'rev-list', '--count', 'HEAD') == '1'
+
+def test_one_shot_submit_pushes_right_away(repo, posts_dir):
+    write_post(posts_dir, '2025-01-01-a.md')
+
+    assert publish_queue.submit('2025-01-01-a.md', 'A') == 'pushed'
+    assert git(repo, 'rev-parse', 'HEAD') == git(repo, 'rev-parse', 'origin/main')
+
+def test_batched_submit_reports_queued_until_a_threshold(repo, posts_dir, monkeypatch):
+    monkeypatch.setattr(publish_queue, 'MAX_POSTS', 2)
+    for filename in ('2025-01-01-a.md', '2025-01-02-b.md'):
+        write_post(posts_dir, filename)
+
+    assert publish_queue.submit('2025-01-01-a.md', 'A', batch=True) == 'queued'
+    assert git(repo, 'rev-list', '--count', 'HEAD') == '1'
+    assert publish_queue.submit('2025-01-02-b.md', 'B', batch=True) == 'pushed'
+    assert git(repo, 'rev-list', '--count', 'origin/main') == '2'
+
+def test_failed_submit_returns_false(repo, posts_dir):
+    write_post(posts_dir, '2025-01-01-a.md')
+    git(repo, 'remote', 'set-url', 'origin', str(repo / 'no-existe.git'))
+
+    assert publish_queue.submit('2025-01-01-a.md', 'A') is False
@@ -0,0 +1,107 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from postgen import generate, rate_limit
+
+@pytest.fixture(autouse=True)
+def fresh_limiter(tmp_path, monkeypatch):
+    """Buckets llenos y sin pausas; se rellenan rápido para que los tests no esperen."""
+    monkeypatch.setattr(rate_limit, 'DB_PATH', tmp_path / 'rate_limit.sqlite')
+    monkeypatch.setattr(rate_limit, '_buckets', {
+        'requests': {'capacity': 30, 'level': 30.0, 'rate': 100.0},
+        'tokens': {'capacity': 12000, 'level': 12000.0, 'rate': 100000.0}
+    })
+    monkeypatch.setattr(rate_limit, '_state', {'updated': time.time(), 'paused_until': 0.0,
+                                               'daily_remaining': None})
+    monkeypatch.setattr(rate_limit, 'MAX_BACKOFF', 0.01)
+
+class RateLimited(Exception):
+    status_code = 429
+
+    def __init__(self, headers=None):
+        super().__init__('429 Too Many Requests')
+        self.response = SimpleNamespace(headers=headers or {'retry-after': '0.01'})
+
+def test_buckets_refill_with_elapsed_time():
+    rate_limit._buckets['requests']['level'] = 0.0
+    rate_limit._buckets['tokens']['level'] = 0.0
+    rate_limit._refill(rate_limit._state['updated'] + 0.02)
+    assert rate_limit._buckets['requests']['level'] == pytest.approx(2.0)
+    assert rate_limit._buckets['tokens']['level'] == pytest.approx(2000.0)
+    # Nunca por encima de la capacidad
+    rate_limit._refill(rate_limit._state['updated'] + 3600)
+    assert rate_limit._buckets['tokens']['level'] == 12000
+
+def test_acquire_takes_one_request_and_the_estimated_tokens():
+    rate_limit.acquire(1000)
+    assert rate_limit._buckets['requests']['level'] == pytest.approx(29, abs=0.1)
+    assert rate_limit._buckets['tokens']['level'] == pytest.approx(11000, abs=10)
+
+def test_budget_is_shared_between_processes():
+    rate_limit.acquire(6000)
+    # Otro proceso arranca con los buckets llenos en memoria, pero manda lo guardado
+    rate_limit._buckets['requests']['level'] = 30.0
+    rate_limit._buckets['tokens']['level'] = 12000.0
+
+    with rate_limit._shared():
+        assert rate_limit._buckets['requests']['level'] == pytest.approx(29, abs=0.1)
+        assert rate_limit._buckets['tokens']['level'] == pytest.approx(6000, abs=10)
+
+def test_pause_from_another_process_is_respected():
+    with rate_limit._shared():
+        rate_limit._pause(3600)
+    rate_limit._state['paused_until'] = 0.0
+
+    with rate_limit._shared():
+        assert rate_limit._state['paused_until'] > time.time() + 3500
+
+def test_daily_request_headers_do_not_drain_the_per_minute_bucket():
+    rate_limit.update_from_headers({
+        'x-ratelimit-limit-requests': '14400',
+        'x-ratelimit-remaining-requests': '5',
+        'x-ratelimit-reset-requests': '2m59.56s',
+        'x-ratelimit-limit-tokens': '6000',
+        'x-ratelimit-remaining-tokens': '1500',
+        'x-ratelimit-reset-tokens': '7.66s'
+    })
+    assert rate_limit._buckets['requests']['level'] == pytest.approx(30, abs=0.1)
+    assert rate_limit._buckets['tokens']['capacity'] == 6000
+    assert rate_limit._buckets['tokens']['level'] == 1500
+    assert rate_limit._state['daily_remaining'] == 5
+    assert rate_limit._state['paused_until'] == 0.0
+
+def test_exhausted_daily_quota_pauses_until_reset():
+    rate_limit.update_from_headers({'x-ratelimit-remaining-requests': '0',
+                                    'x-ratelimit-reset-requests': '1h'})
+    assert rate_limit._state['paused_until'] > time.time() + 3500
+
+def test_429_pauses_and_retries():
+    calls = []
+
+    def request():
+        calls.append(time.monotonic())
+        if len(calls) < 3:
+            raise RateLimited()
+        return 'ok'
+
+    assert rate_limit.limited_call(request, 100) == 'ok'
+    assert len(calls) == 3
+    assert rate_limit._state['paused_until'] > 0
+
+def test_backoff_ignores_the_daily_reset_while_quota_remains():
+    delay = rate_limit.backoff({'x-ratelimit-remaining-requests': '900',
+                                'x-ratelimit-reset-requests': '3h'}, attempt=0)
+    assert delay < 2
+
+def test_exhausted_retries_reach_the_caller_instead_of_placeholder_content(cache_dir, route_stats, monkeypatch):
+    monkeypatch.setattr(rate_limit, 'MAX_ATTEMPTS', 2)
+
+    def create(**kwargs):
+        raise RateLimited()
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        with_raw_response=SimpleNamespace(create=create))))
+    with pytest.raises(RateLimited):
+        generate.generate_article_content(client, 'Qué es un rollup', 'blockchain')
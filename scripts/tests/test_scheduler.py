@@ -0,0 +1,115 @@
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from postgen import generate, job_journal, post_index, publish_queue, scheduler, topic_queue
+
+NOW = datetime(2026, 10, 20, 12, 0)
+
+@pytest.fixture(autouse=True)
+def schedule(tmp_path, posts_dir, monkeypatch):
+    """Cola, borradores y _posts/ temporales; los posts publicados a mano salen de `published`."""
+    published = {}
+    monkeypatch.setattr(topic_queue, 'DB_PATH', tmp_path / 'topic_queue.sqlite')
+    monkeypatch.setattr(topic_queue, '_local', threading.local())
+    monkeypatch.setattr(scheduler, 'DRAFTS_DIR', tmp_path / 'drafts')
+    monkeypatch.setattr(scheduler, 'POSTS_DIR', posts_dir)
+    monkeypatch.setattr(scheduler, 'WINDOW', '08:00-18:00')
+    monkeypatch.setattr(scheduler, 'CATEGORY_QUOTAS', {})
+    monkeypatch.setattr(generate, 'DAILY_LIMIT', 5)
+    monkeypatch.setattr(post_index, 'posts_on', lambda day: published.get(day, []))
+    monkeypatch.setattr(publish_queue, 'flush', lambda push=True: True)
+    return published
+
+def ready_topic(topic, publish_at, draft, title='Título del borrador'):
+    topic_queue.add(topic, 'blockchain')
+    row = topic_queue.claim_next(lambda: (publish_at, topic_queue.list_topics('pending')[0]), 'w', ahead=10)
+    scheduler.DRAFTS_DIR.mkdir(parents=True, exist_ok=True)
+    (scheduler.DRAFTS_DIR / draft).write_text(f'---\ntitle: "{title}"\ndate: {publish_at}\n---\n',
+                                               encoding='utf-8')
+    topic_queue.mark_ready(row['id'], draft, 'w')
+    return row
+
+def test_publish_without_journal_reads_the_title_from_the_draft(posts_dir):
+    row = ready_topic('Qué es un rollup', '2026-10-20 10:00:00', '2026-10-20-que-es-un-rollup.md')
+    assert job_journal.load(row['job_id']) is None
+
+    assert scheduler.publish_due(NOW) == 1
+
+    assert (posts_dir / '2026-10-20-que-es-un-rollup.md').exists()
+    assert publish_queue.load_queue()['entries'][0]['title'] == 'Título del borrador'
+    assert topic_queue.get(row['id'])['status'] == 'published'
+
+def post(category='blockchain'):
+    return {'path': '_posts/2026-10-20-a-mano.md', 'categories': [category]}
+
+def test_day_slots_spread_the_daily_limit_over_the_window():
+    slots = scheduler.day_slots(date(2026, 10, 20))
+
+    assert [f'{slot:%H:%M}' for slot in slots] == ['08:00', '10:00', '12:00', '14:00', '16:00']
+
+def test_free_slot_skips_past_and_taken_slots():
+    assert scheduler.free_slot(NOW, 'blockchain') == datetime(2026, 10, 20, 14, 0)
+
+    ready_topic('Qué es un rollup', '2026-10-20 14:00:00', '2026-10-20-que-es-un-rollup.md')
+    assert scheduler.free_slot(NOW, 'blockchain') == datetime(2026, 10, 20, 16, 0)
+
+def test_free_slot_counts_published_and_scheduled_posts(schedule):
+    schedule['2026-10-20'] = [post(), post(), post(), post()]
+    ready_topic('Qué es un rollup', '2026-10-20 16:00:00', '2026-10-20-que-es-un-rollup.md')
+
+    assert scheduler.free_slot(NOW, 'blockchain') == datetime(2026, 10, 21, 8, 0)
+
+def test_free_slot_respects_the_category_quota(schedule, monkeypatch):
+    monkeypatch.setattr(scheduler, 'CATEGORY_QUOTAS', {'blockchain': 1})
+    schedule['2026-10-20'] = [post('blockchain')]
+
+    assert scheduler.free_slot(NOW, 'blockchain') == datetime(2026, 10, 21, 8, 0)
+    assert scheduler.free_slot(NOW, 'ia') == datetime(2026, 10, 20, 14, 0)
+
+def test_free_slot_gives_up_after_max_days_ahead(schedule):
+    for offset in range(scheduler.MAX_DAYS_AHEAD):
+        schedule[(NOW.date() + timedelta(days=offset)).isoformat()] = [post()] * 5
+
+    assert scheduler.free_slot(NOW, 'blockchain') is None
+
+def test_plan_next_prefers_the_closest_slot_then_the_priority(schedule, monkeypatch):
+    topic_queue.add('Qué es un rollup', 'blockchain')
+    topic_queue.add('Qué es un transformer', 'ia', priority=5)
+
+    slot, row = scheduler.plan_next(NOW)
+    assert (slot, row['topic']) == (datetime(2026, 10, 20, 14, 0), 'Qué es un transformer')
+
+    # Sin cuota hoy para ia, el hueco de hoy es para blockchain aunque tenga menos prioridad
+    monkeypatch.setattr(scheduler, 'CATEGORY_QUOTAS', {'ia': 1})
+    schedule['2026-10-20'] = [post('ia')]
+    slot, row = scheduler.plan_next(NOW)
+    assert (slot, row['topic']) == (datetime(2026, 10, 20, 14, 0), 'Qué es un rollup')
+
+def test_plan_next_without_pending_topics():
+    assert scheduler.plan_next(NOW) is None
+
+def test_stale_draft_is_postponed_to_the_next_free_slot():
+    row = ready_topic('Qué es un rollup', '2026-10-19 10:00:00', '2026-10-19-titulo-del-borrador.md')
+
+    assert scheduler.publish_due(NOW) == 0
+
+    moved = topic_queue.get(row['id'])
+    assert (moved['status'], moved['publish_at']) == ('ready', '2026-10-20 14:00:00')
+    assert moved['draft'].startswith('2026-10-20-')
+    assert not (scheduler.DRAFTS_DIR / '2026-10-19-titulo-del-borrador.md').exists()
+    text = (scheduler.DRAFTS_DIR / moved['draft']).read_text(encoding='utf-8')
+    assert 'date: 2026-10-20 14:00:00 -0500\n' in text
+    assert 'title: "Título del borrador"' in text
+
+def test_draft_is_postponed_when_the_day_fills_with_manual_posts(schedule, posts_dir):
+    row = ready_topic('Qué es un rollup', '2026-10-20 10:00:00', '2026-10-20-titulo-del-borrador.md')
+    schedule['2026-10-20'] = [post()] * 5
+
+    assert scheduler.publish_due(NOW) == 0
+
+    moved = topic_queue.get(row['id'])
+    assert moved['publish_at'] == '2026-10-21 08:00:00'
+    assert (scheduler.DRAFTS_DIR / moved['draft']).exists()
+    assert not list(posts_dir.iterdir())
@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+import pytest
+
+from postgen import generate, llm_cache, model_router
+
+TOPIC = 'Qué es un rollup'
+
+def chunk(content=None, finish_reason=None):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content),
+                                                    finish_reason=finish_reason)])
+
+def stream(words, finish_reason='stop', fail=False):
+    for i in range(words):
+        yield chunk(f'palabra{i} ')
+    if fail:
+        raise ConnectionError('conexión cortada')
+    yield chunk(finish_reason=finish_reason)
+
+@pytest.fixture
+def streams(cache_dir, route_stats, monkeypatch):
+    """Cola de streams falsos que devuelve groq_completion; apunta los mensajes de cada llamada."""
+    pending = []
+    calls = []
+
+    def groq_completion(client, **kwargs):
+        calls.append(kwargs['messages'])
+        return pending.pop(0)
+
+    monkeypatch.setattr(generate, 'groq_completion', groq_completion)
+    return SimpleNamespace(pending=pending, calls=calls)
+
+def cache_args():
+    prompt = generate.PROMPT_TEMPLATES['blockchain'].format(topic=TOPIC)
+    model, max_tokens = model_router.plan('content', prompt, 4000)
+    return 'groq', model, prompt, 0.7, max_tokens
+
+def cached_article():
+    return llm_cache.get(*cache_args())
+
+def test_interrupted_stream_resumes_from_the_part_file(streams, tmp_path):
+    partial = str(tmp_path / '.2025-12-01-que-es-un-rollup.md.part')
+    streams.pending.append(stream(100, fail=True))
+
+    with pytest.raises(ConnectionError):
+        generate.stream_article_content(None, TOPIC, 'blockchain', partial)
+    with open(partial, encoding='utf-8') as f:
+        assert len(f.read().split()) == 100
+
+    streams.pending.append(stream(100))
+    content = generate.stream_article_content(None, TOPIC, 'blockchain', partial)
+
+    assert len(content.split()) == 200
+    # El segundo pase pide continuar lo ya escrito, no el artículo desde cero
+    assert 'palabra99' in ''.join(message['content'] for message in streams.calls[1])
+    # Un artículo hecho a trozos de dos ejecuciones no se guarda en la caché
+    assert cached_article() is None
+
+def test_complete_stream_is_cached(streams, tmp_path):
+    streams.pending.append(stream(200))
+
+    content = generate.stream_article_content(None, TOPIC, 'blockchain', str(tmp_path / 'post.part'))
+
+    assert cached_article() == content
+
+def test_invalid_stream_is_not_cached(streams, tmp_path):
+    streams.pending.append(stream(20))
+
+    content = generate.stream_article_content(None, TOPIC, 'blockchain', str(tmp_path / 'post.part'))
+
+    assert len(content.split()) == 20
+    assert cached_article() is None
+
+def test_invalid_cached_article_is_not_replayed(streams, tmp_path):
+    llm_cache.put(*cache_args(), 'cortado a medi')
+    streams.pending.append(stream(200))
+
+    content = generate.stream_article_content(None, TOPIC, 'blockchain', str(tmp_path / 'post.part'))
+
+    assert len(streams.calls) == 1
+    assert len(content.split()) == 200
+
+def test_stream_cut_by_max_tokens_asks_for_a_continuation(streams, tmp_path):
+    streams.pending += [stream(100, finish_reason='length'), stream(100)]
+
+    content = generate.stream_article_content(None, TOPIC, 'blockchain', str(tmp_path / 'post.part'))
+
+    assert len(streams.calls) == 2
+    assert len(content.split()) == 200
@@ -0,0 +1,58 @@
+import pytest
+
+from postgen import topic_dedup
+
+TITLES = [
+    'Bitcoin',
+    'El Salvador adoptó Bitcoin como moneda oficial: 2 años después es un desastre total',
+    'Machine Learning',
+    'Hugging Face',
+    'Redes Neuronales',
+    'Coinbase Earn: Gana cripto gratis viendo videos (Guía 2025)',
+]
+
+@pytest.fixture(autouse=True)
+def posts(monkeypatch):
+    """Firmas en memoria de unos títulos reales del blog, sin tocar el índice."""
+    monkeypatch.setattr(topic_dedup, '_store', {'entries': {}, 'buckets': {}, 'loaded': True})
+    for i, title in enumerate(TITLES):
+        topic_dedup.add_topic(f"post:{i}", title)
+
+def best(topic):
+    matches = topic_dedup.query(topic)
+    return matches[0][2] if matches else None, matches[0][0] if matches else 0.0
+
+def test_short_topic_is_not_a_duplicate_of_every_post_that_mentions_it():
+    scores = {title: score for score, _, title in topic_dedup.query('Qué es Bitcoin', limit=10)}
+    assert scores.get(TITLES[1], 0.0) < topic_dedup.WARN_THRESHOLD
+
+def test_one_term_topic_can_warn_but_not_be_refused(capsys):
+    assert best('Qué es Bitcoin') == ('Bitcoin', 1.0)
+    assert topic_dedup.check_topic('Qué es Bitcoin')
+    assert 'se parece' in capsys.readouterr().out
+
+def test_topic_with_an_extra_subject_is_not_flagged(capsys):
+    assert topic_dedup.check_topic('Machine learning en la cocina')
+    assert capsys.readouterr().out == ''
+
+def test_true_duplicates_are_refused():
+    assert best('Guía completa de Hugging Face') == ('Hugging Face', 1.0)
+    assert not topic_dedup.check_topic('Guía completa de Hugging Face')
+    assert not topic_dedup.check_topic('Las redes neuronales')
+    assert topic_dedup.check_topic('Las redes neuronales', allow_duplicate=True)
+
+def test_reworded_duplicate_warns(capsys):
+    assert topic_dedup.check_topic('Coinbase Earn: gana cripto gratis con videos')
+    assert 'se parece' in capsys.readouterr().out
+
+def test_lsh_does_not_make_every_post_a_candidate():
+    candidates = set()
+    for band in topic_dedup._bands(topic_dedup.signature(topic_dedup.tokenize('Redes neuronales'))):
+        candidates |= topic_dedup._store['buckets'].get(band, set())
+    assert candidates == {'post:4'}
+
+def test_batch_topics_are_compared_with_each_other():
+    topic_dedup.add_topic('batch:0', 'Staking de Ethereum con Lido')
+    assert not topic_dedup.check_topic('Staking en Ethereum con Lido')
+    topic_dedup.forget('batch:')
+    assert topic_dedup.check_topic('Staking en Ethereum con Lido')
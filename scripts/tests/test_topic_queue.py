@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from postgen import scheduler, topic_queue
+
+@pytest.fixture(autouse=True)
+def queue_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(topic_queue, 'DB_PATH', tmp_path / 'topic_queue.sqlite')
+    monkeypatch.setattr(topic_queue, '_local', threading.local())
+
+def plan_first_pending():
+    rows = topic_queue.list_topics('pending')
+    return ('2026-10-20 09:00:00', rows[0]) if rows else None
+
+def claim(worker):
+    return topic_queue.claim_next(plan_first_pending, worker, ahead=5)
+
+def expire_claims():
+    conn = topic_queue.connect()
+    conn.execute("UPDATE topics SET claimed_at = ?", (time.time() - topic_queue.CLAIM_TTL - 1,))
+    conn.commit()
+
+def test_a_topic_is_claimed_once():
+    topic_queue.add('Qué es un rollup', 'blockchain')
+    row = claim('a')
+    assert row['status'] == 'generating' and row['claimed_by'] == 'a'
+    assert claim('b') is None
+
+def test_expired_claim_is_reclaimed_and_the_stale_worker_cannot_overwrite_it():
+    topic_id = topic_queue.add('Qué es un rollup', 'blockchain')
+    claim('a')
+    expire_claims()
+    assert topic_queue.recover_stale() == 1
+
+    assert claim('b')['claimed_by'] == 'b'
+    assert not topic_queue.heartbeat(topic_id, 'a')
+    assert not topic_queue.mark_ready(topic_id, 'borrador-a.md', 'a')
+    assert not topic_queue.release(topic_id, 'error de a', 'a')
+    assert topic_queue.get(topic_id)['status'] == 'generating'
+
+    assert topic_queue.mark_ready(topic_id, 'borrador-b.md', 'b')
+    row = topic_queue.get(topic_id)
+    assert (row['status'], row['draft'], row['attempts']) == ('ready', 'borrador-b.md', 0)
+
+def test_heartbeat_keeps_a_live_claim(monkeypatch):
+    topic_id = topic_queue.add('Qué es un rollup', 'blockchain')
+    claim('a')
+    expire_claims()
+    assert topic_queue.heartbeat(topic_id, 'a')
+    assert topic_queue.recover_stale() == 0
+
+def test_keep_claim_beats_while_generating(monkeypatch):
+    monkeypatch.setattr(topic_queue, 'CLAIM_TTL', 0.15)
+    topic_id = topic_queue.add('Qué es un rollup', 'blockchain')
+    claim('a')
+    with scheduler.keep_claim(topic_id, 'a'):
+        time.sleep(0.4)
+        assert topic_queue.recover_stale() == 0
+    time.sleep(0.2)
+    assert topic_queue.recover_stale() == 1
+
+def test_release_counts_attempts_until_failed():
+    topic_id = topic_queue.add('Qué es un rollup', 'blockchain')
+    for _ in range(topic_queue.MAX_ATTEMPTS):
+        claim('a')
+        assert topic_queue.release(topic_id, 'falló', 'a')
+    assert topic_queue.get(topic_id)['status'] == 'failed'
+    assert claim('a') is None